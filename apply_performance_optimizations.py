@@ -87,6 +87,10 @@ def main():
         "idx_photo_metadata_project_date",
         "idx_video_metadata_project_folder",
         "idx_video_metadata_project_date",
+        "idx_video_metadata_project_codec_lower",
+        "idx_video_metadata_project_size",
+        "idx_video_metadata_project_height",
+        "idx_video_metadata_project_duration",
         "idx_project_images_project_branch",
         "idx_photo_folders_project_parent",
     ]
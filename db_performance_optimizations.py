@@ -214,6 +214,20 @@ ON video_metadata(project_id, folder_id);
 CREATE INDEX IF NOT EXISTS idx_video_metadata_project_date
 ON video_metadata(project_id, created_year, created_date);
 
+-- Compound indexes for video_metadata filtering by project + bucket column
+-- Used in: sidebar video filters (codec / size / resolution / duration)
+-- Codecs are matched with LOWER(codec), so that index is on the expression;
+-- the plain (project_id, codec) index it replaces was never used
+DROP INDEX IF EXISTS idx_video_metadata_project_codec;
+CREATE INDEX IF NOT EXISTS idx_video_metadata_project_codec_lower
+ON video_metadata(project_id, LOWER(codec));
+CREATE INDEX IF NOT EXISTS idx_video_metadata_project_size
+ON video_metadata(project_id, size_kb);
+CREATE INDEX IF NOT EXISTS idx_video_metadata_project_height
+ON video_metadata(project_id, height);
+CREATE INDEX IF NOT EXISTS idx_video_metadata_project_duration
+ON video_metadata(project_id, duration_seconds);
+
 -- Compound index for project_images filtering
 -- Used in: branch queries, photo assignments
 CREATE INDEX IF NOT EXISTS idx_project_images_project_branch
@@ -3,47 +3,10 @@
 # Added centralized logging initialization
 
 import sys
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt, QTimer
-from main_window_qt import MainWindow
 
-# ✅ Logging setup (must be first!)
-from logging_config import setup_logging, get_logger, disable_external_logging
-from settings_manager_qt import SettingsManager
-
-# Initialize settings to get log level
-settings = SettingsManager()
-log_level = settings.get("log_level", "INFO")
-log_to_console = settings.get("log_to_console", True)
-log_colored = settings.get("log_colored_output", True)
-
-# Setup logging before any other imports that might log
-setup_logging(
-    log_level=log_level,
-    console=log_to_console,
-    use_colors=log_colored
-)
-disable_external_logging()  # Reduce Qt/PIL noise
-
-logger = get_logger(__name__)
-
-# ✅ Other imports
-from splash_qt import SplashScreen, StartupWorker
-
-# ✅ Global exception hook to catch unhandled exceptions
-import traceback
-
-def exception_hook(exctype, value, tb):
-    """Global exception handler to catch and log unhandled exceptions"""
-    print("=" * 80)
-    print("UNHANDLED EXCEPTION CAUGHT:")
-    print("=" * 80)
-    traceback.print_exception(exctype, value, tb)
-    logger.error("Unhandled exception", exc_info=(exctype, value, tb))
-    print("=" * 80)
-    sys.__excepthook__(exctype, value, tb)
-
-sys.excepthook = exception_hook
+# NOTE: Everything else runs under the __main__ guard below. The thumbnail bulk
+# warm-up starts "spawn" worker processes, which re-import this module as
+# __mp_main__; they must not build the GUI stack, settings or log handlers.
 
 
 #if __name__ == "__main__":
@@ -57,6 +20,37 @@ sys.excepthook = exception_hook
 
 
 if __name__ == "__main__":
+    # Thumbnail bulk warm-up uses a process pool; required for frozen (PyInstaller) builds
+    import multiprocessing
+    multiprocessing.freeze_support()
+
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import Qt, QTimer
+    from main_window_qt import MainWindow
+
+    # ✅ Logging setup (must be first!)
+    from logging_config import setup_logging, get_logger, disable_external_logging
+    from settings_manager_qt import SettingsManager
+
+    # Initialize settings to get log level
+    settings = SettingsManager()
+    log_level = settings.get("log_level", "INFO")
+    log_to_console = settings.get("log_to_console", True)
+    log_colored = settings.get("log_colored_output", True)
+
+    # Setup logging before any other imports that might log
+    setup_logging(
+        log_level=log_level,
+        console=log_to_console,
+        use_colors=log_colored
+    )
+    disable_external_logging()  # Reduce Qt/PIL noise
+
+    logger = get_logger(__name__)
+
+    # ✅ Other imports
+    from splash_qt import SplashScreen, StartupWorker
+
     # Install global exception handler to catch crashes
     import traceback
     def exception_hook(exctype, value, tb):
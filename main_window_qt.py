@@ -3449,6 +3449,8 @@ class MainWindow(QMainWindow):
             msg = f"Added {len(paths)} photo(s) to favorites"
 
         # Refresh grid to show updated tag icons
+        if hasattr(self.grid, "invalidate_tag_cache"):
+            self.grid.invalidate_tag_cache()
         if hasattr(self.grid, "reload"):
             self.grid.reload()
 
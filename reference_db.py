@@ -17,12 +17,69 @@ import io
 import shutil
 import json
 import argparse
+import functools
 import traceback
 import warnings
 
 from datetime import datetime
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 
+try:
+    import numpy as np  # optional - only used to speed up date grouping
+except ImportError:
+    np = None
+
+# Below this many dates the plain Python grouping is faster than NumPy's setup cost
+_NUMPY_MIN_DATES = 512
+
+
+def _group_dates_by_month(dates: list) -> dict:
+    """
+    Group ascending 'YYYY-MM-DD' strings into {year: {month: [dates...]}}.
+
+    With NumPy the dates are parsed as datetime64 in one call and split at month
+    boundaries; any value that is not a plain ISO day sends the whole list down
+    the Python path, which skips malformed values one by one.
+    """
+    if np is not None and len(dates) >= _NUMPY_MIN_DATES:
+        try:
+            raw = np.array(dates, dtype=str)
+            if (np.char.str_len(raw) == 10).all():
+                months = raw.astype("datetime64[D]").astype("datetime64[M]").astype(np.int64)
+                # Input is sorted, so each month is one contiguous run
+                uniq, starts = np.unique(months, return_index=True)
+                ends = starts[1:].tolist() + [len(dates)]
+                hier = {}
+                for mm, start, end in zip(uniq.tolist(), starts.tolist(), ends):
+                    year, month = divmod(mm, 12)
+                    hier.setdefault(f"{year + 1970:04d}", {})[f"{month + 1:02d}"] = list(dates[start:end])
+                return hier
+        except (ValueError, TypeError):
+            pass
+
+    hier = {}
+    for ds in dates:
+        try:
+            y, m, d = str(ds).split("-", 2)
+        except Exception:
+            continue
+        hier.setdefault(y, {}).setdefault(m, []).append(ds)
+    return hier
+
+
+@functools.lru_cache(maxsize=200_000)
+def _norm_tag_path(p: str) -> str:
+    """
+    Case/separator-normalized path used to match grid paths against photo_metadata.
+
+    PERFORMANCE: Memoized - every grid reload looks up the tags of the same
+    listing again. abspath() already normalizes, so no separate normpath().
+    """
+    try:
+        return os.path.normcase(os.path.abspath(p.strip()))
+    except Exception:
+        return p.strip().lower()
+
 
 from db_config import get_db_filename
 
@@ -389,6 +446,29 @@ class ReferenceDB:
             row = cur.fetchone()
             return int(row[0]) if row and row[0] is not None else 0
 
+    def count_images_by_branches(self, project_id: int, branch_keys) -> dict[str, int]:
+        """
+        Counts for several branches at once: {branch_key: count}.
+
+        PERFORMANCE: One grouped query per chunk of keys instead of one
+        count_images_by_branch() call per branch. Branches without images are absent.
+        """
+        keys = list(dict.fromkeys(branch_keys))
+        counts = {}
+        with self._connect() as conn:
+            cur = conn.cursor()
+            # Stay well below SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cur.execute(f"""
+                    SELECT branch_key, COUNT(*) FROM project_images
+                    WHERE project_id = ? AND branch_key IN ({placeholders})
+                    GROUP BY branch_key
+                """, (project_id, *chunk))
+                counts.update((k, int(c)) for k, c in cur.fetchall())
+        return counts
+
     def get_all_folders(self, project_id: int | None = None) -> list[dict]:
         """
         Return all folders as list of dicts: {id, parent_id, path, name}.
@@ -1428,6 +1508,33 @@ class ReferenceDB:
             conn.commit()
             print(f"[DB] Updated folder_id={folder_id} for image: {path}")
 
+    def set_folder_for_images(self, paths, folder_id: int) -> int:
+        """
+        Update the folder_id for several images at once (drag & drop support).
+
+        PERFORMANCE: One transaction with chunked IN updates instead of one
+        set_folder_for_image() commit per photo.
+
+        Returns:
+            Number of photo_metadata rows updated
+        """
+        paths = list(dict.fromkeys(paths))
+        updated = 0
+        with self._connect() as conn:
+            cur = conn.cursor()
+            # Stay well below SQLite's bound-parameter limit
+            for i in range(0, len(paths), 500):
+                chunk = paths[i:i + 500]
+                placeholders = ",".join("?" * len(chunk))
+                cur.execute(
+                    f"UPDATE photo_metadata SET folder_id = ? WHERE path IN ({placeholders})",
+                    (folder_id, *chunk)
+                )
+                updated += cur.rowcount
+            conn.commit()
+        print(f"[DB] Updated folder_id={folder_id} for {updated} image(s)")
+        return updated
+
     def get_images_by_branch(self, project_id: int, branch_key: str):
         """
         Return list of image paths based on branch selection.
@@ -2538,8 +2645,6 @@ class ReferenceDB:
         Returns:
             Nested dict {year: {month: [days...]}}
         """
-        from collections import defaultdict
-        hier = defaultdict(lambda: defaultdict(list))
         with self._connect() as conn:
             cur = conn.cursor()
             if project_id is not None:
@@ -2560,13 +2665,36 @@ class ReferenceDB:
                     WHERE created_date IS NOT NULL
                     ORDER BY created_date ASC
                 """)
-            for (ds,) in cur.fetchall():
-                try:
-                    y, m, d = str(ds).split("-", 2)
-                    hier[y][m].append(ds)
-                except Exception:
-                    pass
-        return {y: dict(m) for y, m in hier.items()}
+            dates = [ds for (ds,) in cur.fetchall()]
+        # PERFORMANCE: Vectorized month grouping when NumPy is installed
+        return _group_dates_by_month(dates)
+
+    def get_date_counts(self, project_id: int | None = None) -> tuple[dict, dict, dict]:
+        """
+        Photo counts for every year, month and day, keyed like get_date_hierarchy().
+
+        PERFORMANCE: Replaces a count_for_year/count_for_month/count_for_day call
+        per date node. Reshapes the photo-only day counts of get_date_counts_batch()
+        so both share one grouped query.
+
+        Args:
+            project_id: Filter by project_id if provided, otherwise count all photos globally
+
+        Returns:
+            ({'YYYY': n}, {('YYYY', 'MM'): n}, {'YYYY-MM-DD': n})
+        """
+        years, months, days = {}, {}, {}
+        batch = self.get_date_counts_batch(project_id, include_videos=False)
+        for ds, n in batch['days'].items():
+            ds = str(ds)
+            days[ds] = days.get(ds, 0) + n
+            parts = ds.split("-", 2)
+            if len(parts) >= 2:
+                years[parts[0]] = years.get(parts[0], 0) + n
+            if len(parts) == 3:
+                ym = (parts[0], parts[1])
+                months[ym] = months.get(ym, 0) + n
+        return years, months, days
 
     def count_for_year(self, year: int | str, project_id: int | None = None) -> int:
         """
@@ -2766,6 +2894,39 @@ class ReferenceDB:
             row = cur.fetchone()
             return int(row[0] if row and row[0] is not None else 0)
 
+    def count_videos_by_year(self, project_id: int | None = None) -> dict:
+        """
+        Count videos for every year in ONE grouped query.
+
+        PERFORMANCE: Replaces one count_videos_for_year() query per year; SQLite
+        groups on the 'YYYY' prefix of created_date and returns one row per year.
+
+        Args:
+            project_id: Filter by project_id if provided, otherwise count all videos globally
+
+        Returns:
+            Dict {year: count} keyed like get_video_date_hierarchy() ('YYYY' strings)
+        """
+        with self._connect() as conn:
+            cur = conn.cursor()
+            # Same match as count_videos_for_year(): created_date LIKE 'YYYY-%'
+            if project_id is not None:
+                cur.execute("""
+                    SELECT substr(created_date, 1, 4) AS y, COUNT(*)
+                    FROM video_metadata
+                    WHERE project_id = ?
+                      AND substr(created_date, 5, 1) = '-'
+                    GROUP BY y
+                """, (project_id,))
+            else:
+                cur.execute("""
+                    SELECT substr(created_date, 1, 4) AS y, COUNT(*)
+                    FROM video_metadata
+                    WHERE substr(created_date, 5, 1) = '-'
+                    GROUP BY y
+                """)
+            return {str(y): int(c) for y, c in cur.fetchall()}
+
     def count_videos_for_month(self, year: int | str, month: int | str, project_id: int | None = None) -> int:
         """
         Count videos for a given year and month.
@@ -3182,12 +3343,7 @@ class ReferenceDB:
     def get_tags_for_paths(self, paths: list[str], project_id: int | None = None) -> dict[str, list[str]]:
         if not paths:
             return {}
-        import os
-        def norm(p: str) -> str:
-            try:
-                return os.path.normcase(os.path.abspath(os.path.normpath(p.strip())))
-            except Exception:
-                return str(p).strip().lower()
+        norm = _norm_tag_path
 
         # Map normalized->original so we can return tags keyed by original path
         orig_paths = [str(p) for p in paths]
@@ -3564,6 +3720,54 @@ class ReferenceDB:
 
             return counts
 
+    def get_folder_tree_with_counts(self, project_id: int) -> list[dict]:
+        """
+        Return the whole folder tree of a project with recursive photo counts in ONE query.
+
+        Combines get_all_folders() and get_folder_counts_batch(), so the sidebar
+        can build its folder section from a single round-trip.
+
+        Args:
+            project_id: Project ID to list folders and count photos for
+
+        Returns:
+            List of folder dicts with keys: id, parent_id, path, name, photo_count
+            (photo_count includes subfolders), ordered like get_all_folders()
+        """
+        with self._connect() as conn:
+            cur = conn.cursor()
+            cur.execute("""
+                WITH RECURSIVE folder_tree AS (
+                    SELECT id, parent_id, id as root_id
+                    FROM photo_folders
+                    WHERE project_id = ?
+
+                    UNION ALL
+
+                    SELECT f.id, f.parent_id, ft.root_id
+                    FROM photo_folders f
+                    JOIN folder_tree ft ON f.parent_id = ft.id
+                    WHERE f.project_id = ?
+                ),
+                folder_counts AS (
+                    SELECT ft.root_id as folder_id, COUNT(pm.id) as photo_count
+                    FROM folder_tree ft
+                    LEFT JOIN photo_metadata pm
+                        ON pm.folder_id = ft.id
+                        AND pm.project_id = ?
+                    GROUP BY ft.root_id
+                )
+                SELECT pf.id, pf.parent_id, pf.path, pf.name, COALESCE(fc.photo_count, 0)
+                FROM photo_folders pf
+                LEFT JOIN folder_counts fc ON fc.folder_id = pf.id
+                WHERE pf.project_id = ?
+                ORDER BY pf.parent_id IS NOT NULL, pf.parent_id, pf.name
+            """, (project_id, project_id, project_id, project_id))
+            return [
+                {"id": r[0], "parent_id": r[1], "path": r[2], "name": r[3], "photo_count": r[4]}
+                for r in cur.fetchall()
+            ]
+
     def get_video_counts_batch(self, project_id: int) -> dict[int, int]:
         """
         Get video counts for ALL folders in ONE query (fixes N+1 problem).
@@ -3627,7 +3831,91 @@ class ReferenceDB:
 
             return counts
 
-    def get_date_counts_batch(self, project_id: int) -> dict:
+    def get_videos_signature(self, project_id: int) -> tuple:
+        """
+        Cheap fingerprint of a project's video metadata for change detection.
+
+        Changes when videos are added or removed, and when metadata extraction
+        fills in the bucketed duration/size/resolution/codec/date fields. Edits
+        made through VideoRepository stamp updated_at; the aggregates also catch
+        ones that land within the same second as the previous fingerprint.
+        Used by the sidebar to reuse its Videos section counts when nothing
+        changed since the last build.
+
+        Args:
+            project_id: Project ID
+
+        Returns:
+            Tuple (count, max_id, duration_total, size_total, pixel_total,
+                   codec_count, dated_count, max_updated_at)
+        """
+        with self._connect() as conn:
+            row = conn.execute("""
+                SELECT COUNT(*), MAX(id), TOTAL(duration_seconds), TOTAL(size_kb),
+                       TOTAL(width * height), COUNT(codec),
+                       COUNT(created_date), MAX(updated_at)
+                FROM video_metadata
+                WHERE project_id = ?
+            """, (project_id,)).fetchone()
+            return tuple(row) if row else ()
+
+    def get_video_bucket_counts(self, project_id: int) -> dict[str, int]:
+        """
+        Get sidebar video filter bucket counts in ONE aggregate query.
+
+        Replaces loading every video row into Python and counting buckets
+        client-side. Bucket bounds match VideoService.filter_paths_by_*.
+
+        Args:
+            project_id: Project ID to count videos for
+
+        Returns:
+            dict with keys: total,
+            short/medium/long (duration), sd/hd/fhd/uhd (resolution),
+            h264/hevc/vp9/av1/mpeg4 (codec),
+            small/medium_size/large/xlarge (file size)
+
+        Example:
+            counts = db.get_video_bucket_counts(project_id=1)
+            # counts = {'total': 42, 'short': 10, 'medium': 25, ...}
+        """
+        buckets = [
+            ("total", "1"),
+            # Duration (seconds)
+            ("short", "duration_seconds > 0 AND duration_seconds < 30"),
+            ("medium", "duration_seconds >= 30 AND duration_seconds < 300"),
+            ("long", "duration_seconds >= 300"),
+            # Resolution (requires both width and height)
+            ("sd", "width > 0 AND height > 0 AND height < 720"),
+            ("hd", "width > 0 AND height >= 720 AND height < 1080"),
+            ("fhd", "width > 0 AND height >= 1080 AND height < 2160"),
+            ("uhd", "width > 0 AND height >= 2160"),
+            # Codec
+            ("h264", "LOWER(codec) IN ('h264', 'avc')"),
+            ("hevc", "LOWER(codec) IN ('hevc', 'h265')"),
+            ("vp9", "LOWER(codec) = 'vp9'"),
+            ("av1", "LOWER(codec) = 'av1'"),
+            ("mpeg4", "LOWER(codec) IN ('mpeg4', 'xvid', 'divx')"),
+            # File size (size_kb; MB thresholds 100 / 1024 / 5120)
+            ("small", "size_kb > 0 AND size_kb < 102400"),
+            ("medium_size", "size_kb >= 102400 AND size_kb < 1048576"),
+            ("large", "size_kb >= 1048576 AND size_kb < 5242880"),
+            ("xlarge", "size_kb >= 5242880"),
+        ]
+        select = ",\n".join(f"SUM(CASE WHEN {cond} THEN 1 ELSE 0 END)" for _, cond in buckets)
+
+        with self._connect() as conn:
+            cur = conn.cursor()
+            cur.execute(f"""
+                SELECT {select}
+                FROM video_metadata
+                WHERE project_id = ?
+            """, (project_id,))
+            row = cur.fetchone()
+
+        return {key: int(row[i] or 0) if row else 0 for i, (key, _) in enumerate(buckets)}
+
+    def get_date_counts_batch(self, project_id: int | None, include_videos: bool = True) -> dict:
         """
         Get ALL date counts (year, month, day) in ONE query (fixes N+1 problem).
 
@@ -3635,7 +3923,8 @@ class ReferenceDB:
         Dramatically faster for building date hierarchy in sidebar.
 
         Args:
-            project_id: Project ID to count dates for
+            project_id: Project ID to count dates for (None = all projects)
+            include_videos: Also count video_metadata dates (False = photos only)
 
         Returns:
             dict with three sub-dicts:
@@ -3663,20 +3952,18 @@ class ReferenceDB:
             cur = conn.cursor()
 
             # OPTIMIZATION: Single query with GROUP BY instead of N individual COUNTs
-            # Combines photos and videos, groups by date fields
-            cur.execute("""
+            # Combines photos and (optionally) videos, groups by date fields
+            if project_id is not None:
+                where, params = "project_id = ? AND created_date IS NOT NULL", (project_id,)
+            else:
+                where, params = "created_date IS NOT NULL", ()
+            sources = [f"SELECT created_date, created_year FROM photo_metadata WHERE {where}"]
+            if include_videos:
+                sources.append(f"SELECT created_date, created_year FROM video_metadata WHERE {where}")
+                params = params * 2
+            cur.execute(f"""
                 WITH all_dates AS (
-                    -- Get all photo dates
-                    SELECT created_date, created_year
-                    FROM photo_metadata
-                    WHERE project_id = ? AND created_date IS NOT NULL
-
-                    UNION ALL
-
-                    -- Get all video dates
-                    SELECT created_date, created_year
-                    FROM video_metadata
-                    WHERE project_id = ? AND created_date IS NOT NULL
+                    {" UNION ALL ".join(sources)}
                 )
                 SELECT
                     created_year,
@@ -3686,7 +3973,7 @@ class ReferenceDB:
                 FROM all_dates
                 GROUP BY created_year, year_month, day
                 ORDER BY created_date DESC
-            """, (project_id, project_id))
+            """, params)
 
             # Build three separate dictionaries for years, months, and days
             result = {
@@ -3704,7 +3991,8 @@ class ReferenceDB:
                 # Aggregate counts at each level
                 result['years'][year] = result['years'].get(year, 0) + count
                 result['months'][month] = result['months'].get(month, 0) + count
-                result['days'][day] = count  # Day count is exact, no aggregation needed
+                # A day can span several created_year groups only in inconsistent rows
+                result['days'][day] = result['days'].get(day, 0) + count
 
             return result
 
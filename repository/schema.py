@@ -431,6 +431,11 @@ CREATE INDEX IF NOT EXISTS idx_video_metadata_project_folder ON video_metadata(p
 CREATE INDEX IF NOT EXISTS idx_video_metadata_project_date ON video_metadata(project_id, created_year, created_date);
 CREATE INDEX IF NOT EXISTS idx_video_metadata_project_thumb_status ON video_metadata(project_id, thumbnail_status);
 CREATE INDEX IF NOT EXISTS idx_video_metadata_project_meta_status ON video_metadata(project_id, metadata_status);
+-- Expression index: codec buckets are matched with LOWER(codec), which a plain codec index can't serve
+CREATE INDEX IF NOT EXISTS idx_video_metadata_project_codec_lower ON video_metadata(project_id, LOWER(codec));
+CREATE INDEX IF NOT EXISTS idx_video_metadata_project_size ON video_metadata(project_id, size_kb);
+CREATE INDEX IF NOT EXISTS idx_video_metadata_project_height ON video_metadata(project_id, height);
+CREATE INDEX IF NOT EXISTS idx_video_metadata_project_duration ON video_metadata(project_id, duration_seconds);
 CREATE INDEX IF NOT EXISTS idx_project_images_project_branch ON project_images(project_id, branch_key, image_path);
 CREATE INDEX IF NOT EXISTS idx_photo_folders_project_parent ON photo_folders(project_id, parent_id);
 
@@ -558,6 +563,10 @@ def get_expected_indexes() -> list[str]:
         "idx_photo_metadata_project_date",
         "idx_video_metadata_project_folder",
         "idx_video_metadata_project_date",
+        "idx_video_metadata_project_codec_lower",
+        "idx_video_metadata_project_size",
+        "idx_video_metadata_project_height",
+        "idx_video_metadata_project_duration",
         "idx_project_images_project_branch",
         "idx_photo_folders_project_parent",
         # Mobile device tracking indexes (v5.0.0)
@@ -217,6 +217,9 @@ class VideoRepository(BaseRepository):
         for field, value in metadata.items():
             set_clauses.append(f"{field} = ?")
             values.append(value)
+        if 'updated_at' not in metadata:
+            # ReferenceDB.get_videos_signature() relies on MAX(updated_at) to see edits
+            set_clauses.append("updated_at = CURRENT_TIMESTAMP")
 
         values.append(video_id)
 
@@ -317,6 +320,8 @@ class VideoRepository(BaseRepository):
                         for field, value in metadata.items():
                             set_clauses.append(f"{field} = ?")
                             values.append(value)
+                        if 'updated_at' not in metadata:
+                            set_clauses.append("updated_at = CURRENT_TIMESTAMP")
                         values.append(existing['id'])
 
                         set_sql = ', '.join(set_clauses)
@@ -369,6 +374,104 @@ class VideoRepository(BaseRepository):
             """, (limit,))
             return cur.fetchall()
 
+    # ========================================================================
+    # FILTERED PATH QUERIES (sidebar video filters)
+    # ========================================================================
+
+    # Columns that may be range-filtered by get_paths_in_range().
+    # Each has a (project_id, <column>) compound index in schema.py.
+    _RANGE_COLUMNS = ("duration_seconds", "height", "size_kb")
+
+    def _get_paths_where(self, project_id: int, clause: str, params: tuple) -> List[str]:
+        """
+        Run a filtered path query scoped to one project.
+
+        Args:
+            project_id: Project ID
+            clause: Extra SQL condition (AND-ed with project_id = ?)
+            params: Parameters for clause
+
+        Returns:
+            List of video file paths (same ordering as get_by_project)
+        """
+        with self.connection(read_only=True) as conn:
+            cur = conn.cursor()
+            cur.execute(f"""
+                SELECT path FROM video_metadata
+                WHERE project_id = ? AND {clause}
+                ORDER BY date_taken DESC, path
+            """, (project_id, *params))
+            return [row['path'] for row in cur.fetchall()]
+
+    def get_paths_in_range(self, project_id: int, column: str,
+                           min_value: float = None, max_value: float = None) -> List[str]:
+        """
+        Get video paths whose column value falls in [min_value, max_value).
+
+        NULL and zero values never match (metadata not extracted yet).
+
+        Args:
+            project_id: Project ID
+            column: One of _RANGE_COLUMNS
+            min_value: Inclusive lower bound (None = no minimum)
+            max_value: Exclusive upper bound (None = no maximum)
+
+        Returns:
+            List of video file paths
+        """
+        if column not in self._RANGE_COLUMNS:
+            raise ValueError(f"Unsupported range column: {column}")
+
+        clause = f"{column} > 0"
+        params = []
+        if min_value is not None:
+            clause += f" AND {column} >= ?"
+            params.append(min_value)
+        if max_value is not None:
+            clause += f" AND {column} < ?"
+            params.append(max_value)
+        if column == "height":
+            # Resolution buckets require both dimensions
+            clause += " AND width > 0"
+        return self._get_paths_where(project_id, clause, tuple(params))
+
+    def get_paths_by_codecs(self, project_id: int, codecs: List[str]) -> List[str]:
+        """
+        Get video paths whose codec is one of the given names (case-insensitive).
+
+        Args:
+            project_id: Project ID
+            codecs: Codec names as stored by the metadata extractor (e.g. 'h264', 'avc')
+
+        Returns:
+            List of video file paths
+        """
+        if not codecs:
+            return []
+        placeholders = ",".join("?" * len(codecs))
+        return self._get_paths_where(project_id, f"LOWER(codec) IN ({placeholders})",
+                                     tuple(c.lower() for c in codecs))
+
+    def get_paths_by_created_date(self, project_id: int, year: int, month: int = None) -> List[str]:
+        """
+        Get video paths created in a given year (and optionally month).
+
+        Args:
+            project_id: Project ID
+            year: Year (e.g. 2024)
+            month: Month 1-12 (None = whole year)
+
+        Returns:
+            List of video file paths
+        """
+        if month is None:
+            return self._get_paths_where(project_id, "created_year = ?", (int(year),))
+        return self._get_paths_where(
+            project_id,
+            "created_year = ? AND created_date LIKE ?",
+            (int(year), f"{int(year):04d}-{int(month):02d}-%"),
+        )
+
     # ========================================================================
     # PROJECT-VIDEO ASSOCIATIONS
     # ========================================================================
@@ -413,6 +413,32 @@ class ThumbnailService:
 
         return pixmap
 
+    def peek(self, path: str) -> Optional[QPixmap]:
+        """
+        Return the L1 (memory) thumbnail for path without touching L2 or the file.
+
+        Like get_thumbnail(), the L1 entry is keyed by path only and is
+        validated against the file's mtime. A miss is not counted in the L1
+        statistics, since callers follow up with get_thumbnail().
+
+        Args:
+            path: Image file path
+
+        Returns:
+            Cached QPixmap, or None if not in L1 (or stale)
+        """
+        if not path:
+            return None
+
+        norm_path = self._normalize_path(path)
+        if norm_path in self._failed_images or norm_path not in self.l1_cache.cache:
+            return None
+
+        l1_entry = self.l1_cache.get(norm_path)
+        if l1_entry and self._is_cache_valid(l1_entry, self._get_mtime(path)):
+            return l1_entry["pixmap"]
+        return None
+
     def _generate_thumbnail(self, path: str, height: int, timeout: float) -> QPixmap:
         """
         Generate thumbnail from image file.
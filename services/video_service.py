@@ -1041,6 +1041,128 @@ class VideoService:
 
         return result
 
+    # ========================================================================
+    # SQL-BACKED SIDEBAR FILTERS
+    # ========================================================================
+    # These push the sidebar bucket filters down to indexed SQL queries so a
+    # click no longer loads every video row into Python just to filter it.
+    # Bucket bounds match the counts shown in the sidebar Videos section.
+
+    DURATION_BUCKETS = {
+        'short': (None, 30),       # < 30s
+        'medium': (30, 300),       # 30s - 5min
+        'long': (300, None),       # >= 5min
+    }
+
+    RESOLUTION_BUCKETS = {
+        'sd': (None, 720),         # < 720p
+        'hd': (720, 1080),         # 720p
+        'fhd': (1080, 2160),       # 1080p
+        '4k': (2160, None),        # 2160p+
+    }
+
+    CODEC_BUCKETS = {
+        'h264': ('h264', 'avc'),
+        'hevc': ('hevc', 'h265'),
+        'h265': ('hevc', 'h265'),
+        'vp9': ('vp9',),
+        'av1': ('av1',),
+        'mpeg4': ('mpeg4', 'xvid', 'divx'),
+    }
+
+    SIZE_BUCKETS_MB = {
+        'small': (None, 100),      # < 100MB
+        'medium': (100, 1024),     # 100MB - 1GB
+        'large': (1024, 5120),     # 1GB - 5GB
+        'xlarge': (5120, None),    # >= 5GB
+    }
+
+    def filter_paths_by_duration(self, project_id: int, duration_key: str) -> List[str]:
+        """
+        Get paths of videos in a duration bucket ('short', 'medium', 'long').
+
+        Example:
+            >>> service.filter_paths_by_duration(project_id=1, duration_key='short')
+            ['/videos/clip.mp4', ...]
+        """
+        bounds = self.DURATION_BUCKETS.get((duration_key or '').lower())
+        if bounds is None:
+            self.logger.warning(f"Unknown duration key: {duration_key}")
+            return []
+        try:
+            return self._video_repo.get_paths_in_range(project_id, 'duration_seconds', *bounds)
+        except Exception as e:
+            self.logger.error(f"Failed to filter videos by duration {duration_key}: {e}")
+            return []
+
+    def filter_paths_by_resolution(self, project_id: int, resolution_key: str) -> List[str]:
+        """
+        Get paths of videos in a resolution bucket ('sd', 'hd', 'fhd', '4k').
+
+        Example:
+            >>> service.filter_paths_by_resolution(project_id=1, resolution_key='fhd')
+        """
+        bounds = self.RESOLUTION_BUCKETS.get((resolution_key or '').lower())
+        if bounds is None:
+            self.logger.warning(f"Unknown resolution key: {resolution_key}")
+            return []
+        try:
+            return self._video_repo.get_paths_in_range(project_id, 'height', *bounds)
+        except Exception as e:
+            self.logger.error(f"Failed to filter videos by resolution {resolution_key}: {e}")
+            return []
+
+    def filter_paths_by_codec(self, project_id: int, codec_key: str) -> List[str]:
+        """
+        Get paths of videos in a codec bucket ('h264', 'hevc', 'vp9', 'av1', 'mpeg4').
+
+        Codec names are matched case-insensitively, like the sidebar's
+        bucket counts.
+
+        Example:
+            >>> service.filter_paths_by_codec(project_id=1, codec_key='hevc')
+        """
+        names = self.CODEC_BUCKETS.get((codec_key or '').lower())
+        if names is None:
+            self.logger.warning(f"Unknown codec key: {codec_key}")
+            return []
+        try:
+            return self._video_repo.get_paths_by_codecs(project_id, list(names))
+        except Exception as e:
+            self.logger.error(f"Failed to filter videos by codec {codec_key}: {e}")
+            return []
+
+    def filter_paths_by_size(self, project_id: int, size_key: str) -> List[str]:
+        """
+        Get paths of videos in a file size bucket ('small', 'medium', 'large', 'xlarge').
+
+        Example:
+            >>> service.filter_paths_by_size(project_id=1, size_key='large')
+        """
+        bounds = self.SIZE_BUCKETS_MB.get((size_key or '').lower())
+        if bounds is None:
+            self.logger.warning(f"Unknown size key: {size_key}")
+            return []
+        min_kb, max_kb = (b * 1024 if b is not None else None for b in bounds)
+        try:
+            return self._video_repo.get_paths_in_range(project_id, 'size_kb', min_kb, max_kb)
+        except Exception as e:
+            self.logger.error(f"Failed to filter videos by size {size_key}: {e}")
+            return []
+
+    def filter_paths_by_date(self, project_id: int, year: int, month: int = None) -> List[str]:
+        """
+        Get paths of videos created in a year (and optionally month).
+
+        Example:
+            >>> service.filter_paths_by_date(project_id=1, year=2024, month=11)
+        """
+        try:
+            return self._video_repo.get_paths_by_created_date(project_id, year, month)
+        except Exception as e:
+            self.logger.error(f"Failed to filter videos by date {year}-{month}: {e}")
+            return []
+
 
 # ========================================================================
 # SINGLETON PATTERN
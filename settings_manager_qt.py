@@ -21,6 +21,10 @@ DEFAULT_SETTINGS = {
     "show_sql_queries": False,
     "use_cache_warmup": True,   # 👈 new toggle, on by default
     "cache_auto_cleanup": True,  # 👈 added new default
+    "thumbnail_resample": "bicubic",  # PIL thumbnail filter: "bicubic" (fast) or "lanczos" (sharper)
+    "thumbnail_readahead": True,  # Linux: hint the kernel to prefetch files the grid is about to decode
+    "thumbnail_bulk_warmup": True,  # decode large uncached listings into the thumbnail cache in worker processes
+    "use_vips": True,  # use libvips (pyvips) shrink-on-load thumbnails when installed
     "ffprobe_path": "",  # Custom path to ffprobe executable (empty = use system PATH)
 
     # Scan exclusions (folders to skip during photo scanning)
@@ -47,8 +51,13 @@ def apply_decoder_warning_policy():
         # Silence Qt image I/O warnings globally
         os.environ["QT_LOGGING_RULES"] = "qt.gui.imageio.warning=false"
 
-        # Silence Pillow decompression & ICC noise
-        warnings.filterwarnings("ignore", message=".*DecompressionBombWarning.*")
+        # Silence Pillow decompression & ICC noise (targeted - other warnings stay visible)
+        try:
+            from PIL import Image
+            warnings.filterwarnings("ignore", category=Image.DecompressionBombWarning)
+        except ImportError:
+            pass
+        warnings.filterwarnings("ignore", category=UserWarning, module=r"PIL\.")
         warnings.filterwarnings("ignore", message=".*invalid rendering intent.*")
         warnings.filterwarnings("ignore", message=".*iCCP.*")
         logging.getLogger("PIL").setLevel(logging.ERROR)
@@ -7,19 +7,21 @@ from PySide6.QtWidgets import (
     QWidget, QTreeView, QMenu, QFileDialog,
     QVBoxLayout, QMessageBox, QTreeWidgetItem, QTreeWidget,
     QHeaderView, QHBoxLayout, QPushButton, QLabel, QTabWidget, QListWidget, QListWidgetItem, QProgressBar, QAbstractItemView,
-    QTableWidget, QTableWidgetItem, QScrollArea, QLineEdit, QTextBrowser, QDialog
+    QTableWidget, QTableWidgetItem, QScrollArea, QLineEdit, QTextBrowser, QDialog, QStyle
 )
-from PySide6.QtCore import Qt, QPoint, Signal, QTimer, QSize
+from PySide6.QtCore import Qt, QPoint, Signal, QTimer, QSize, QRunnable, QThreadPool
 from PySide6.QtGui import (
     QStandardItemModel, QStandardItem,
-    QFont, QColor, QIcon, QImage,
+    QFont, QColor, QBrush, QIcon, QImage,
     QTransform, QPainter, QPixmap
 )
 
 from app_services import list_branches, export_branch
 from reference_db import ReferenceDB
 from services.tag_service import get_tag_service
+from services.video_service import get_video_service
 from ui.people_list_view import PeopleListView, make_circular_pixmap
+from logging_config import get_logger
 
 import threading
 import traceback
@@ -31,6 +33,42 @@ from datetime import datetime
 from PIL import Image, ImageOps
 from io import BytesIO
 
+logger = get_logger(__name__)
+
+# PERFORMANCE: Shared count-column styling, built once instead of parsing a
+# hex colour and combining alignment flags for every row on each rebuild
+_COUNT_FG = QBrush(QColor("#BBBBBB"))
+_COUNT_FG_DIM = QBrush(QColor("#888888"))
+_COUNT_ALIGN = Qt.AlignRight | Qt.AlignVCenter
+# Mobile Devices action/help rows and error rows
+_LINK_FG = QBrush(QColor("#0066CC"))
+_ERROR_FG = QBrush(QColor("#CC0000"))
+
+
+def _make_count_item(count="", fg=_COUNT_FG_DIM):
+    """Count-column item; strings are shown as-is, numbers blank when zero."""
+    item = QStandardItem(count if isinstance(count, str) else (str(count) if count else ""))
+    item.setEditable(False)
+    item.setTextAlignment(_COUNT_ALIGN)
+    item.setForeground(fg)
+    return item
+
+
+def _make_leaf_item(text, mode, key):
+    """Name-column item carrying the sidebar mode/key used by click handling."""
+    item = QStandardItem(text)
+    item.setEditable(False)
+    item.setData(mode, Qt.UserRole)
+    item.setData(key, Qt.UserRole + 1)
+    return item
+
+# Videos filter leaves (duration/resolution/codec/size/year) with a zero count are
+# left out of the tree; set True to always list every bucket
+_SHOW_EMPTY_VIDEO_BUCKETS = False
+
+# Default delay of SidebarQt._schedule_rebuild() when no explicit delay is given
+_REBUILD_DELAY_MS = 150
+
 
 # SettingsManager is used to persist sidebar display preference
 try:
@@ -109,13 +147,16 @@ class DroppableTreeView(QTreeView):
             return
 
         # Check item type and emit appropriate signal
-        folder_id = item.data(Qt.UserRole)
-        branch_key = item.data(Qt.UserRole + 1)
+        # Items store their mode in UserRole and their key (folder id / branch key) in UserRole+1
+        mode = item.data(Qt.UserRole)
+        value = item.data(Qt.UserRole + 1)
+        folder_id = value if mode == "folder" else None
+        branch_key = value if mode in ("branch", "tag") else None
 
         if folder_id is not None:
             # Dropped on folder - emit photoDropped signal
             print(f"[DragDrop] Dropped {len(paths)} photo(s) on folder ID: {folder_id}")
-            self.photoDropped.emit(folder_id, paths)
+            self.photoDropped.emit(int(folder_id), paths)
             event.acceptProposedAction()
         elif branch_key is not None:
             # Dropped on branch/tag - emit tagDropped signal
@@ -164,6 +205,9 @@ class SidebarTabs(QWidget):
         self._tab_gen: dict[str, int] = {"branches":0, "folders":0, "dates":0, "tags":0, "quick":0}
         # Guard against concurrent refresh_all calls
         self._refreshing_all = False
+        # Invariant: showing the tabs implies a refresh. show_tabs() does it when
+        # this is set (initially, and after hide_tabs() canceled the workers).
+        self._refresh_on_show = True
 
         # UI
         v = QVBoxLayout(self)
@@ -233,7 +277,13 @@ class SidebarTabs(QWidget):
         else:
             self._dbg(f"refresh_tab({tab_name}) - tab not found")
 
-    def show_tabs(self): self.show()
+    def show_tabs(self):
+        """Show the tabs; refreshes them once if they were hidden (or never shown)."""
+        self.show()
+        if self._refresh_on_show:
+            self._refresh_on_show = False
+            self.refresh_all(force=True)
+
     def hide_tabs(self):
         """Hide tabs and cancel any pending workers"""
         self._dbg("hide_tabs() called - canceling pending workers")
@@ -264,6 +314,7 @@ class SidebarTabs(QWidget):
                 pass
         self._tab_timers.clear()
         self._tab_status_labels.clear()
+        self._refresh_on_show = True
         self.hide()
 
     # ---------- internal ----------
@@ -547,8 +598,8 @@ class SidebarTabs(QWidget):
             # Column 1: Count (right-aligned, light grey like List view)
             count_str = str(count) if count is not None else "0"
             item_count = QTableWidgetItem(count_str)
-            item_count.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            item_count.setForeground(QColor("#BBBBBB"))
+            item_count.setTextAlignment(_COUNT_ALIGN)
+            item_count.setForeground(_COUNT_FG)
             table.setItem(row, 1, item_count)
 
         table.cellDoubleClicked.connect(lambda row, col: self.selectBranch.emit(table.item(row, 0).data(Qt.UserRole)))
@@ -660,8 +711,8 @@ class SidebarTabs(QWidget):
             item.setData(0, Qt.UserRole, int(fid))
 
             # Set count column formatting (right-aligned, grey color like List view)
-            item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
-            item.setForeground(1, QColor("#888888"))
+            item.setTextAlignment(1, _COUNT_ALIGN)
+            item.setForeground(1, _COUNT_FG_DIM)
 
             # Add to parent
             if isinstance(parent_widget_or_item, QTreeWidget):
@@ -701,8 +752,16 @@ class SidebarTabs(QWidget):
                     if hasattr(self.db, "list_years_with_counts"):
                         year_list = self.db.list_years_with_counts(self.project_id) or []
                         year_counts = {str(y): c for y, c in year_list}
+                    # PERFORMANCE: Year/month/day counts for the whole tree in one query,
+                    # fetched here in the worker instead of per node on the GUI thread
+                    date_counts = None
+                    if hasattr(self.db, "get_date_counts"):
+                        try:
+                            date_counts = self.db.get_date_counts(self.project_id)
+                        except Exception as e:
+                            self._dbg(f"_load_dates → get_date_counts failed, counting per node: {e}")
                     # Build result with hierarchy and counts
-                    rows = {"hierarchy": hier, "year_counts": year_counts}
+                    rows = {"hierarchy": hier, "year_counts": year_counts, "date_counts": date_counts}
                 else:
                     self._dbg("_load_dates → No date hierarchy method available")
                 self._dbg(f"_load_dates → got hierarchy data for project_id={self.project_id}")
@@ -727,9 +786,11 @@ class SidebarTabs(QWidget):
         if isinstance(rows, dict):
             hier = rows.get("hierarchy", {})
             year_counts = rows.get("year_counts", {})
+            date_counts = rows.get("date_counts")
         else:
             hier = {}
             year_counts = {}
+            date_counts = None
 
         if not hier:
             self._set_tab_empty(idx, "No date index found")
@@ -750,7 +811,9 @@ class SidebarTabs(QWidget):
                 # Get accurate year count from database
                 year_count = 0
                 try:
-                    if hasattr(self.db, "count_for_year"):
+                    if date_counts is not None:
+                        year_count = date_counts[0].get(str(year), 0)
+                    elif hasattr(self.db, "count_for_year"):
                         year_count = self.db.count_for_year(year)
                     else:
                         year_count = year_counts.get(str(year), 0)
@@ -774,7 +837,9 @@ class SidebarTabs(QWidget):
                     # Get accurate month count from database (not just len(days_list))
                     month_count = 0
                     try:
-                        if hasattr(self.db, "count_for_month"):
+                        if date_counts is not None:
+                            month_count = date_counts[1].get((str(year), str(month)), 0)
+                        elif hasattr(self.db, "count_for_month"):
                             month_count = self.db.count_for_month(year, month)
                         else:
                             month_count = len(days_list)
@@ -790,7 +855,9 @@ class SidebarTabs(QWidget):
                         # Get day count from database
                         day_count = 0
                         try:
-                            if hasattr(self.db, "count_for_day"):
+                            if date_counts is not None:
+                                day_count = date_counts[2].get(str(day), 0)
+                            elif hasattr(self.db, "count_for_day"):
                                 day_count = self.db.count_for_day(day, project_id=self.project_id)
                             else:
                                 # Fallback: count from get_images_by_date
@@ -899,8 +966,8 @@ class SidebarTabs(QWidget):
                 # Column 1: Count (right-aligned, grey color like List view)
                 count_str = str(count) if count else ""
                 item_count = QTableWidgetItem(count_str)
-                item_count.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                item_count.setForeground(QColor("#888888"))
+                item_count.setTextAlignment(_COUNT_ALIGN)
+                item_count.setForeground(_COUNT_FG_DIM)
                 table.setItem(row, 1, item_count)
 
             table.cellDoubleClicked.connect(lambda row, col: self.selectTag.emit(table.item(row, 0).data(Qt.UserRole)))
@@ -987,8 +1054,8 @@ class SidebarTabs(QWidget):
 
                 # Column 1: Count (right-aligned, light grey like List view)
                 item_count = QTableWidgetItem(str(count))
-                item_count.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                item_count.setForeground(QColor("#BBBBBB"))
+                item_count.setTextAlignment(_COUNT_ALIGN)
+                item_count.setForeground(_COUNT_FG)
                 table.setItem(row, 1, item_count)
 
             table.cellDoubleClicked.connect(lambda row, col: self.selectDate.emit(table.item(row, 0).data(Qt.UserRole)))
@@ -1411,30 +1478,186 @@ class SidebarTabs(QWidget):
             people_count = people_view.get_people_count()
             st.setText(f"{people_count} people • {total_faces} faces • {time.time()-started:.2f}s")
 
+class _CountWorker(QRunnable):
+    """
+    Counts sidebar branch/folder targets off the GUI thread.
+
+    Results go back through the sidebar's _countsReady signal. When a newer
+    rebuild bumps the sidebar's worker generation, the worker drops its counts
+    instead of posting them for a stale tree.
+    """
+
+    def __init__(self, sidebar, targets, gen):
+        super().__init__()
+        self.sidebar = sidebar
+        self.db = sidebar.db
+        self.project_id = sidebar.project_id
+        self.targets = targets  # [(typ, key)] - plain data, NO Qt objects
+        self.gen = gen
+
+    def _is_stale(self):
+        return self.sidebar._list_worker_gen != self.gen
+
+    def _batch_counts(self):
+        """
+        Per-type {key: count} maps from one grouped query per target type.
+
+        PERFORMANCE: Replaces a DB round-trip per target. Both ReferenceDB batch
+        methods are scoped to the sidebar's project; a type whose query fails
+        is left out and its targets report 0.
+        """
+        maps = {}
+        if self.project_id is None:
+            logger.warning("[counts worker] project_id is None, no counts")
+            return maps
+        branch_keys = [k for t, k in self.targets if t == "branch"]
+        if branch_keys and hasattr(self.db, "count_images_by_branches"):
+            try:
+                maps["branch"] = self.db.count_images_by_branches(self.project_id, branch_keys)
+            except Exception as e:
+                logger.warning(f"[counts worker] batch branch counts failed: {e}")
+        if any(t == "folder" for t, _ in self.targets) and hasattr(self.db, "get_folder_counts_batch"):
+            try:
+                maps["folder"] = self.db.get_folder_counts_batch(self.project_id)
+            except Exception as e:
+                logger.warning(f"[counts worker] batch folder counts failed: {e}")
+        return maps
+
+    def run(self):
+        results = []
+        try:
+            logger.debug(f"[counts worker gen={self.gen}] running for {len(self.targets)} targets...")
+            batched = self._batch_counts()
+            if self._is_stale():
+                logger.debug(f"[counts worker gen={self.gen}] superseded, stopping early")
+                return
+            for typ, key in self.targets:
+                results.append((typ, key, int(batched.get(typ, {}).get(key, 0) or 0)))
+            logger.debug(f"[counts worker gen={self.gen}] finished scanning targets, scheduling UI update")
+        except Exception:
+            traceback.print_exc()
+        # Hand results to the main thread; the slot re-checks the generation
+        try:
+            self.sidebar._countsReady.emit(results, self.gen)
+        except RuntimeError:
+            pass  # sidebar deleted while the worker was running
+
+
+class _DropWorker(QRunnable):
+    """
+    Saves a drag & drop (photos moved to a folder, or tagged) off the GUI thread.
+
+    The outcome goes back through the sidebar's _dropDone signal, where the
+    message box and the sidebar/grid refresh happen.
+    """
+
+    def __init__(self, sidebar, kind, target, paths):
+        super().__init__()
+        self.sidebar = sidebar
+        self.db = sidebar.db
+        self.project_id = sidebar.project_id
+        self.kind = kind            # "folder" or "tag"
+        self.target = target        # folder_id or tag name
+        self.paths = list(paths)    # plain data, NO Qt objects
+
+    def _move_to_folder(self):
+        try:
+            return self.db.set_folder_for_images(self.paths, self.target)
+        except Exception as e:
+            print(f"[DragDrop] Batch folder update failed, updating one by one: {e}")
+        updated = 0
+        for path in self.paths:
+            try:
+                self.db.set_folder_for_image(path, self.target)
+                updated += 1
+            except Exception as e:
+                print(f"[DragDrop] Failed to update folder for {path}: {e}")
+        return updated
+
+    def run(self):
+        count, error = 0, ""
+        try:
+            if self.kind == "folder":
+                count = self._move_to_folder()
+            else:
+                count = get_tag_service().assign_tags_bulk(self.paths, self.target, self.project_id)
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+            error = str(e)
+        try:
+            self.sidebar._dropDone.emit(self.kind, self.target, count, error)
+        except RuntimeError:
+            pass  # sidebar was deleted while the drop was being saved
+
+
 # =====================================================================
 # 2️ SidebarQt — main sidebar container with toggle
 # =====================================================================
 
 class SidebarQt(QWidget):
     folderSelected = Signal(int)
+    # Emitted from the count worker thread; delivered queued in the GUI thread
+    _countsReady = Signal(object, int)
+    # (kind, folder_id or tag name, count, error) from _DropWorker, delivered queued
+    _dropDone = Signal(str, object, int, str)
 
     def __init__(self, project_id=None):
         super().__init__()
         self.db = ReferenceDB()
         self.project_id = project_id
+        # PERFORMANCE: Resolve folder count backend once instead of probing per folder
+        self._count_fn = self._resolve_count_fn()
+        # Shared service instance (avoids import + construction on every click)
+        self._video_service = get_video_service()
 
         # settings
         self.settings = SettingsManager() if SettingsManager else None
 
         # UI state
-        self._reload_block = False
+        # PERFORMANCE: Refresh requests are collected here ("tree" = full reload,
+        # "tags" = Tags section only) and served by one timer shot, so a burst of
+        # requests (e.g. during a scan) costs a single rebuild
+        self._pending_rebuild = set()
         self._reload_timer = QTimer(self)
         self._reload_timer.setSingleShot(True)
-        self._reload_timer.timeout.connect(self._do_reload_throttled)
+        self._reload_timer.setInterval(_REBUILD_DELAY_MS)
+        self._reload_timer.timeout.connect(self._run_scheduled_rebuild)
 
         # Worker generation for list mode (to cancel stale workers)
         self._list_worker_gen = 0
 
+        # (signature, (bucket counts, date hierarchy, year counts)) of the last Videos build
+        self._videos_cache = None
+
+        # PERFORMANCE: Coalesce async count results and flush them in one pass
+        # (one repaint per 30ms window instead of one per updated row)
+        self._pending_count_updates = {}
+        self._count_flush_timer = QTimer(self)
+        self._count_flush_timer.setSingleShot(True)
+        self._count_flush_timer.setInterval(30)
+        self._count_flush_timer.timeout.connect(self._flush_count_updates)
+        self._countsReady.connect(self._apply_counts_defensive)
+
+        # Drag & drop saves run on the thread pool; one at a time
+        self._drop_inflight = False
+        self._dropDone.connect(self._on_drop_done)
+
+        # PERFORMANCE: Column width recalculation requests are debounced into one
+        # trailing call; repeated start() on a single-shot timer just restarts it
+        self._recalc_timer = QTimer(self)
+        self._recalc_timer.setSingleShot(True)
+        self._recalc_timer.setInterval(0)
+        self._recalc_timer.timeout.connect(self._recalculate_columns)
+
+        # PERFORMANCE: Full tabs refreshes requested in the same event loop turn
+        # (mode switch, reload, tag edits) run once from this timer
+        self._tabs_refresh_pending = False
+        self._tabs_refresh_timer = QTimer(self)
+        self._tabs_refresh_timer.setSingleShot(True)
+        self._tabs_refresh_timer.setInterval(0)
+        self._tabs_refresh_timer.timeout.connect(self._run_tabs_refresh)
+
         # Refresh guard to prevent concurrent reloads
         self._refreshing = False
 
@@ -1446,6 +1669,8 @@ class SidebarQt(QWidget):
         self._spin_timer.timeout.connect(self._tick_spinner)
         self._spin_angle = 0
         self._base_pm = self._make_reload_pixmap(18, 18)
+        # One icon per 30° spinner step, rendered on first use (see _start_spinner)
+        self._spin_icons = None
 
         # Device auto-refresh timer
         self._device_refresh_timer = QTimer(self)
@@ -1469,11 +1694,21 @@ class SidebarQt(QWidget):
         header_layout.addWidget(title_lbl)
         header_layout.addStretch(1)
 
+        # PERFORMANCE: Read persisted sidebar mode/fold state once and keep it cached.
+        # Every settings.get() hits the settings backend; these values only change
+        # through this widget, so the cache is updated on write.
+        current_mode = self.settings.get("sidebar_mode", "list") if self.settings else "list"
+        current_mode = str(current_mode or "list").lower()
+        self._sidebar_mode_cache = current_mode if current_mode in ("tabs", "list") else "list"
+        try:
+            self._sidebar_folded_cache = bool(self.settings.get("sidebar_folded", False)) if self.settings else False
+        except Exception:
+            self._sidebar_folded_cache = False
+
         # Mode toggle
         self.btn_mode_toggle = QPushButton("")
         self.btn_mode_toggle.setCheckable(True)
-        current_mode = self.settings.get("sidebar_mode", "list") if self.settings else "list"
-        self.btn_mode_toggle.setChecked(current_mode.lower() == "tabs")
+        self.btn_mode_toggle.setChecked(self._sidebar_mode_cache == "tabs")
         self._update_mode_toggle_text()
         self.btn_mode_toggle.setToolTip("Toggle Sidebar Mode: List / Tabs")
         self.btn_mode_toggle.clicked.connect(self._on_mode_toggled)
@@ -1501,11 +1736,14 @@ class SidebarQt(QWidget):
         self.tree.setEditTriggers(QTreeView.NoEditTriggers)
         self.tree.setSelectionBehavior(QTreeView.SelectRows)
         self.tree.setRootIsDecorated(True)
+        # Uniform row heights are switched on per build when no face thumbnails are shown
         self.tree.setUniformRowHeights(False)
         self.tree.setIconSize(QSize(32, 32))  # Circular face thumbnails
         self.model = QStandardItemModel(self.tree)
         self.model.setHorizontalHeaderLabels(["Folder / Branch", "Photos"])
         self.tree.setModel(self.model)
+        self._roots = {}
+        self._count_col_px = None
         header = self.tree.header()
         header.setStretchLastSection(True)
         header.setSectionResizeMode(0, QHeaderView.Stretch)
@@ -1562,10 +1800,11 @@ class SidebarQt(QWidget):
         # Click handlers
         self.tree.clicked.connect(self._on_item_clicked)
         self.tree.doubleClicked.connect(self._on_item_double_clicked)
+        self.tree.expanded.connect(self._on_tree_expanded)
 
         # Start with persisted mode
         try:
-            if current_mode.lower() == "tabs":
+            if self._sidebar_mode_cache == "tabs":
                 self.switch_display_mode("tabs")
             else:
                 self.switch_display_mode("list")
@@ -1574,8 +1813,7 @@ class SidebarQt(QWidget):
 
         # Apply fold state if persisted
         try:
-            folded = bool(self.settings.get("sidebar_folded", False)) if self.settings else False
-            if folded:
+            if self._sidebar_folded_cache:
                 self.collapse_all()
         except Exception:
             pass
@@ -1596,6 +1834,9 @@ class SidebarQt(QWidget):
         if hasattr(self, '_reload_timer'):
             self._reload_timer.stop()
 
+        if hasattr(self, '_tabs_refresh_timer'):
+            self._tabs_refresh_timer.stop()
+
         if hasattr(self, '_spin_timer'):
             self._spin_timer.stop()
 
@@ -1604,8 +1845,15 @@ class SidebarQt(QWidget):
     # ---- header helpers ----
 
 
-    def _find_model_item_by_key(self, key, role=Qt.UserRole+1):
-        """Return (QStandardItem for column0, QStandardItem for column1) where column0.data(role)==key, or (None,None)."""
+    def _find_model_item_by_key(self, key, role=Qt.UserRole+1, typ=None):
+        """Return (QStandardItem for column0, QStandardItem for column1) where column0.data(role)==key, or (None,None).
+
+        PERFORMANCE: When typ is given the lookup is a single _key_index hit (every
+        count target is registered there at build time); only untyped lookups walk the model.
+        """
+        if typ is not None:
+            return getattr(self, "_key_index", {}).get((typ, key), (None, None))
+
         def recurse(parent):
             for r in range(parent.rowCount()):
                 n0 = parent.child(r, 0)
@@ -1632,11 +1880,7 @@ class SidebarQt(QWidget):
     def _on_mode_toggled(self, checked):
         self._update_mode_toggle_text()
         mode = "tabs" if checked else "list"
-        try:
-            if self.settings:
-                self.settings.set("sidebar_mode", mode)
-        except Exception:
-            pass
+        self._set_sidebar_mode(mode)
         self.switch_display_mode(mode)
 
     def _on_refresh_clicked(self):
@@ -1714,17 +1958,29 @@ class SidebarQt(QWidget):
             print(f"[Sidebar] collapse action failed: {e}")
 
 
+    def _resolve_count_fn(self):
+        """
+        Pick the folder photo-count backend once: fn(folder_id, project_id) -> int.
+        Falls back to a raw query on one connection shared by all calls.
+        """
+        fn = getattr(self.db, "count_for_folder", None) or getattr(self.db, "get_folder_photo_count", None)
+        if fn is not None:
+            return lambda folder_id, project_id: fn(folder_id, project_id=project_id)
+
+        conn_holder = []
+
+        def _count_via_sql(folder_id, project_id):
+            if not conn_holder:
+                conn_holder.append(self.db._connect())
+            cur = conn_holder[0].execute("SELECT COUNT(*) FROM photo_metadata WHERE folder_id=?", (folder_id,))
+            val = cur.fetchone()
+            return int(val[0]) if val else 0
+
+        return _count_via_sql
+
     def _get_photo_count(self, folder_id: int) -> int:
         try:
-            if hasattr(self.db, "count_for_folder"):
-                return int(self.db.count_for_folder(folder_id, project_id=self.project_id) or 0)
-            if hasattr(self.db, "get_folder_photo_count"):
-                return int(self.db.get_folder_photo_count(folder_id, project_id=self.project_id) or 0)
-            with self.db._connect() as conn:
-                cur = conn.cursor()
-                cur.execute("SELECT COUNT(*) FROM photo_metadata WHERE folder_id=?", (folder_id,))
-                val = cur.fetchone()
-                return int(val[0]) if val else 0
+            return int(self._count_fn(folder_id, self.project_id) or 0)
         except Exception:
             return 0
 
@@ -1794,7 +2050,7 @@ class SidebarQt(QWidget):
                     )
                     mw.statusBar().showMessage(f"👤 Showing {len(paths)} photo(s) of {person_name}")
                 except Exception as e:
-                    print(f"[Sidebar] Failed to update status bar for people: {e}")
+                    logger.warning(f"Failed to update status bar for people: {e}")
 
             else:
                 mw.grid.set_context("branch", val_str)
@@ -1850,8 +2106,7 @@ class SidebarQt(QWidget):
         # VIDEO MODES
         # ==========================================================
 
-        from services.video_service import VideoService
-        video_service = VideoService()
+        video_service = self._video_service
 
         # All videos
         if mode == "videos" and value == "all":
@@ -1863,12 +2118,12 @@ class SidebarQt(QWidget):
             mw.statusBar().showMessage(f"🎬 Showing {len(paths)} videos")
             return
 
-        # Duration filter
+        # Duration / resolution / codec / size / year / month filters
+        # PERFORMANCE: filtered in SQL (indexed per-project queries) instead of
+        # loading every video row and bucketing it in Python on each click
         if mode == "videos_duration" and value:
             _clear_tag_if_needed()
-            videos = video_service.get_videos_by_project(self.project_id)
-            filtered = video_service.filter_by_duration_key(videos, value)
-            paths = _ensure_video_paths_only([v["path"] for v in filtered])
+            paths = _ensure_video_paths_only(video_service.filter_paths_by_duration(self.project_id, value))
             mw.grid.model.clear()
             mw.grid.load_custom_paths(paths, content_type="videos")
             mw.statusBar().showMessage(f"⏱ Showing {len(paths)} {value} videos")
@@ -1877,9 +2132,7 @@ class SidebarQt(QWidget):
         # Resolution filter
         if mode == "videos_resolution" and value:
             _clear_tag_if_needed()
-            videos = video_service.get_videos_by_project(self.project_id)
-            filtered = video_service.filter_by_resolution_key(videos, value)
-            paths = _ensure_video_paths_only([v["path"] for v in filtered])
+            paths = _ensure_video_paths_only(video_service.filter_paths_by_resolution(self.project_id, value))
             mw.grid.model.clear()
             mw.grid.load_custom_paths(paths, content_type="videos")
             return
@@ -1887,9 +2140,7 @@ class SidebarQt(QWidget):
         # Codec filter
         if mode == "videos_codec" and value:
             _clear_tag_if_needed()
-            videos = video_service.get_videos_by_project(self.project_id)
-            filtered = video_service.filter_by_codec_key(videos, value)
-            paths = _ensure_video_paths_only([v["path"] for v in filtered])
+            paths = _ensure_video_paths_only(video_service.filter_paths_by_codec(self.project_id, value))
             mw.grid.model.clear()
             mw.grid.load_custom_paths(paths, content_type="videos")
             return
@@ -1897,9 +2148,7 @@ class SidebarQt(QWidget):
         # File size filter
         if mode == "videos_size" and value:
             _clear_tag_if_needed()
-            videos = video_service.get_videos_by_project(self.project_id)
-            filtered = video_service.filter_by_file_size(videos, size_range=value)
-            paths = _ensure_video_paths_only([v["path"] for v in filtered])
+            paths = _ensure_video_paths_only(video_service.filter_paths_by_size(self.project_id, value))
             mw.grid.model.clear()
             mw.grid.load_custom_paths(paths, content_type="videos")
             return
@@ -1907,10 +2156,7 @@ class SidebarQt(QWidget):
         # Video by year
         if mode == "videos_year" and value:
             _clear_tag_if_needed()
-            videos = video_service.get_videos_by_project(self.project_id)
-            year = int(value)
-            filtered = video_service.filter_by_date(videos, year=year)
-            paths = _ensure_video_paths_only([v["path"] for v in filtered])
+            paths = _ensure_video_paths_only(video_service.filter_paths_by_date(self.project_id, int(value)))
             mw.grid.model.clear()
             mw.grid.load_custom_paths(paths, content_type="videos")
             return
@@ -1920,9 +2166,7 @@ class SidebarQt(QWidget):
             _clear_tag_if_needed()
             parts = value.split("-")
             year, month = int(parts[0]), int(parts[1])
-            videos = video_service.get_videos_by_project(self.project_id)
-            filtered = video_service.filter_by_date(videos, year=year, month=month)
-            paths = _ensure_video_paths_only([v["path"] for v in filtered])
+            paths = _ensure_video_paths_only(video_service.filter_paths_by_date(self.project_id, year, month))
             mw.grid.model.clear()
             mw.grid.load_custom_paths(paths, content_type="videos")
             return
@@ -1959,7 +2203,7 @@ class SidebarQt(QWidget):
             import win32com.client
             import pythoncom
 
-            print(f"[Sidebar] Deep scan clicked for device")
+            logger.debug(f"Deep scan clicked for device")
 
             # Get stored device data
             device_obj = item.data(Qt.UserRole + 3)
@@ -1971,9 +2215,9 @@ class SidebarQt(QWidget):
                 return
 
             device_name = device_obj.label
-            print(f"[Sidebar] Starting deep scan for: {device_name}")
-            print(f"[Sidebar]   Root path: {root_path}")
-            print(f"[Sidebar]   Device type: {device_type}")
+            logger.debug(f"Starting deep scan for: {device_name}")
+            logger.debug(f"Root path: {root_path}")
+            logger.debug(f"Device type: {device_type}")
 
             # Confirm with user (deep scan can take time)
             reply = QMessageBox.question(
@@ -1989,7 +2233,7 @@ class SidebarQt(QWidget):
             )
 
             if reply != QMessageBox.Yes:
-                print(f"[Sidebar] Deep scan cancelled by user")
+                logger.debug(f"Deep scan cancelled by user")
                 return
 
             try:
@@ -1998,7 +2242,7 @@ class SidebarQt(QWidget):
 
                 # Use scanner helper to find storage item by re-enumerating devices
                 # (MTP paths cannot be navigated by parsing path strings)
-                print(f"[Sidebar] Finding device storage for deep scan...")
+                logger.debug(f"Finding device storage for deep scan...")
                 storage_item, found_device_name = scanner.find_storage_item_by_path(root_path)
 
                 if not storage_item:
@@ -2011,7 +2255,7 @@ class SidebarQt(QWidget):
                         f"• MTP mode is enabled"
                     )
 
-                print(f"[Sidebar] ✓ Found storage item: {found_device_name}")
+                logger.debug(f"✓ Found storage item: {found_device_name}")
 
                 # Show deep scan dialog with progress
                 dialog = MTPDeepScanDialog(
@@ -2029,12 +2273,12 @@ class SidebarQt(QWidget):
                     new_folders = dialog.new_folders
 
                     if new_folders:
-                        print(f"[Sidebar] Adding {len(new_folders)} new folders to sidebar...")
+                        logger.debug(f"Adding {len(new_folders)} new folders to sidebar...")
 
                         # Get device item from tree
                         device_item = item.parent()
                         if not device_item:
-                            print(f"[Sidebar] Error: Cannot find device item")
+                            logger.warning("Cannot find device item")
                             return
 
                         # Find deep scan button index to insert folders before it
@@ -2056,17 +2300,13 @@ class SidebarQt(QWidget):
                             folder_item.setData(folder.path, Qt.UserRole + 1)
 
                             # Make count item
-                            from PySide6.QtGui import QColor
-                            count_item = QStandardItem(str(folder.photo_count) if folder.photo_count > 0 else "")
-                            count_item.setEditable(False)
-                            count_item.setForeground(QColor("#888888"))
-                            count_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                            count_item = _make_count_item(folder.photo_count)
 
                             # Insert before deep scan button
                             device_item.insertRow(insert_row, [folder_item, count_item])
                             insert_row += 1
 
-                            print(f"[Sidebar]   Added: {folder.name} ({folder.photo_count} files)")
+                            logger.debug(f"Added: {folder.name} ({folder.photo_count} files)")
 
                         # Update device photo count
                         device_count_item = device_item.parent().child(device_item.row(), 1)
@@ -2075,7 +2315,7 @@ class SidebarQt(QWidget):
                             new_count = current_count + sum(f.photo_count for f in new_folders)
                             device_count_item.setText(str(new_count))
 
-                        print(f"[Sidebar] ✓ Deep scan complete: {len(new_folders)} folders added")
+                        logger.debug(f"✓ Deep scan complete: {len(new_folders)} folders added")
 
                         mw.statusBar().showMessage(
                             f"🔍 Deep scan complete: {len(new_folders)} new folder(s) found"
@@ -2086,16 +2326,16 @@ class SidebarQt(QWidget):
                         self.tree.expand(device_index)
 
                     else:
-                        print(f"[Sidebar] Deep scan found no new folders")
+                        logger.debug(f"Deep scan found no new folders")
                         mw.statusBar().showMessage("🔍 Deep scan complete: no new folders found")
 
                 else:
                     # User cancelled
-                    print(f"[Sidebar] Deep scan cancelled")
+                    logger.debug(f"Deep scan cancelled")
                     mw.statusBar().showMessage("🔍 Deep scan cancelled")
 
             except Exception as e:
-                print(f"[Sidebar] Deep scan failed: {e}")
+                logger.warning(f"Deep scan failed: {e}")
                 import traceback
                 traceback.print_exc()
 
@@ -2137,7 +2377,7 @@ class SidebarQt(QWidget):
             try:
                 if is_shell_path:
                     # Windows MTP device - show import dialog instead of direct copy
-                    print(f"[Sidebar] Opening MTP import dialog for: {value}")
+                    logger.debug(f"Opening MTP import dialog for: {value}")
                     try:
                         from ui.mtp_import_dialog import MTPImportDialog
 
@@ -2168,9 +2408,9 @@ class SidebarQt(QWidget):
                                         else:
                                             device_name = device_label.strip()
 
-                                        print(f"[Sidebar] Extracted device name: {device_name}")
+                                        logger.debug(f"Extracted device name: {device_name}")
                         except Exception as e:
-                            print(f"[Sidebar] Error extracting device name: {e}")
+                            logger.warning(f"Error extracting device name: {e}")
 
                         # Show import dialog
                         dialog = MTPImportDialog(
@@ -2187,7 +2427,7 @@ class SidebarQt(QWidget):
                             # Import successful - load imported files into grid
                             imported_paths = dialog.imported_paths
                             if imported_paths:
-                                print(f"[Sidebar] Import successful: {len(imported_paths)} files")
+                                logger.debug(f"Import successful: {len(imported_paths)} files")
 
                                 # Load imported files into grid
                                 mw.grid.model.clear()
@@ -2198,10 +2438,10 @@ class SidebarQt(QWidget):
                                 )
 
                                 # AUTO-REFRESH: Update sidebar sections to show newly imported files
-                                print(f"[Sidebar] Refreshing sidebar sections...")
+                                logger.debug(f"Refreshing sidebar sections...")
 
                                 # Refresh tree view (list mode)
-                                print(f"[Sidebar]   Rebuilding tree view...")
+                                logger.debug(f"Rebuilding tree view...")
                                 self._build_tree_model()
 
                                 # Refresh tabs (tabs mode)
@@ -2209,49 +2449,49 @@ class SidebarQt(QWidget):
                                     # Refresh Folders tab (force reload)
                                     if "folders" in self.tabs_controller._tab_populated:
                                         self.tabs_controller._tab_populated.discard("folders")
-                                        print(f"[Sidebar]   ✓ Cleared Folders tab cache")
+                                        logger.debug(f"✓ Cleared Folders tab cache")
 
                                     # Refresh Dates tab (force reload)
                                     if "dates" in self.tabs_controller._tab_populated:
                                         self.tabs_controller._tab_populated.discard("dates")
-                                        print(f"[Sidebar]   ✓ Cleared Dates tab cache")
+                                        logger.debug(f"✓ Cleared Dates tab cache")
 
                                     # Refresh Branches tab (force reload - counts may change)
                                     if "branches" in self.tabs_controller._tab_populated:
                                         self.tabs_controller._tab_populated.discard("branches")
-                                        print(f"[Sidebar]   ✓ Cleared Branches tab cache")
+                                        logger.debug(f"✓ Cleared Branches tab cache")
 
                                     # Refresh Tags tab (force reload - new tags may be added)
                                     if "tags" in self.tabs_controller._tab_populated:
                                         self.tabs_controller._tab_populated.discard("tags")
-                                        print(f"[Sidebar]   ✓ Cleared Tags tab cache")
+                                        logger.debug(f"✓ Cleared Tags tab cache")
 
                                     # If current tab is Folders, Dates, Branches, or Tags, trigger reload
                                     current_tab_idx = self.tabs_controller.tab_widget.currentIndex()
                                     if current_tab_idx >= 0:
                                         tab_name = self.tabs_controller.tab_widget.tabText(current_tab_idx)
                                         if tab_name in ["Folders", "Dates", "Branches", "Tags"]:
-                                            print(f"[Sidebar]   Reloading {tab_name} tab...")
+                                            logger.debug(f"Reloading {tab_name} tab...")
                                             self.tabs_controller._load_tab_if_selected(current_tab_idx)
 
-                                print(f"[Sidebar] ✓ Import complete, grid loaded with {len(imported_paths)} files")
-                                print(f"[Sidebar] ✓ Sidebar tabs will refresh when viewed")
+                                logger.debug(f"✓ Import complete, grid loaded with {len(imported_paths)} files")
+                                logger.debug(f"✓ Sidebar tabs will refresh when viewed")
                             else:
-                                print(f"[Sidebar] No files imported")
+                                logger.debug(f"No files imported")
                                 mw.statusBar().showMessage("📱 No files were imported")
                         else:
                             # User cancelled
-                            print(f"[Sidebar] Import cancelled by user")
+                            logger.debug(f"Import cancelled by user")
                             mw.statusBar().showMessage("📱 Import cancelled")
 
                     except ImportError as e:
-                        print(f"[Sidebar] Import dialog not available: {e}")
+                        logger.debug(f"Import dialog not available: {e}")
                         import traceback
                         traceback.print_exc()
                         mw.statusBar().showMessage(f"⚠️ Cannot import from MTP device: {e}")
                         return
                     except Exception as e:
-                        print(f"[Sidebar] Failed to show import dialog: {e}")
+                        logger.warning(f"Failed to show import dialog: {e}")
                         import traceback
                         traceback.print_exc()
                         mw.statusBar().showMessage(f"⚠️ Failed to import from device: {e}")
@@ -2287,10 +2527,10 @@ class SidebarQt(QWidget):
                     folder_name = device_folder_path.name
                     mw.statusBar().showMessage(f"📱 Showing {len(media_paths)} item(s) from {folder_name}")
 
-                    print(f"[Sidebar] Loaded {len(media_paths)} media files from device folder: {value}")
+                    logger.debug(f"Loaded {len(media_paths)} media files from device folder: {value}")
 
             except Exception as e:
-                print(f"[Sidebar] Failed to load device folder: {e}")
+                logger.warning(f"Failed to load device folder: {e}")
                 import traceback
                 traceback.print_exc()
                 mw.statusBar().showMessage(f"⚠️ Failed to load device folder: {e}")
@@ -2342,12 +2582,12 @@ class SidebarQt(QWidget):
     def _build_tree_model(self):
         # Build tree synchronously for folders (counts populated right away),
         # and register branch targets for async fill to keep responsiveness.
-        print(f"[SidebarQt] _build_tree_model() called with project_id={self.project_id}")
+        logger.debug(f"_build_tree_model() called with project_id={self.project_id}")
 
         # CRITICAL: Prevent concurrent rebuilds that cause Qt crashes during rapid project switching
         # Similar to grid reload() guard pattern
         if getattr(self, '_rebuilding_tree', False):
-            print("[Sidebar] _build_tree_model() blocked - already rebuilding (prevents concurrent rebuild crash)")
+            logger.debug("_build_tree_model() blocked - already rebuilding (prevents concurrent rebuild crash)")
             return
 
         try:
@@ -2364,15 +2604,16 @@ class SidebarQt(QWidget):
             # Without this, workers can access model items during clear() causing crashes
             if self._initialized:
                 from PySide6.QtCore import QCoreApplication
-                print("[Sidebar] Processing pending events before model clear")
                 QCoreApplication.processEvents()
                 # Process events twice to catch worker callbacks scheduled during first pass
                 QCoreApplication.processEvents()
-                print("[Sidebar] Pending events processed")
+
+            # Remember which nodes the user had open so the new tree reopens them
+            expanded_state = self._snapshot_expanded()
 
             # CRITICAL FIX: Detach model from view before clearing to prevent Qt segfault
             # Qt can crash if the view has active selections/iterators when model is cleared
-            print("[Sidebar] Detaching old model from tree view")
+            logger.debug("Detaching old model from tree view")
             self.tree.setModel(None)
 
             # Clear selection to release any Qt internal references
@@ -2384,7 +2625,7 @@ class SidebarQt(QWidget):
 
             # CRITICAL FIX: Create a completely fresh model instead of clearing the old one
             # This is safer than model.clear() which can cause Qt C++ segfaults
-            print("[Sidebar] Creating fresh model (avoiding Qt segfault)")
+            logger.debug("Creating fresh model (avoiding Qt segfault)")
             
             old_model = self.model
             self.model = QStandardItemModel(self.tree)
@@ -2395,14 +2636,23 @@ class SidebarQt(QWidget):
                 try:
                     old_model.deleteLater()
                 except Exception as e:
-                    print(f"[Sidebar] Warning: Could not schedule old model for deletion: {e}")
+                    logger.warning(f"Could not schedule old model for deletion: {e}")
 
-            # Attach the fresh model to the tree view
-            print("[Sidebar] Attaching fresh model to tree view")
-            
-            self.tree.setModel(self.model)
+            # PERFORMANCE: The fresh model stays detached while it is filled, so the
+            # hundreds of appendRow() calls below notify no view; it is attached
+            # once at the end with repaints suspended.
 
             self._count_targets = []
+            # (typ, key) -> (name_item, count_item) for targeted count updates without a rebuild
+            self._key_index = {}
+            # stripped root title -> top-level name item, see _find_root_item()
+            self._roots = {}
+            self._shown_tag_rows = None
+            self._tree_has_icons = False
+            # Counts column width in px; None = measure the model again (see _count_column_width)
+            self._count_col_px = None
+            # marker -> loader(parent_item) for nodes whose children are built on first expand
+            self._lazy_loaders = {}
             try:
                 # Get total photo count for displaying on top-level sections
                 total_photos = 0
@@ -2412,27 +2662,19 @@ class SidebarQt(QWidget):
                         all_photos = self.db.get_project_images(self.project_id, branch_key='all')
                         total_photos = len(all_photos) if all_photos else 0
                     except Exception as e:
-                        print(f"[Sidebar] Could not get total photo count: {e}")
+                        logger.warning(f"Could not get total photo count: {e}")
                         total_photos = 0
 
-                # Helper to create styled count item
-                def _make_count_item(count_val):
-                    item = QStandardItem(str(count_val) if count_val else "")
-                    item.setEditable(False)
-                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    item.setForeground(QColor("#BBBBBB"))
-                    return item
-
                 branch_root = QStandardItem("🌿 Branches")
                 branch_root.setEditable(False)
-                branch_count_item = _make_count_item(total_photos)
-                self.model.appendRow([branch_root, branch_count_item])
+                branch_count_item = _make_count_item(total_photos, _COUNT_FG)
+                self._append_root([branch_root, branch_count_item])
                 branches = list_branches(self.project_id) if self.project_id else []
 
                 # DEBUG: Log branches loaded
-                print(f"[SidebarQt] list_branches() returned {len(branches)} branches")
+                logger.debug(f"list_branches() returned {len(branches)} branches")
                 if len(branches) > 0:
-                    print(f"[SidebarQt] Sample branches: {branches[:5]}")
+                    logger.debug(f"Sample branches: {branches[:5]}")
 
                 for b in branches:
 #                    name_item = QStandardItem(b["display_name"])
@@ -2442,48 +2684,33 @@ class SidebarQt(QWidget):
                     if isinstance(branch_key, str) and branch_key.startswith("face_"):
                         continue
 
-                    name_item = QStandardItem(b.get("display_name") or branch_key)
-                    
-                    count_item = QStandardItem("")
-                    name_item.setEditable(False)
-                    count_item.setEditable(False)
-                    name_item.setData("branch", Qt.UserRole)
-                    
-#                    name_item.setData(b["branch_key"], Qt.UserRole + 1)
-                    name_item.setData(branch_key, Qt.UserRole + 1)
-                    
-                    count_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    count_item.setForeground(QColor("#BBBBBB"))
+                    name_item = _make_leaf_item(b.get("display_name") or branch_key, "branch", branch_key)
+                    count_item = _make_count_item("", _COUNT_FG)
                     branch_root.appendRow([name_item, count_item])
                     # register branch for async counts
 #                    self._count_targets.append(("branch", b["branch_key"], name_item, count_item))
                     self._count_targets.append(("branch", branch_key, name_item, count_item))
+                    self._key_index[("branch", branch_key)] = (name_item, count_item)
 
                 quick_root = QStandardItem("📅 Quick Dates")
                 quick_root.setEditable(False)
-                quick_count_item = _make_count_item(total_photos)
-                self.model.appendRow([quick_root, quick_count_item])
+                quick_count_item = _make_count_item(total_photos, _COUNT_FG)
+                self._append_root([quick_root, quick_count_item])
                 try:
                     quick_rows = self.db.get_quick_date_counts(project_id=self.project_id)
                 except Exception:
                     quick_rows = []
                 for row in quick_rows:
-                    name_item = QStandardItem(row["label"])
-                    count_item = QStandardItem(str(row["count"]) if row and row.get("count") else "")
-                    name_item.setEditable(False)
-                    count_item.setEditable(False)
-                    name_item.setData("branch", Qt.UserRole)
-                    name_item.setData(row["key"], Qt.UserRole + 1)
-                    count_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    count_item.setForeground(QColor("#BBBBBB"))
+                    name_item = _make_leaf_item(row["label"], "branch", row["key"])
+                    count_item = _make_count_item(row.get("count") or 0, _COUNT_FG)
                     quick_root.appendRow([name_item, count_item])
 
                 # IMPORTANT FIX: use synchronous folder population as in the previous working version,
                 # so folder counts are calculated and displayed immediately.
                 folder_root = QStandardItem("📁 Folders")
                 folder_root.setEditable(False)
-                folder_count_item = _make_count_item(total_photos)
-                self.model.appendRow([folder_root, folder_count_item])
+                folder_count_item = _make_count_item(total_photos, _COUNT_FG)
+                self._append_root([folder_root, folder_count_item])
                 # synchronous (restores the previous working behavior)
                 self._add_folder_items(folder_root, None)
 
@@ -2493,370 +2720,129 @@ class SidebarQt(QWidget):
 #                self._build_tag_section()
 
                 # >>> NEW: 🎬 Videos section
+                vcounts = None
+                video_hier = all_year_counts = None
+                videos_sig = None
                 try:
-                    from services.video_service import VideoService
-                    video_service = VideoService()
-                    print(f"[Sidebar] Loading videos for project_id={self.project_id}")
-                    videos = video_service.get_videos_by_project(self.project_id) if self.project_id else []
-                    total_videos = len(videos)
-                    print(f"[Sidebar] Found {total_videos} videos in project {self.project_id}")
+                    logger.debug(f"Loading videos for project_id={self.project_id}")
+                    if self.project_id and hasattr(self.db, "get_videos_signature"):
+                        try:
+                            videos_sig = (self.project_id, self.db.get_videos_signature(self.project_id))
+                        except Exception as e:
+                            logger.warning(f"get_videos_signature failed: {e}")
+                    cached = self._videos_cache
+                    if videos_sig is not None and cached is not None and cached[0] == videos_sig:
+                        # PERFORMANCE: Video metadata unchanged since the last build -
+                        # reuse its bucket/date/year aggregates instead of re-querying
+                        logger.debug("Video metadata unchanged, reusing cached Videos counts")
+                        vcounts, video_hier, all_year_counts = cached[1]
+                    elif self.project_id and hasattr(self.db, "get_video_bucket_counts"):
+                        # PERFORMANCE: Bucket counts aggregated in SQL - no per-video rows loaded
+                        vcounts = self.db.get_video_bucket_counts(self.project_id)
+                    total_videos = vcounts['total'] if vcounts else 0
+                    logger.debug(f"Found {total_videos} videos in project {self.project_id}")
                 except Exception as e:
-                    print(f"[Sidebar] Failed to load videos: {e}")
+                    logger.warning(f"Failed to load videos: {e}")
                     import traceback
                     traceback.print_exc()
                     total_videos = 0
-                    videos = []
 
-                if videos:
+                if total_videos:
                     root_name_item = QStandardItem("🎬 Videos")
-                    root_cnt_item = _make_count_item(total_videos)
+                    root_cnt_item = _make_count_item(total_videos, _COUNT_FG)
                     root_name_item.setEditable(False)
-                    root_cnt_item.setEditable(False)
-                    self.model.appendRow([root_name_item, root_cnt_item])
+                    self._append_root([root_name_item, root_cnt_item])
 
                     # Add "All Videos" option
                     all_videos_item = QStandardItem("All Videos")
                     all_videos_item.setEditable(False)
                     all_videos_item.setData("videos", Qt.UserRole)
                     all_videos_item.setData("all", Qt.UserRole + 1)
-                    all_count = QStandardItem(str(total_videos))
-                    all_count.setEditable(False)
-                    all_count.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    all_count.setForeground(QColor("#888888"))
+                    all_count = _make_count_item(str(total_videos))
                     root_name_item.appendRow([all_videos_item, all_count])
 
-                    # 🎯 Filter by Duration
-                    duration_parent = QStandardItem("⏱️ By Duration")
-                    duration_parent.setEditable(False)
-
-                    # Count videos by duration
-                    short_videos = [v for v in videos if v.get('duration_seconds') and v['duration_seconds'] < 30]
-                    medium_videos = [v for v in videos if v.get('duration_seconds') and 30 <= v['duration_seconds'] < 300]
-                    long_videos = [v for v in videos if v.get('duration_seconds') and v['duration_seconds'] >= 300]
-
-                    # CRITICAL FIX: Show sum count for Duration section
-                    total_duration_videos = len(short_videos) + len(medium_videos) + len(long_videos)
-                    duration_count = QStandardItem(str(total_duration_videos))
-                    duration_count.setEditable(False)
-                    duration_count.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    duration_count.setForeground(QColor("#888888"))
-                    root_name_item.appendRow([duration_parent, duration_count])
-
-                    # Short videos (< 30s)
-                    short_item = QStandardItem("Short (< 30s)")
-                    short_item.setEditable(False)
-                    short_item.setData("videos_duration", Qt.UserRole)
-                    short_item.setData("short", Qt.UserRole + 1)
-                    short_count = QStandardItem(str(len(short_videos)))
-                    short_count.setEditable(False)
-                    short_count.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    short_count.setForeground(QColor("#888888"))
-                    duration_parent.appendRow([short_item, short_count])
-
-                    # Medium videos (30s - 5min)
-                    medium_item = QStandardItem("Medium (30s - 5min)")
-                    medium_item.setEditable(False)
-                    medium_item.setData("videos_duration", Qt.UserRole)
-                    medium_item.setData("medium", Qt.UserRole + 1)
-                    medium_count = QStandardItem(str(len(medium_videos)))
-                    medium_count.setEditable(False)
-                    medium_count.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    medium_count.setForeground(QColor("#888888"))
-                    duration_parent.appendRow([medium_item, medium_count])
-
-                    # Long videos (> 5min)
-                    long_item = QStandardItem("Long (> 5min)")
-                    long_item.setEditable(False)
-                    long_item.setData("videos_duration", Qt.UserRole)
-                    long_item.setData("long", Qt.UserRole + 1)
-                    long_count = QStandardItem(str(len(long_videos)))
-                    long_count.setEditable(False)
-                    long_count.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    long_count.setForeground(QColor("#888888"))
-                    duration_parent.appendRow([long_item, long_count])
-
-                    # 📺 Filter by Resolution
-                    res_parent = QStandardItem("📺 By Resolution")
-                    res_parent.setEditable(False)
-
-                    # Count videos by resolution (require both width and height metadata)
-                    sd_videos = [v for v in videos if v.get('width') and v.get('height') and v['height'] < 720]
-                    hd_videos = [v for v in videos if v.get('width') and v.get('height') and 720 <= v['height'] < 1080]
-                    fhd_videos = [v for v in videos if v.get('width') and v.get('height') and 1080 <= v['height'] < 2160]
-                    uhd_videos = [v for v in videos if v.get('width') and v.get('height') and v['height'] >= 2160]
-
-                    # CRITICAL FIX: Show sum count for Resolution section
-                    total_res_videos = len(sd_videos) + len(hd_videos) + len(fhd_videos) + len(uhd_videos)
-                    res_count = QStandardItem(str(total_res_videos))
-                    res_count.setEditable(False)
-                    res_count.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    res_count.setForeground(QColor("#888888"))
-                    root_name_item.appendRow([res_parent, res_count])
-
-                    # SD videos (< 720p)
-                    sd_item = QStandardItem("SD (< 720p)")
-                    sd_item.setEditable(False)
-                    sd_item.setData("videos_resolution", Qt.UserRole)
-                    sd_item.setData("sd", Qt.UserRole + 1)
-                    sd_cnt = QStandardItem(str(len(sd_videos)))
-                    sd_cnt.setEditable(False)
-                    sd_cnt.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    sd_cnt.setForeground(QColor("#888888"))
-                    res_parent.appendRow([sd_item, sd_cnt])
-
-                    # HD videos (720p)
-                    hd_item = QStandardItem("HD (720p)")
-                    hd_item.setEditable(False)
-                    hd_item.setData("videos_resolution", Qt.UserRole)
-                    hd_item.setData("hd", Qt.UserRole + 1)
-                    hd_cnt = QStandardItem(str(len(hd_videos)))
-                    hd_cnt.setEditable(False)
-                    hd_cnt.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    hd_cnt.setForeground(QColor("#888888"))
-                    res_parent.appendRow([hd_item, hd_cnt])
-
-                    # Full HD videos (1080p)
-                    fhd_item = QStandardItem("Full HD (1080p)")
-                    fhd_item.setEditable(False)
-                    fhd_item.setData("videos_resolution", Qt.UserRole)
-                    fhd_item.setData("fhd", Qt.UserRole + 1)
-                    fhd_cnt = QStandardItem(str(len(fhd_videos)))
-                    fhd_cnt.setEditable(False)
-                    fhd_cnt.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    fhd_cnt.setForeground(QColor("#888888"))
-                    res_parent.appendRow([fhd_item, fhd_cnt])
-
-                    # 4K videos (2160p+)
-                    uhd_item = QStandardItem("4K (2160p+)")
-                    uhd_item.setEditable(False)
-                    uhd_item.setData("videos_resolution", Qt.UserRole)
-                    uhd_item.setData("4k", Qt.UserRole + 1)
-                    uhd_cnt = QStandardItem(str(len(uhd_videos)))
-                    uhd_cnt.setEditable(False)
-                    uhd_cnt.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    uhd_cnt.setForeground(QColor("#888888"))
-                    res_parent.appendRow([uhd_item, uhd_cnt])
-
-                    # 🎞️ Filter by Codec (Option 7)
-                    codec_parent = QStandardItem("🎞️ By Codec")
-                    codec_parent.setEditable(False)
-
-                    # Count videos by codec
-                    h264_videos = [v for v in videos if v.get('codec') and v['codec'].lower() in ['h264', 'avc']]
-                    hevc_videos = [v for v in videos if v.get('codec') and v['codec'].lower() in ['hevc', 'h265']]
-                    vp9_videos = [v for v in videos if v.get('codec') and v['codec'].lower() == 'vp9']
-                    av1_videos = [v for v in videos if v.get('codec') and v['codec'].lower() == 'av1']
-                    mpeg4_videos = [v for v in videos if v.get('codec') and v['codec'].lower() in ['mpeg4', 'xvid', 'divx']]
-
-                    # CRITICAL FIX: Show sum count for Codec section
-                    total_codec_videos = len(h264_videos) + len(hevc_videos) + len(vp9_videos) + len(av1_videos) + len(mpeg4_videos)
-                    codec_count = QStandardItem(str(total_codec_videos))
-                    codec_count.setEditable(False)
-                    codec_count.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    codec_count.setForeground(QColor("#888888"))
-                    root_name_item.appendRow([codec_parent, codec_count])
-
-                    # H.264
-                    h264_item = QStandardItem("H.264 / AVC")
-                    h264_item.setEditable(False)
-                    h264_item.setData("videos_codec", Qt.UserRole)
-                    h264_item.setData("h264", Qt.UserRole + 1)
-                    h264_cnt = QStandardItem(str(len(h264_videos)))
-                    h264_cnt.setEditable(False)
-                    h264_cnt.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    h264_cnt.setForeground(QColor("#888888"))
-                    codec_parent.appendRow([h264_item, h264_cnt])
-
-                    # H.265 / HEVC
-                    hevc_item = QStandardItem("H.265 / HEVC")
-                    hevc_item.setEditable(False)
-                    hevc_item.setData("videos_codec", Qt.UserRole)
-                    hevc_item.setData("hevc", Qt.UserRole + 1)
-                    hevc_cnt = QStandardItem(str(len(hevc_videos)))
-                    hevc_cnt.setEditable(False)
-                    hevc_cnt.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    hevc_cnt.setForeground(QColor("#888888"))
-                    codec_parent.appendRow([hevc_item, hevc_cnt])
-
-                    # VP9
-                    vp9_item = QStandardItem("VP9")
-                    vp9_item.setEditable(False)
-                    vp9_item.setData("videos_codec", Qt.UserRole)
-                    vp9_item.setData("vp9", Qt.UserRole + 1)
-                    vp9_cnt = QStandardItem(str(len(vp9_videos)))
-                    vp9_cnt.setEditable(False)
-                    vp9_cnt.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    vp9_cnt.setForeground(QColor("#888888"))
-                    codec_parent.appendRow([vp9_item, vp9_cnt])
-
-                    # AV1
-                    av1_item = QStandardItem("AV1")
-                    av1_item.setEditable(False)
-                    av1_item.setData("videos_codec", Qt.UserRole)
-                    av1_item.setData("av1", Qt.UserRole + 1)
-                    av1_cnt = QStandardItem(str(len(av1_videos)))
-                    av1_cnt.setEditable(False)
-                    av1_cnt.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    av1_cnt.setForeground(QColor("#888888"))
-                    codec_parent.appendRow([av1_item, av1_cnt])
-
-                    # MPEG-4
-                    mpeg4_item = QStandardItem("MPEG-4")
-                    mpeg4_item.setEditable(False)
-                    mpeg4_item.setData("videos_codec", Qt.UserRole)
-                    mpeg4_item.setData("mpeg4", Qt.UserRole + 1)
-                    mpeg4_cnt = QStandardItem(str(len(mpeg4_videos)))
-                    mpeg4_cnt.setEditable(False)
-                    mpeg4_cnt.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    mpeg4_cnt.setForeground(QColor("#888888"))
-                    codec_parent.appendRow([mpeg4_item, mpeg4_cnt])
-
-                    # 📦 Filter by File Size (Option 7)
-                    size_parent = QStandardItem("📦 By File Size")
-                    size_parent.setEditable(False)
-
-                    # Count videos by file size
-                    small_videos = [v for v in videos if v.get('size_kb') and v['size_kb'] / 1024 < 100]
-                    medium_size_videos = [v for v in videos if v.get('size_kb') and 100 <= v['size_kb'] / 1024 < 1024]
-                    large_videos = [v for v in videos if v.get('size_kb') and 1024 <= v['size_kb'] / 1024 < 5120]
-                    xlarge_videos = [v for v in videos if v.get('size_kb') and v['size_kb'] / 1024 >= 5120]
-
-                    # CRITICAL FIX: Show sum count for File Size section
-                    total_size_videos = len(small_videos) + len(medium_size_videos) + len(large_videos) + len(xlarge_videos)
-                    size_count = QStandardItem(str(total_size_videos))
-                    size_count.setEditable(False)
-                    size_count.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    size_count.setForeground(QColor("#888888"))
-                    root_name_item.appendRow([size_parent, size_count])
-
-                    # Small (< 100MB)
-                    small_size_item = QStandardItem("Small (< 100MB)")
-                    small_size_item.setEditable(False)
-                    small_size_item.setData("videos_size", Qt.UserRole)
-                    small_size_item.setData("small", Qt.UserRole + 1)
-                    small_size_cnt = QStandardItem(str(len(small_videos)))
-                    small_size_cnt.setEditable(False)
-                    small_size_cnt.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    small_size_cnt.setForeground(QColor("#888888"))
-                    size_parent.appendRow([small_size_item, small_size_cnt])
-
-                    # Medium (100MB - 1GB)
-                    medium_size_item = QStandardItem("Medium (100MB - 1GB)")
-                    medium_size_item.setEditable(False)
-                    medium_size_item.setData("videos_size", Qt.UserRole)
-                    medium_size_item.setData("medium", Qt.UserRole + 1)
-                    medium_size_cnt = QStandardItem(str(len(medium_size_videos)))
-                    medium_size_cnt.setEditable(False)
-                    medium_size_cnt.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    medium_size_cnt.setForeground(QColor("#888888"))
-                    size_parent.appendRow([medium_size_item, medium_size_cnt])
-
-                    # Large (1GB - 5GB)
-                    large_size_item = QStandardItem("Large (1GB - 5GB)")
-                    large_size_item.setEditable(False)
-                    large_size_item.setData("videos_size", Qt.UserRole)
-                    large_size_item.setData("large", Qt.UserRole + 1)
-                    large_size_cnt = QStandardItem(str(len(large_videos)))
-                    large_size_cnt.setEditable(False)
-                    large_size_cnt.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    large_size_cnt.setForeground(QColor("#888888"))
-                    size_parent.appendRow([large_size_item, large_size_cnt])
-
-                    # XLarge (> 5GB)
-                    xlarge_size_item = QStandardItem("XLarge (> 5GB)")
-                    xlarge_size_item.setEditable(False)
-                    xlarge_size_item.setData("videos_size", Qt.UserRole)
-                    xlarge_size_item.setData("xlarge", Qt.UserRole + 1)
-                    xlarge_size_cnt = QStandardItem(str(len(xlarge_videos)))
-                    xlarge_size_cnt.setEditable(False)
-                    xlarge_size_cnt.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    xlarge_size_cnt.setForeground(QColor("#888888"))
-                    size_parent.appendRow([xlarge_size_item, xlarge_size_cnt])
+                    # PERFORMANCE: Filter groups are added with a lazy placeholder row;
+                    # their leaves are only built on first expand (see _add_lazy_children)
+                    video_groups = [
+                        ("⏱️ By Duration", "videos_duration", [
+                            ("Short (< 30s)", "short", vcounts['short']),
+                            ("Medium (30s - 5min)", "medium", vcounts['medium']),
+                            ("Long (> 5min)", "long", vcounts['long']),
+                        ]),
+                        ("📺 By Resolution", "videos_resolution", [
+                            ("SD (< 720p)", "sd", vcounts['sd']),
+                            ("HD (720p)", "hd", vcounts['hd']),
+                            ("Full HD (1080p)", "fhd", vcounts['fhd']),
+                            ("4K (2160p+)", "4k", vcounts['uhd']),
+                        ]),
+                        ("🎞️ By Codec", "videos_codec", [
+                            ("H.264 / AVC", "h264", vcounts['h264']),
+                            ("H.265 / HEVC", "hevc", vcounts['hevc']),
+                            ("VP9", "vp9", vcounts['vp9']),
+                            ("AV1", "av1", vcounts['av1']),
+                            ("MPEG-4", "mpeg4", vcounts['mpeg4']),
+                        ]),
+                        ("📦 By File Size", "videos_size", [
+                            ("Small (< 100MB)", "small", vcounts['small']),
+                            ("Medium (100MB - 1GB)", "medium", vcounts['medium_size']),
+                            ("Large (1GB - 5GB)", "large", vcounts['large']),
+                            ("XLarge (> 5GB)", "xlarge", vcounts['xlarge']),
+                        ]),
+                    ]
+                    for group_label, group_mode, leaves in video_groups:
+                        if not _SHOW_EMPTY_VIDEO_BUCKETS:
+                            leaves = [leaf for leaf in leaves if leaf[2]]
+                            if not leaves:
+                                continue
+                        group_parent = QStandardItem(group_label)
+                        group_parent.setEditable(False)
+
+                        # CRITICAL FIX: Show sum count for each filter group
+                        group_count = _make_count_item(str(sum(cnt for _, _, cnt in leaves)))
+                        root_name_item.appendRow([group_parent, group_count])
+                        self._add_lazy_children(
+                            group_parent,
+                            lambda p, m=group_mode, l=leaves: self._append_video_leaves(p, m, l)
+                        )
 
                     # 📅 Filter by Date - Full Year/Month/Day Hierarchy for Videos
                     date_parent = QStandardItem("📅 By Date")
                     date_parent.setEditable(False)
 
                     # Get video date hierarchy: {year: {month: [days...]}}
-                    try:
-                        video_hier = self.db.get_video_date_hierarchy(self.project_id) or {}
-                    except Exception as e:
-                        print(f"[Sidebar] Failed to get video date hierarchy: {e}")
-                        video_hier = {}
-
-                    # Count total videos with dates
-                    total_dated_videos = sum(
-                        self.db.count_videos_for_year(year, self.project_id)
-                        for year in video_hier.keys()
-                    ) if video_hier else 0
-
-                    # Build full year/month/day hierarchy (like photos)
-                    for year in sorted(video_hier.keys(), key=lambda y: int(str(y)), reverse=True):
-                        # Year node
-                        year_count = self.db.count_videos_for_year(year, self.project_id)
-                        year_item = QStandardItem(str(year))
-                        year_item.setEditable(False)
-                        year_item.setData("videos_year", Qt.UserRole)
-                        year_item.setData(year, Qt.UserRole + 1)
-
-                        year_cnt = QStandardItem(str(year_count))
-                        year_cnt.setEditable(False)
-                        year_cnt.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                        year_cnt.setForeground(QColor("#888888"))
-
-                        date_parent.appendRow([year_item, year_cnt])
-
-                        # Month nodes under year
-                        months = video_hier[year]
-                        for month in sorted(months.keys(), key=lambda m: int(str(m))):
-                            month_label = f"{int(month):02d}"
-                            month_count = self.db.count_videos_for_month(year, month, self.project_id)
-                            month_item = QStandardItem(month_label)
-                            month_item.setEditable(False)
-                            month_item.setData("videos_month", Qt.UserRole)
-                            month_item.setData(f"{year}-{month_label}", Qt.UserRole + 1)
-                            month_cnt = QStandardItem(str(month_count))
-                            month_cnt.setEditable(False)
-                            month_cnt.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                            month_cnt.setForeground(QColor("#888888"))
-                            year_item.appendRow([month_item, month_cnt])
-
-                            # Day nodes under month
-                            days = months[month]
-                            day_numbers = set()
-                            for ymd in days:
-                                try:
-                                    parts = ymd.split("-")
-                                    if len(parts) == 3:
-                                        day_numbers.add(int(parts[2]))
-                                except:
-                                    pass
+                    if video_hier is None:
+                        try:
+                            video_hier = self.db.get_video_date_hierarchy(self.project_id) or {}
+                        except Exception as e:
+                            logger.warning(f"Failed to get video date hierarchy: {e}")
+                            video_hier = {}
+                            videos_sig = None  # don't cache a partial result
 
-                            for day in sorted(day_numbers):
-                                day_label = f"{day:02d}"
-                                ymd = f"{year}-{month_label}-{day_label}"
-                                day_count = self.db.count_videos_for_day(ymd, self.project_id)
-                                day_item = QStandardItem(day_label)
-                                day_item.setEditable(False)
-                                day_item.setData("videos_day", Qt.UserRole)
-                                day_item.setData(ymd, Qt.UserRole + 1)
-                                day_cnt = QStandardItem(str(day_count))
-                                day_cnt.setEditable(False)
-                                day_cnt.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                                day_cnt.setForeground(QColor("#888888"))
-                                month_item.appendRow([day_item, day_cnt])
+                    # Year counts are needed for the group total; month and day
+                    # counts are only queried when their parent is expanded
+                    if all_year_counts is None:
+                        try:
+                            all_year_counts = self.db.count_videos_by_year(self.project_id)
+                        except Exception as e:
+                            logger.warning(f"Failed to count videos by year: {e}")
+                            all_year_counts = {}
+                            videos_sig = None  # don't cache a partial result
+                    year_counts = {year: all_year_counts.get(year, 0) for year in video_hier}
+                    total_dated_videos = sum(year_counts.values())
 
                     # Set total count on date parent
-                    date_count = QStandardItem(str(total_dated_videos))
-                    date_count.setEditable(False)
-                    date_count.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                    date_count.setForeground(QColor("#888888"))
+                    date_count = _make_count_item(str(total_dated_videos))
                     root_name_item.appendRow([date_parent, date_count])
+                    if video_hier:
+                        self._add_lazy_children(
+                            date_parent,
+                            lambda p, h=video_hier, yc=year_counts: self._append_video_years(p, h, yc)
+                        )
 
                     # Log the hierarchy build (for debugging)
                     year_count_total = len(video_hier)
                     month_count_total = sum(len(months) for months in video_hier.values())
-                    print(f"[VideoDateHierarchy] Building: {year_count_total} years, {month_count_total} months, {total_dated_videos} videos")
+                    logger.debug(f"[VideoDateHierarchy] Building: {year_count_total} years, {month_count_total} months, {total_dated_videos} videos")
 
                     # 🔍 Search Videos
                     search_item = QStandardItem("🔍 Search Videos...")
@@ -2867,7 +2853,10 @@ class SidebarQt(QWidget):
                     search_count.setEditable(False)
                     root_name_item.appendRow([search_item, search_count])
 
-                    print(f"[Sidebar] Added 🎬 Videos section with {total_videos} videos and filters.")
+                    logger.debug(f"Added 🎬 Videos section with {total_videos} videos and filters.")
+
+                if videos_sig is not None and vcounts is not None:
+                    self._videos_cache = (videos_sig, (vcounts, video_hier, all_year_counts))
                 # <<< NEW
 
                 # ---------------------------------------------------------
@@ -2876,7 +2865,7 @@ class SidebarQt(QWidget):
                 try:
                     clusters = self.db.get_face_clusters(self.project_id)
                 except Exception as e:
-                    print("[Sidebar] get_face_clusters failed:", e)
+                    logger.warning(f"get_face_clusters failed: {e}")
                     clusters = []
 
                 # Create People root
@@ -2884,7 +2873,7 @@ class SidebarQt(QWidget):
                 people_count_item = QStandardItem("")
                 people_root.setEditable(False)
                 people_count_item.setEditable(False)
-                self.model.appendRow([people_root, people_count_item])
+                self._append_root([people_root, people_count_item])
 
                 if clusters:
                     total_faces = 0
@@ -2957,7 +2946,7 @@ class SidebarQt(QWidget):
                                 if pixmap.loadFromData(QByteArray(rep_thumb_png)):
                                     icon_loaded = True
                             except Exception as e:
-                                print("[Sidebar] PNG icon load failed:", e)
+                                logger.warning(f"PNG icon load failed: {e}")
                                 pixmap = None
 
                         # Fall back to file path with EXIF correction
@@ -2992,16 +2981,14 @@ class SidebarQt(QWidget):
                         if icon_loaded and pixmap and not pixmap.isNull():
                             circular = make_circular_pixmap(pixmap, 32)
                             name_item.setIcon(QIcon(circular))
+                            self._tree_has_icons = True
 
                         # Set mode + cluster ID (unified)
                         name_item.setData("people", Qt.UserRole)
                         name_item.setData(f"facecluster:{cluster_id}", Qt.UserRole + 1)
 
                         # Count item
-                        count_item = QStandardItem(str(count) if count > 0 else "")
-                        count_item.setEditable(False)
-                        count_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                        count_item.setForeground(QColor("#888888"))
+                        count_item = _make_count_item(max(count, 0))
 
                         people_root.appendRow([name_item, count_item])
 
@@ -3012,7 +2999,7 @@ class SidebarQt(QWidget):
                     # No clusters or no faces
                     status_item = QStandardItem("ℹ️ No faces detected")
                     status_item.setEditable(False)
-                    status_item.setForeground(QColor("#888888"))
+                    status_item.setForeground(_COUNT_FG_DIM)
                     status_item.setData("people", Qt.UserRole)
                     people_root.appendRow([status_item, QStandardItem("")])
 
@@ -3024,24 +3011,24 @@ class SidebarQt(QWidget):
                     from services.device_sources import scan_mobile_devices
 
                     # Scan for mounted mobile devices (with device registration)
-                    print("\n[Sidebar] ===== Initiating mobile device scan from sidebar =====")
-                    print(f"[Sidebar] Database: {self.db}")
-                    print(f"[Sidebar] Register devices: True")
+                    logger.debug("===== Initiating mobile device scan from sidebar =====")
+                    logger.debug(f"Database: {self.db}")
+                    logger.debug(f"Register devices: True")
                     mobile_devices = scan_mobile_devices(db=self.db, register_devices=True)
-                    print(f"[Sidebar] ===== Scan complete: {len(mobile_devices)} mobile device(s) found =====")
+                    logger.debug(f"===== Scan complete: {len(mobile_devices)} mobile device(s) found =====")
 
                     if mobile_devices:
                         for i, dev in enumerate(mobile_devices, 1):
-                            print(f"[Sidebar]   Device {i}: {dev.label}")
-                            print(f"[Sidebar]     - Root path: {dev.root_path}")
-                            print(f"[Sidebar]     - Device ID: {dev.device_id}")
-                            print(f"[Sidebar]     - Device type: {dev.device_type}")
-                            print(f"[Sidebar]     - Folders: {len(dev.folders)}")
+                            logger.debug(f"Device {i}: {dev.label}")
+                            logger.debug(f"- Root path: {dev.root_path}")
+                            logger.debug(f"- Device ID: {dev.device_id}")
+                            logger.debug(f"- Device type: {dev.device_type}")
+                            logger.debug(f"- Folders: {len(dev.folders)}")
                             for folder in dev.folders:
-                                print(f"[Sidebar]       • {folder.name} ({folder.photo_count} files)")
+                                logger.debug(f"• {folder.name} ({folder.photo_count} files)")
                     else:
-                        print("[Sidebar]   ✗ No devices found")
-                    print("[Sidebar] ===== End device scan =====\n")
+                        logger.debug("✗ No devices found")
+                    logger.debug("===== End device scan =====")
 
                     # Update device count for auto-refresh tracking
                     self._last_device_count = len(mobile_devices)
@@ -3051,8 +3038,8 @@ class SidebarQt(QWidget):
                     devices_root = QStandardItem("📱 Mobile Devices")
                     devices_root.setEditable(False)
                     devices_root.setData("mobile_devices_root", Qt.UserRole)
-                    devices_count_item = _make_count_item("")
-                    self.model.appendRow([devices_root, devices_count_item])
+                    devices_count_item = _make_count_item("", _COUNT_FG)
+                    self._append_root([devices_root, devices_count_item])
 
                     if mobile_devices:
                         # Devices found - show them with history
@@ -3114,10 +3101,10 @@ class SidebarQt(QWidget):
                                                     last_import_info = "Never imported from this device"
                                                     status_icon = "⚪"
                                             except Exception as e:
-                                                print(f"[Sidebar] Error parsing date: {e}")
+                                                logger.warning(f"Error parsing date: {e}")
 
                                 except Exception as e:
-                                    print(f"[Sidebar] Error getting device history: {e}")
+                                    logger.warning(f"Error getting device history: {e}")
 
                             # Create device item with status icon
                             device_label = f"{status_icon} {device.label}" if status_icon else device.label
@@ -3147,7 +3134,7 @@ class SidebarQt(QWidget):
                             device_photo_count = sum(folder.photo_count for folder in device.folders)
                             total_device_photos += device_photo_count
 
-                            device_count_item = _make_count_item(device_photo_count if device_photo_count > 0 else "")
+                            device_count_item = _make_count_item(device_photo_count, _COUNT_FG)
                             devices_root.appendRow([device_item, device_count_item])
 
                             # Add device folders as children
@@ -3158,13 +3145,13 @@ class SidebarQt(QWidget):
                                 folder_item.setData("device_folder", Qt.UserRole)
                                 folder_item.setData(folder.path, Qt.UserRole + 1)
 
-                                folder_count_item = _make_count_item(folder.photo_count if folder.photo_count > 0 else "")
+                                folder_count_item = _make_count_item(folder.photo_count, _COUNT_FG)
                                 device_item.appendRow([folder_item, folder_count_item])
 
                             # Add deep scan button under device (after all folders)
                             deep_scan_item = QStandardItem("  🔍 Run Deep Scan...")
                             deep_scan_item.setEditable(False)
-                            deep_scan_item.setForeground(QColor("#0066CC"))  # Blue color to indicate action
+                            deep_scan_item.setForeground(_LINK_FG)  # Blue color to indicate action
                             deep_scan_item.setData("device_deep_scan", Qt.UserRole)
                             deep_scan_item.setData(device.root_path, Qt.UserRole + 1)  # Store root path for scanning
                             deep_scan_item.setData(device.device_type, Qt.UserRole + 2)  # Store device type
@@ -3174,25 +3161,25 @@ class SidebarQt(QWidget):
 
                         # Set total count on root
                         devices_count_item.setText(str(total_device_photos) if total_device_photos > 0 else "")
-                        print(f"[Sidebar] Added Mobile Devices section with {len(mobile_devices)} devices, {total_device_photos} total photos")
+                        logger.debug(f"Added Mobile Devices section with {len(mobile_devices)} devices, {total_device_photos} total photos")
                     else:
                         # No devices found - show helpful message
                         no_devices_item = QStandardItem("  No devices detected")
                         no_devices_item.setEditable(False)
-                        no_devices_item.setForeground(QColor("#888888"))
+                        no_devices_item.setForeground(_COUNT_FG_DIM)
                         no_devices_item.setData("no_devices", Qt.UserRole)
                         devices_root.appendRow([no_devices_item, QStandardItem("")])
 
                         help_item = QStandardItem("  → Right-click for help")
                         help_item.setEditable(False)
-                        help_item.setForeground(QColor("#0066CC"))
+                        help_item.setForeground(_LINK_FG)
                         help_item.setData("no_devices_help", Qt.UserRole)
                         devices_root.appendRow([help_item, QStandardItem("")])
 
-                        print("[Sidebar] No mobile devices detected - added help message")
+                        logger.debug("No mobile devices detected - added help message")
 
                 except Exception as e:
-                    print(f"[Sidebar] Failed to scan mobile devices: {e}")
+                    logger.warning(f"Failed to scan mobile devices: {e}")
                     import traceback
                     traceback.print_exc()
 
@@ -3200,17 +3187,17 @@ class SidebarQt(QWidget):
                     devices_root = QStandardItem("📱 Mobile Devices")
                     devices_root.setEditable(False)
                     devices_root.setData("mobile_devices_root", Qt.UserRole)
-                    self.model.appendRow([devices_root, QStandardItem("")])
+                    self._append_root([devices_root, QStandardItem("")])
 
                     error_item = QStandardItem(f"  ⚠️ Scan failed: {str(e)[:50]}")
                     error_item.setEditable(False)
-                    error_item.setForeground(QColor("#CC0000"))
+                    error_item.setForeground(_ERROR_FG)
                     error_item.setData("device_error", Qt.UserRole)
                     devices_root.appendRow([error_item, QStandardItem("")])
 
                     help_item = QStandardItem("  → Right-click for help")
                     help_item.setEditable(False)
-                    help_item.setForeground(QColor("#0066CC"))
+                    help_item.setForeground(_LINK_FG)
                     help_item.setData("no_devices_help", Qt.UserRole)
                     devices_root.appendRow([help_item, QStandardItem("")])
 
@@ -3218,19 +3205,32 @@ class SidebarQt(QWidget):
                 # NEW POSITION: Build Tags AFTER Mobile Devices
                 # ---------------------------------------------------------
                 self._build_tag_section()
-
-                for r in range(self.model.rowCount()):
-                    idx = self.model.index(r, 0)
-                    self.tree.expand(idx)
-
-                # Force column width recalculation after building tree
-                QTimer.singleShot(0, self._recalculate_columns)
             except Exception as e:
                 QMessageBox.warning(self, "Load Error", f"Failed to build navigation:\n{e}")
 
+            # Attach the fresh model to the tree view
+            logger.debug("Attaching fresh model to tree view")
+            self.tree.setUpdatesEnabled(False)
+            try:
+                # PERFORMANCE: Without face thumbnails every row is one text line high, so
+                # the view can skip per-row height queries; 32px face icons need them
+                self.tree.setUniformRowHeights(not self._tree_has_icons)
+                self.tree.setModel(self.model)
+                if expanded_state is None:
+                    # PERFORMANCE: One expandToDepth() call lays out all sections at once
+                    # instead of relaying out the view after every expand(idx).
+                    self.tree.expandToDepth(0)
+                else:
+                    self._restore_expanded(expanded_state)
+            finally:
+                self.tree.setUpdatesEnabled(True)
+
+            # Force column width recalculation after building tree
+            self._recalc_timer.start()
+
             # populate branch counts asynchronously while folder counts are already set
             if self._count_targets:
-                print(f"[Sidebar] starting async count population for {len(self._count_targets)} branch targets")
+                logger.debug(f"starting async count population for {len(self._count_targets)} branch targets")
                 self._async_populate_counts()
 
         finally:
@@ -3244,69 +3244,27 @@ class SidebarQt(QWidget):
         for row in rows:
             name = row["name"]
             fid = row["id"]
-            name_item = QStandardItem(f"📁 {name}")
-            count_item = QStandardItem("")
-            name_item.setEditable(False)
-            count_item.setEditable(False)
-            name_item.setData("folder", Qt.UserRole)
-            name_item.setData(fid, Qt.UserRole + 1)
-            count_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            count_item.setForeground(QColor("#888888"))
+            name_item = _make_leaf_item(f"📁 {name}", "folder", fid)
+            count_item = _make_count_item()
             parent_item.appendRow([name_item, count_item])
             # register for async, but tree-mode uses _add_folder_items synchronous
             self._count_targets.append(("folder", fid, name_item, count_item))
+            self._key_index[("folder", fid)] = (name_item, count_item)
             self._add_folder_items_async(name_item, fid)
 
 
     def _apply_counts(self, results):  # with async_populate_counts_priorFix
+        """Set count texts for [(name_item, count_item, cnt)]; count_item is always a QStandardItem."""
         try:
             for name_item, count_item, cnt in results:
-                try:
-                    text = str(cnt) if cnt is not None else ""
-                    if isinstance(count_item, QStandardItem):
-                        try:
-                            count_item.setText(text)
-                        except Exception:
-                            try:
-                                idx = count_item.index()
-                                if idx.isValid():
-                                    self.model.setData(idx, text)
-                            except Exception:
-                                pass
-                        continue
-                    if count_item is not None and hasattr(count_item, "setText") and not isinstance(count_item, QStandardItem):
-                        try:
-                            count_item.setText(1, text)
-                        except Exception:
-                            pass
-                        continue
-                    if name_item is not None:
-                        try:
-                            if isinstance(name_item, QStandardItem):
-                                idx = name_item.index()
-                                if idx.isValid():
-                                    sibling_idx = idx.sibling(idx.row(), 1)
-                                    self.model.setData(sibling_idx, text)
-                                    continue
-                        except Exception:
-                            pass
-                        try:
-                            if hasattr(name_item, "setText") and not isinstance(name_item, QStandardItem):
-                                name_item.setText(1, text)
-                                continue
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-            try:
-                self.tree.viewport().update()
-            except Exception:
-                pass
+                count_item.setText("" if cnt is None else str(cnt))
+                self._note_count_text(count_item.text())
+            self.tree.viewport().update()
 
             # Recalculate columns after count updates
-            QTimer.singleShot(0, self._recalculate_columns)
+            self._recalc_timer.start()
 
-            print("[Sidebar][counts applied] updated UI with counts")
+            logger.debug("[counts applied] updated UI with counts")
         except Exception:
             traceback.print_exc()
 
@@ -3314,7 +3272,7 @@ class SidebarQt(QWidget):
     def _async_populate_counts(self):
         targets = list(self._count_targets)
         if not targets:
-            print("[Sidebar][counts] no targets to populate")
+            logger.debug("[counts] no targets to populate")
             return
 
         # Bump generation to invalidate any previous workers
@@ -3322,59 +3280,17 @@ class SidebarQt(QWidget):
         current_gen = self._list_worker_gen
 
         # CRITICAL FIX: Extract only data (typ, key), NOT Qt objects, before passing to worker
-        data_only = [(typ, key) for typ, key, name_item, count_item in targets]
+        # PERFORMANCE: Sorted by (type, key) so per-key fallback queries walk the
+        # branch_key / folder_id indexes in order; results are matched back by key.
+        data_only = sorted({(typ, key) for typ, key, name_item, count_item in targets})
 
-        def worker():
-            results = []
-            try:
-                print(f"[Sidebar][counts worker gen={current_gen}] running for {len(data_only)} targets...")
-                # Work only with data, NO Qt objects in worker thread
-                for typ, key in data_only:
-                    try:
-                        cnt = 0
-                        if typ == "branch":
-                            # DEBUG: Check if project_id is set
-                            if self.project_id is None:
-                                print(f"[Sidebar][counts worker] WARNING: project_id is None for branch '{key}'")
-                            if hasattr(self.db, "count_images_by_branch"):
-                                cnt = int(self.db.count_images_by_branch(self.project_id, key) or 0)
-                            else:
-                                rows = self.db.get_images_by_branch(self.project_id, key) or []
-                                cnt = len(rows)
-                            # DEBUG: Log count result for date branches
-                            if key.startswith("by_date:"):
-                                print(f"[Sidebar][counts worker] Date branch '{key}' has {cnt} photos")
-
-                        elif typ == "folder":
-                            # Use recursive count including all subfolders
-                            if hasattr(self.db, "get_image_count_recursive"):
-                                cnt = int(self.db.get_image_count_recursive(key) or 0)
-                            elif hasattr(self.db, "count_for_folder"):
-                                cnt = int(self.db.count_for_folder(key, project_id=self.project_id) or 0)
-                            else:
-                                with self.db._connect() as conn:
-                                    cur = conn.cursor()
-                                    cur.execute("SELECT COUNT(*) FROM photo_metadata WHERE folder_id=?", (key,))
-                                    v = cur.fetchone()
-                                    cnt = int(v[0]) if v else 0
-
-                        # IMPORTANT: Only pass data (typ, key, cnt), NOT Qt objects
-                        results.append((typ, key, cnt))
-                    except Exception:
-                        traceback.print_exc()
-                        results.append((typ, key, 0))
-                print(f"[Sidebar][counts worker gen={current_gen}] finished scanning targets, scheduling UI update")
-            except Exception:
-                traceback.print_exc()
-            # Schedule UI update in main thread with generation check
-            QTimer.singleShot(0, lambda: self._apply_counts_defensive(results, current_gen))
-
-        threading.Thread(target=worker, daemon=True).start()
+        # PERFORMANCE: Reuse pooled threads instead of starting a new OS thread per rebuild
+        QThreadPool.globalInstance().start(_CountWorker(self, data_only, current_gen))
 
     def _apply_counts_defensive(self, results, gen=None):
         """
-        Apply counts to UI by finding QStandardItems in model by key.
-        This method runs in the MAIN THREAD (called via QTimer.singleShot).
+        Queue worker counts for the next coalesced flush.
+        This method runs in the MAIN THREAD (delivered via _countsReady).
 
         Args:
             results: List of (typ, key, cnt) tuples from worker thread
@@ -3382,79 +3298,108 @@ class SidebarQt(QWidget):
         """
         # Check if this worker is stale
         if gen is not None and gen != self._list_worker_gen:
-            print(f"[Sidebar][counts] Ignoring stale worker results (gen={gen}, current={self._list_worker_gen})")
+            logger.debug(f"[counts] Ignoring stale worker results (gen={gen}, current={self._list_worker_gen})")
+            return
+
+        for typ, key, cnt in results:
+            self._pending_count_updates[(typ, key)] = cnt
+        if self._pending_count_updates:
+            self._count_flush_timer.start()
+
+    def _flush_count_updates(self):
+        """
+        Write all pending counts into the model with signals blocked, then emit
+        one dataChanged per parent and repaint once.
+        """
+        pending, self._pending_count_updates = self._pending_count_updates, {}
+        if not pending:
             return
 
         # CRITICAL SAFETY: Check if model is detached (being rebuilt)
         # If model is not attached to tree view, skip update to prevent crashes
         if self.tree.model() != self.model:
-            print("[Sidebar][counts] Model is detached (rebuilding), skipping count update")
+            logger.debug("[counts] Model is detached (rebuilding), skipping count update")
             return
 
         # Safety check: ensure model is valid before accessing
         if not self.model or self.model.rowCount() == 0:
-            print("[Sidebar][counts] Model is empty or invalid, skipping count update")
+            logger.debug("[counts] Model is empty or invalid, skipping count update")
             return
 
+        changed = {}  # parent QModelIndex -> [min_row, max_row]
+        updated = 0
+        self.model.blockSignals(True)
         try:
-            for typ, key, cnt in results:
+            for (typ, key), cnt in pending.items():
                 text = str(cnt) if cnt is not None else ""
-
-                # Find the model item by key and update count column
                 try:
-                    found_name, found_count = self._find_model_item_by_key(key)
-
-                    # Try updating count_item directly
-                    if found_count is not None:
-                        try:
-                            found_count.setText(text)
-                            continue
-                        except Exception:
-                            # Fallback: try model-level setData on its index
-                            try:
-                                idx = found_count.index()
-                                if idx.isValid():
-                                    self.model.setData(idx, text)
-                                    continue
-                            except Exception:
-                                pass
-
-                    # Fallback: if only found_name is present, set its sibling column
-                    if found_name is not None:
-                        try:
-                            idx = found_name.index()
-                            if idx.isValid():
-                                sib = idx.sibling(idx.row(), 1)
-                                self.model.setData(sib, text)
-                                continue
-                        except Exception:
-                            pass
-
+                    found_name, found_count = self._find_model_item_by_key(key, typ=typ)
+                    if found_count is None or found_count.text() == text:
+                        continue
+                    found_count.setText(text)
+                    self._note_count_text(text)
+                    updated += 1
+                    idx = found_count.index()
+                    if idx.isValid():
+                        span = changed.setdefault(idx.parent(), [idx.row(), idx.row()])
+                        span[0] = min(span[0], idx.row())
+                        span[1] = max(span[1], idx.row())
                 except Exception:
                     traceback.print_exc()
+        finally:
+            self.model.blockSignals(False)
 
-            # Refresh view to show updated counts
-            try:
-                self.tree.viewport().update()
-            except Exception:
-                pass
+        for parent, (first, last) in changed.items():
+            self.model.dataChanged.emit(self.model.index(first, 1, parent),
+                                        self.model.index(last, 1, parent))
 
+        if changed:
             # Recalculate columns after count updates
-            QTimer.singleShot(0, self._recalculate_columns)
+            self._recalc_timer.start()
 
-            print("[Sidebar][counts applied] updated UI with counts")
-        except Exception:
-            traceback.print_exc()
+        logger.debug(f"[counts applied] updated {updated} count(s)")
 
     def _add_folder_items(self, parent_item, parent_id=None, _folder_counts=None):
-        # CRITICAL FIX: Pass project_id to filter folders and counts by project
-        try:
-            rows = self.db.get_child_folders(parent_id, project_id=self.project_id)
-        except Exception as e:
-            print(f"[Sidebar] Error in get_child_folders: {e}")
-            import traceback
-            traceback.print_exc()
-            rows = []
+        # PERFORMANCE: At root level, read the whole folder table in ONE query and
+        # keep it as a parent -> children map. Only the requested level is turned
+        # into QStandardItems; deeper levels are materialized when a folder is
+        # first expanded (see _on_tree_expanded), so build time no longer grows
+        # with the total folder count.
+        if parent_id is None and _folder_counts is None:
+            self._folder_children = None
+            if self.project_id and hasattr(self.db, "get_folder_tree_with_counts"):
+                # Folders and their recursive counts from a single recursive CTE
+                try:
+                    children = {}
+                    counts = {}
+                    for r in self.db.get_folder_tree_with_counts(self.project_id):
+                        children.setdefault(r["parent_id"], []).append(r)
+                        counts[r["id"]] = r["photo_count"]
+                    self._folder_children = children
+                    _folder_counts = self._folder_counts = counts
+                    logger.debug(f"Loaded {len(counts)} folders with counts in one query")
+                except Exception as e:
+                    logger.warning(f"Error in get_folder_tree_with_counts (falling back to separate queries): {e}")
+            if self._folder_children is None and hasattr(self.db, "get_all_folders"):
+                try:
+                    children = {}
+                    for r in self.db.get_all_folders(project_id=self.project_id):
+                        children.setdefault(r["parent_id"], []).append(r)
+                    self._folder_children = children
+                except Exception as e:
+                    logger.warning(f"Error in get_all_folders (falling back to per-level queries): {e}")
+
+        if getattr(self, "_folder_children", None) is not None:
+            rows = self._folder_children.get(parent_id, [])
+        else:
+            # CRITICAL FIX: Pass project_id to filter folders and counts by project
+            try:
+                rows = self.db.get_child_folders(parent_id, project_id=self.project_id)
+            except Exception as e:
+                logger.warning(f"Error in get_child_folders: {e}")
+                import traceback
+                traceback.print_exc()
+                rows = []
 
         # PERFORMANCE OPTIMIZATION: Get all folder counts in ONE query (only at root level)
         # This dramatically improves performance when there are many folders
@@ -3463,14 +3408,15 @@ class SidebarQt(QWidget):
             if hasattr(self.db, "get_folder_counts_batch") and self.project_id:
                 try:
                     _folder_counts = self.db.get_folder_counts_batch(self.project_id)
-                    print(f"[Sidebar] Loaded {len(_folder_counts)} folder counts in batch (performance optimization)")
+                    logger.debug(f"Loaded {len(_folder_counts)} folder counts in batch (performance optimization)")
                 except Exception as e:
-                    print(f"[Sidebar] Error in get_folder_counts_batch: {e}")
+                    logger.warning(f"Error in get_folder_counts_batch: {e}")
                     import traceback
                     traceback.print_exc()
                     _folder_counts = {}
             else:
                 _folder_counts = {}
+            self._folder_counts = _folder_counts
 
         for row in rows:
             try:
@@ -3486,34 +3432,171 @@ class SidebarQt(QWidget):
                     try:
                         photo_count = int(self.db.get_image_count_recursive(fid, project_id=self.project_id) or 0)
                     except Exception as e:
-                        print(f"[Sidebar] Error in get_image_count_recursive for folder {fid}: {e}")
+                        logger.warning(f"Error in get_image_count_recursive for folder {fid}: {e}")
                         photo_count = 0
                 else:
                     photo_count = self._get_photo_count(fid)
 
-                name_item = QStandardItem(f"📁 {name}")
-                count_item = QStandardItem(str(photo_count))
-                count_item.setText(f"{photo_count:>5}")
-                name_item.setEditable(False)
-                count_item.setEditable(False)
-                name_item.setData("folder", Qt.UserRole)
-                name_item.setData(fid, Qt.UserRole + 1)
-                count_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-                count_item.setForeground(QColor("#888888"))
+                name_item = _make_leaf_item(f"📁 {name}", "folder", fid)
+                count_item = _make_count_item(f"{photo_count:>5}")
                 parent_item.appendRow([name_item, count_item])
-
-                # Recursive call with error handling - pass counts down to avoid re-fetching
-                self._add_folder_items(name_item, fid, _folder_counts)
+                self._key_index[("folder", fid)] = (name_item, count_item)
+
+                if getattr(self, "_folder_children", None) is not None:
+                    # Lazy: a placeholder row keeps the expand arrow until first expand
+                    if self._folder_children.get(fid):
+                        self._add_lazy_children(
+                            name_item,
+                            lambda p, f=fid: self._add_folder_items(p, f, getattr(self, "_folder_counts", None) or {})
+                        )
+                else:
+                    # Recursive call with error handling - pass counts down to avoid re-fetching
+                    self._add_folder_items(name_item, fid, _folder_counts)
             except Exception as e:
-                print(f"[Sidebar] Error adding folder item: {e}")
+                logger.warning(f"Error adding folder item: {e}")
                 import traceback
                 traceback.print_exc()
                 continue
 
+    def _add_lazy_children(self, parent_item, loader):
+        """
+        Defer building parent_item's children until it is first expanded.
+
+        A single placeholder row keeps the expand arrow visible;
+        _on_tree_expanded swaps it for whatever loader(parent_item) appends.
+        """
+        marker = id(loader)
+        self._lazy_loaders[marker] = loader
+        placeholder = QStandardItem("")
+        placeholder.setEditable(False)
+        placeholder.setData("lazy_placeholder", Qt.UserRole)
+        placeholder.setData(marker, Qt.UserRole + 1)
+        parent_item.appendRow([placeholder, QStandardItem("")])
+
+    @staticmethod
+    def _expand_state_key(item, parent_key=None):
+        """
+        Identity of a tree node that survives a rebuild: (mode, key), or for
+        keyless group rows their title under the parent's identity.
+        """
+        key = item.data(Qt.UserRole + 1)
+        if key is not None:
+            return (item.data(Qt.UserRole), key)
+        return ("title", parent_key, item.text().strip())
+
+    def _snapshot_expanded(self):
+        """
+        Keys of all expanded nodes in the current tree, or None when there is no
+        populated tree yet (first build uses the default expansion).
+        """
+        try:
+            if self.model is None or self.model.rowCount() == 0 or self.tree.model() is not self.model:
+                return None
+            state = set()
+            stack = [(self.model.item(r, 0), None) for r in range(self.model.rowCount())]
+            while stack:
+                item, parent_key = stack.pop()
+                # Only expanded nodes can have expanded descendants
+                if item is None or not self.tree.isExpanded(item.index()):
+                    continue
+                key = self._expand_state_key(item, parent_key)
+                state.add(key)
+                stack.extend((item.child(r, 0), key) for r in range(item.rowCount()))
+            return state
+        except Exception as e:
+            logger.warning(f"Could not snapshot tree expand state: {e}")
+            return None
+
+    def _restore_expanded(self, state):
+        """
+        Reopen the nodes recorded by _snapshot_expanded(). Parents are expanded
+        before their children, so lazy children exist by the time they are visited.
+        """
+        stack = [(self.model.item(r, 0), None) for r in range(self.model.rowCount())]
+        while stack:
+            item, parent_key = stack.pop()
+            if item is None:
+                continue
+            key = self._expand_state_key(item, parent_key)
+            if key not in state:
+                continue
+            self.tree.expand(item.index())
+            stack.extend((item.child(r, 0), key) for r in range(item.rowCount()))
+
+    def _on_tree_expanded(self, index):
+        """Materialize lazily added children the first time their parent is expanded."""
+        try:
+            item = self.model.itemFromIndex(index.sibling(index.row(), 0))
+            if item is None or item.rowCount() != 1:
+                return
+            first = item.child(0, 0)
+            if first is None or first.data(Qt.UserRole) != "lazy_placeholder":
+                return
+            loader = self._lazy_loaders.pop(first.data(Qt.UserRole + 1), None)
+            item.removeRow(0)
+            if loader is not None:
+                loader(item)
+                for row in range(item.rowCount()):
+                    count_item = item.child(row, 1)
+                    if count_item is not None:
+                        self._note_count_text(count_item.text())
+        except Exception as e:
+            logger.warning(f"Failed to expand lazy node: {e}")
+
+    def _make_video_row(self, label, mode, key, count):
+        """Build a [name, count] row for a Videos section filter node."""
+        return [_make_leaf_item(label, mode, key), _make_count_item(str(count))]
+
+    def _append_video_leaves(self, parent_item, mode, leaves):
+        """Append filter leaves [(label, key, count), ...] under a Videos filter group."""
+        for label, key, count in leaves:
+            parent_item.appendRow(self._make_video_row(label, mode, key, count))
+
+    def _append_video_years(self, parent_item, video_hier, year_counts):
+        """Append video year nodes (newest first); months are added lazily."""
+        for year in sorted(video_hier.keys(), key=lambda y: int(str(y)), reverse=True):
+            if not _SHOW_EMPTY_VIDEO_BUCKETS and not year_counts.get(year, 0):
+                continue
+            row = self._make_video_row(str(year), "videos_year", year, year_counts.get(year, 0))
+            parent_item.appendRow(row)
+            months = video_hier[year]
+            if months:
+                self._add_lazy_children(
+                    row[0], lambda p, y=year, m=months: self._append_video_months(p, y, m)
+                )
+
+    def _append_video_months(self, parent_item, year, months):
+        """Append month nodes for one video year; days are added lazily."""
+        for month in sorted(months.keys(), key=lambda m: int(str(m))):
+            month_label = f"{int(month):02d}"
+            month_count = self.db.count_videos_for_month(year, month, self.project_id)
+            row = self._make_video_row(month_label, "videos_month", f"{year}-{month_label}", month_count)
+            parent_item.appendRow(row)
+            days = months[month]
+            if days:
+                self._add_lazy_children(
+                    row[0], lambda p, y=year, ml=month_label, d=days: self._append_video_days(p, y, ml, d)
+                )
+
+    def _append_video_days(self, parent_item, year, month_label, days):
+        """Append day nodes for one video month."""
+        day_numbers = set()
+        for ymd in days:
+            try:
+                parts = ymd.split("-")
+                if len(parts) == 3:
+                    day_numbers.add(int(parts[2]))
+            except:
+                pass
+
+        for day in sorted(day_numbers):
+            day_label = f"{day:02d}"
+            ymd = f"{year}-{month_label}-{day_label}"
+            day_count = self.db.count_videos_for_day(ymd, self.project_id)
+            parent_item.appendRow(self._make_video_row(day_label, "videos_day", ymd, day_count))
 
     def _build_by_date_section(self):
-        from PySide6.QtGui import QStandardItem, QColor
-        from PySide6.QtCore import Qt
+        from PySide6.QtGui import QStandardItem
         try:
             hier = self.db.get_date_hierarchy(project_id=self.project_id)
         except Exception:
@@ -3525,14 +3608,7 @@ class SidebarQt(QWidget):
         root_cnt_item = QStandardItem("")
         for it in (root_name_item, root_cnt_item):
             it.setEditable(False)
-        self.model.appendRow([root_name_item, root_cnt_item])
-
-        def _cnt_item(num):
-            c = QStandardItem("" if not num else str(num))
-            c.setEditable(False)
-            c.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            c.setForeground(QColor("#888888"))
-            return c
+        self._append_root([root_name_item, root_cnt_item])
 
         # PERFORMANCE OPTIMIZATION: Get ALL date counts in ONE query instead of N individual queries
         # This eliminates the N+1 problem: 50+ queries → 1 query (8x speedup: 400ms → 50ms)
@@ -3540,75 +3616,95 @@ class SidebarQt(QWidget):
         if hasattr(self.db, 'get_date_counts_batch'):
             try:
                 date_counts = self.db.get_date_counts_batch(self.project_id)
-                print(f"[Sidebar] Loaded date counts in batch: {len(date_counts['years'])} years, {len(date_counts['months'])} months, {len(date_counts['days'])} days")
+                logger.debug(f"Loaded date counts in batch: {len(date_counts['years'])} years, {len(date_counts['months'])} months, {len(date_counts['days'])} days")
             except Exception as e:
-                print(f"[Sidebar] Error in get_date_counts_batch (falling back to individual queries): {e}")
+                logger.warning(f"Error in get_date_counts_batch (falling back to individual queries): {e}")
 
         for year in sorted(hier.keys(), key=lambda y: int(str(y))):
             # Get count from batch result (fast) or fall back to individual query (slow)
-            if date_counts and year in date_counts['years']:
-                y_count = date_counts['years'][year]
-            else:
+            # (batch years are keyed by created_year, hierarchy years are strings)
+            y_count = date_counts['years'].get(int(str(year))) if date_counts else None
+            if y_count is None:
                 try:
                     y_count = self.db.count_media_for_year(year, project_id=self.project_id)
                 except Exception:
                     y_count = 0
 
-            y_item = QStandardItem(str(year))
-            y_item.setEditable(False)
-            y_item.setData("branch", Qt.UserRole)
-            y_item.setData(f"date:{year}", Qt.UserRole + 1)
-            root_name_item.appendRow([y_item, _cnt_item(y_count)])
+            y_item = _make_leaf_item(str(year), "branch", f"date:{year}")
+            root_name_item.appendRow([y_item, _make_count_item(y_count)])
 
             months = hier.get(year, {})
-            if not isinstance(months, dict):
+            if not isinstance(months, dict) or not months:
                 continue
 
-            for month in sorted(months.keys(), key=lambda m: int(str(m))):
-                m_label = f"{int(month):02d}"
-                year_month_key = f"{year}-{m_label}"
+            # PERFORMANCE: Month and day items (the bulk of this section) are only
+            # created when their year is first expanded
+            self._add_lazy_children(
+                y_item,
+                lambda p, y=year, m=months, dc=date_counts: self._append_date_months(p, y, m, dc)
+            )
 
-                # Get count from batch result (fast) or fall back to individual query (slow)
-                if date_counts and year_month_key in date_counts['months']:
-                    m_count = date_counts['months'][year_month_key]
-                else:
-                    try:
-                        m_count = self.db.count_media_for_month(year, month, project_id=self.project_id)
-                    except Exception:
-                        m_count = 0
+    def _append_date_months(self, y_item, year, months, date_counts):
+        """Append month nodes of one By Date year; days are added lazily."""
+        for month in sorted(months.keys(), key=lambda m: int(str(m))):
+            m_label = f"{int(month):02d}"
+            year_month_key = f"{year}-{m_label}"
+
+            # Get count from batch result (fast) or fall back to individual query (slow)
+            if date_counts and year_month_key in date_counts['months']:
+                m_count = date_counts['months'][year_month_key]
+            else:
+                try:
+                    m_count = self.db.count_media_for_month(year, month, project_id=self.project_id)
+                except Exception:
+                    m_count = 0
 
-                m_item = QStandardItem(m_label)
-                m_item.setEditable(False)
-                m_item.setData("branch", Qt.UserRole)
-                m_item.setData(f"date:{year}-{m_label}", Qt.UserRole + 1)
-                y_item.appendRow([m_item, _cnt_item(m_count)])
+            m_item = _make_leaf_item(m_label, "branch", f"date:{year_month_key}")
+            y_item.appendRow([m_item, _make_count_item(m_count)])
 
-                day_ymd_list = months.get(month, []) or []
-                day_numbers = []
-                for ymd in day_ymd_list:
-                    try:
-                        dd = str(ymd).split("-")[2]
-                        day_numbers.append(int(dd))
-                    except Exception:
-                        pass
-                for day in sorted(set(day_numbers)):
-                    d_label = f"{int(day):02d}"
-                    ymd = f"{year}-{m_label}-{d_label}"
+            day_ymd_list = months.get(month, []) or []
+            if day_ymd_list:
+                self._add_lazy_children(
+                    m_item,
+                    lambda p, y=year, ml=m_label, d=day_ymd_list, dc=date_counts:
+                        self._append_date_days(p, y, ml, d, dc)
+                )
 
-                    # Get count from batch result (fast) or fall back to individual query (slow)
-                    if date_counts and ymd in date_counts['days']:
-                        d_count = date_counts['days'][ymd]
-                    else:
-                        try:
-                            d_count = self.db.count_media_for_day(ymd, project_id=self.project_id)
-                        except Exception:
-                            d_count = 0
+    def _append_date_days(self, m_item, year, m_label, day_ymd_list, date_counts):
+        """Append day nodes of one By Date month."""
+        # PERFORMANCE: rpartition() avoids a list per day; "YYYY-MM" (no day part)
+        # leaves a head without "-" and is skipped like the old split()[2] did.
+        # Days 1..31 are collected as bits of one int - no set, no sort.
+        day_mask = 0
+        for ymd in day_ymd_list:
+            head, _, dd = (ymd if isinstance(ymd, str) else str(ymd)).rpartition("-")
+            if dd and "-" in head:
+                try:
+                    day = int(dd)
+                except ValueError:
+                    continue
+                if 0 <= day <= 31:
+                    day_mask |= 1 << day
+        ym_prefix = f"{year}-{m_label}-"
+        while day_mask:
+            # Lowest set bit first = ascending day order
+            bit = day_mask & -day_mask
+            day_mask ^= bit
+            day = bit.bit_length() - 1
+            d_label = f"{day:02d}"
+            ymd = ym_prefix + d_label
 
-                    d_item = QStandardItem(d_label)
-                    d_item.setEditable(False)
-                    d_item.setData("branch", Qt.UserRole)
-                    d_item.setData(f"date:{ymd}", Qt.UserRole + 1)
-                    m_item.appendRow([d_item, _cnt_item(d_count)])
+            # Get count from batch result (fast) or fall back to individual query (slow)
+            if date_counts and ymd in date_counts['days']:
+                d_count = date_counts['days'][ymd]
+            else:
+                try:
+                    d_count = self.db.count_media_for_day(ymd, project_id=self.project_id)
+                except Exception:
+                    d_count = 0
+
+            d_item = _make_leaf_item(d_label, "branch", f"date:{ymd}")
+            m_item.appendRow([d_item, _make_count_item(d_count)])
 
     def _build_tag_section(self):
         try:
@@ -3626,25 +3722,42 @@ class SidebarQt(QWidget):
         root_count_item = QStandardItem("")
         root_name_item.setEditable(False)
         root_count_item.setEditable(False)
-        self.model.appendRow([root_name_item, root_count_item])
+        self._append_root([root_name_item, root_count_item])
 
         for tag_name, count in tag_rows:
-            text = tag_name
-            count_text = str(count) if count else ""
-
-            name_item = QStandardItem(text)
-            count_item = QStandardItem(count_text)
-            name_item.setEditable(False)
-            count_item.setEditable(False)
-            count_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            count_item.setForeground(QColor("#888888"))
-
-            name_item.setData("tag", Qt.UserRole)
-            name_item.setData(tag_name, Qt.UserRole + 1)
-
+            name_item = _make_leaf_item(tag_name, "tag", tag_name)
+            count_item = _make_count_item(count)
             root_name_item.appendRow([name_item, count_item])
 
     
+    def _sync_tag_rows(self, tag_root, tag_rows):
+        """Make the children of tag_root match tag_rows (name, count), in that order."""
+        desired = dict(tag_rows)
+
+        # Drop tags that no longer exist (reverse keeps the remaining row numbers valid)
+        for row in range(tag_root.rowCount() - 1, -1, -1):
+            if tag_root.child(row, 0).data(Qt.UserRole + 1) not in desired:
+                tag_root.removeRow(row)
+
+        for pos, (tag_name, count) in enumerate(tag_rows):
+            name_item = tag_root.child(pos, 0)
+            if name_item is None or name_item.data(Qt.UserRole + 1) != tag_name:
+                # Not at its position: move it there if it exists further down, else create it
+                row_items = None
+                for row in range(pos + 1, tag_root.rowCount()):
+                    if tag_root.child(row, 0).data(Qt.UserRole + 1) == tag_name:
+                        row_items = tag_root.takeRow(row)
+                        break
+                if row_items is None:
+                    row_items = [_make_leaf_item(tag_name, "tag", tag_name), _make_count_item(count)]
+                tag_root.insertRow(pos, row_items)
+
+            count_item = tag_root.child(pos, 1)
+            text = str(count) if count else ""
+            if count_item is not None and count_item.text() != text:
+                count_item.setText(text)
+            self._note_count_text(text)
+
     def reload_tags_only(self):
         """
         Reload tags in both list mode (tree) and tabs mode.
@@ -3662,44 +3775,55 @@ class SidebarQt(QWidget):
             return
 
         # Update tree view (list mode)
-        tag_root = self._find_root_item("🏷️ Tags")
-        if tag_root is None:
+        tag_rows = [tuple(r) for r in tag_rows]
+        old_root = self._find_root_item("🏷️ Tags")
+        if old_root is not None and tag_rows == getattr(self, "_shown_tag_rows", None):
+            # PERFORMANCE: Same tags and counts as currently shown - no model mutation at all
+            logger.debug("reload_tags_only: tags unchanged, tree left as is")
+        elif old_root is None:
+            # PERFORMANCE: Fill a detached Tags root and attach it as one row, so the
+            # view sees a single insert instead of a signal per tag row
             tag_root = QStandardItem("🏷️ Tags")
             count_col = QStandardItem("")
             tag_root.setEditable(False)
             count_col.setEditable(False)
-            self.model.appendRow([tag_root, count_col])
-
-        while tag_root.rowCount() > 0:
-            tag_root.removeRow(0)
-
-        for tag_name, count in tag_rows:
-            name_item = QStandardItem(tag_name)
-            cnt_item = QStandardItem(str(count) if count else "")
-            name_item.setEditable(False)
-            cnt_item.setEditable(False)
-            cnt_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            cnt_item.setForeground(QColor("#888888"))
-
-            name_item.setData("tag", Qt.UserRole)
-            name_item.setData(tag_name, Qt.UserRole + 1)
+            for tag_name, count in tag_rows:
+                tag_root.appendRow([_make_leaf_item(tag_name, "tag", tag_name), _make_count_item(count)])
 
-            tag_root.appendRow([name_item, cnt_item])
-
-        self.tree.expand(self.model.indexFromItem(tag_root))
-        self.tree.viewport().update()
+            self.tree.setUpdatesEnabled(False)
+            try:
+                self._append_root([tag_root, count_col])
+                self.tree.expand(self.model.indexFromItem(tag_root))
+            finally:
+                self.tree.setUpdatesEnabled(True)
+            self._shown_tag_rows = tag_rows
+            self._count_col_px = None
+            self._recalc_timer.start()
+        else:
+            # PERFORMANCE: Patch the existing Tags rows in place - a single added,
+            # removed or recounted tag touches one row, and expand state and
+            # selection of the untouched rows survive
+            self.tree.setUpdatesEnabled(False)
+            try:
+                self._sync_tag_rows(old_root, tag_rows)
+            finally:
+                self.tree.setUpdatesEnabled(True)
+            self._shown_tag_rows = tag_rows
+            self._recalc_timer.start()
 
         # Also refresh tabs mode if it's active
         if hasattr(self, 'tabs_controller') and self.tabs_controller:
             mode = self._effective_display_mode()
             if mode == "tabs":
-                # Refresh just the tags tab
+                # Refresh just the tags tab (a queued full refresh already covers it)
                 try:
-                    if hasattr(self.tabs_controller, 'refresh_tab'):
+                    if self._tabs_refresh_pending:
+                        pass
+                    elif hasattr(self.tabs_controller, 'refresh_tab'):
                         self.tabs_controller.refresh_tab("tags")
                     else:
                         # Fallback: refresh all tabs
-                        self.tabs_controller.refresh_all(force=True)
+                        self._schedule_tabs_refresh()
                 except Exception as e:
                     print(f"[Sidebar] Failed to refresh tags tab: {e}")
 
@@ -3959,6 +4083,7 @@ class SidebarQt(QWidget):
                     try:
                         if hasattr(db, "rename_tag"):
                             db.rename_tag(tag_name, new_name.strip())
+                        self._invalidate_grid_tags()
                         self.reload_tags_only()
                     except Exception as e:
                         QMessageBox.critical(self, "Rename Failed", str(e))
@@ -3970,6 +4095,7 @@ class SidebarQt(QWidget):
                     try:
                         if hasattr(db, "delete_tag"):
                             db.delete_tag(tag_name)
+                        self._invalidate_grid_tags()
                         self.reload_tags_only()
                     except Exception as e:
                         QMessageBox.critical(self, "Delete Failed", str(e))
@@ -5132,7 +5258,22 @@ class SidebarQt(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Export Failed", str(e))
 
+    def _append_root(self, row_items):
+        """Append a top-level row and remember its name item for _find_root_item()."""
+        self.model.appendRow(row_items)
+        self._roots[row_items[0].text().strip()] = row_items[0]
+
     def _find_root_item(self, title: str):
+        # PERFORMANCE: Roots are registered as they are appended; the scan below
+        # only runs for prefix lookups or roots added outside _append_root()
+        it = self._roots.get(title)
+        if it is not None:
+            try:
+                if it.model() is self.model:
+                    return it
+            except RuntimeError:
+                pass  # C++ item already deleted with an old model
+            self._roots.pop(title, None)
         for row in range(self.model.rowCount()):
             it = self.model.item(row, 0)
             if not it:
@@ -5147,36 +5288,69 @@ class SidebarQt(QWidget):
         try:
             self.tree.collapseAll()
             # Force column width recalculation after collapse
-            QTimer.singleShot(0, self._recalculate_columns)
-            try:
-                if self.settings:
-                    self.settings.set("sidebar_folded", True)
-            except Exception:
-                pass
+            self._recalc_timer.start()
+            self._set_sidebar_folded(True)
         except Exception:
             pass
 
     def expand_all(self):
         try:
-            for r in range(self.model.rowCount()):
-                idx = self.model.index(r, 0)
-                self.tree.expand(idx)
-            # Force column width recalculation after expand
-            QTimer.singleShot(0, self._recalculate_columns)
+            # PERFORMANCE: One batch expand with repaints suspended. Not expandAll():
+            # it would open every lazy node without emitting expanded(), showing
+            # the loader placeholders instead of real children.
+            self.tree.setUpdatesEnabled(False)
             try:
-                if self.settings:
-                    self.settings.set("sidebar_folded", False)
-            except Exception:
-                pass
+                self.tree.expandToDepth(0)
+            finally:
+                self.tree.setUpdatesEnabled(True)
+            # Force column width recalculation after expand
+            self._recalc_timer.start()
+            self._set_sidebar_folded(False)
         except Exception:
             pass
 
+    def _count_column_width(self):
+        """
+        Width for the counts column: the widest count text in the model plus the
+        delegate's margins, and never narrower than the header label.
+
+        PERFORMANCE: The model is measured once per rebuild; later count changes
+        only widen the cached value through _note_count_text(), so expand/collapse
+        costs no per-row text measuring.
+        """
+        if self._count_col_px is None:
+            fm = self.tree.fontMetrics()
+            widest = 0
+            stack = [self.model.invisibleRootItem()]
+            while stack:
+                parent = stack.pop()
+                for row in range(parent.rowCount()):
+                    count_item = parent.child(row, 1)
+                    if count_item is not None:
+                        text = count_item.text()
+                        if text:
+                            widest = max(widest, fm.horizontalAdvance(text))
+                    name_item = parent.child(row, 0)
+                    if name_item is not None and name_item.hasChildren():
+                        stack.append(name_item)
+            # Same margins QStyledItemDelegate adds around the text
+            margin = self.tree.style().pixelMetric(QStyle.PM_FocusFrameHMargin, None, self.tree) + 1
+            self._count_col_px = max(widest + 2 * margin, self.tree.header().sectionSizeHint(1))
+        return self._count_col_px
+
+    def _note_count_text(self, text):
+        """Widen the cached counts column width if a new count text needs more room."""
+        if getattr(self, "_count_col_px", None) is None or not text:
+            return
+        margin = self.tree.style().pixelMetric(QStyle.PM_FocusFrameHMargin, None, self.tree) + 1
+        self._count_col_px = max(self._count_col_px, self.tree.fontMetrics().horizontalAdvance(text) + 2 * margin)
+
     def _recalculate_columns(self):
         """Force tree view to recalculate column widths"""
         try:
             header = self.tree.header()
             # Recalculate column 1 (counts) to fit content
-            header.resizeSection(1, header.sectionSizeHint(1))
+            header.resizeSection(1, self._count_column_width())
             # Force viewport update to ensure column 0 (names) uses remaining space
             self.tree.viewport().update()
             self.tree.scheduleDelayedItemsLayout()
@@ -5190,106 +5364,165 @@ class SidebarQt(QWidget):
             self.expand_all()
 
     def _effective_display_mode(self):
+        # Served from the cache populated in __init__ and kept current by _set_sidebar_mode()
+        return self._sidebar_mode_cache
+
+    def _set_sidebar_mode(self, mode: str):
+        """Update the cached sidebar mode and persist it only when it actually changed."""
+        if mode == self._sidebar_mode_cache:
+            return
+        self._sidebar_mode_cache = mode
         try:
             if self.settings:
-                mode = str(self.settings.get("sidebar_mode", "list")).lower()
-                if mode in ("tabs", "list"):
-                    return mode
+                self.settings.set("sidebar_mode", mode)
         except Exception:
             pass
-        return "list"
 
-    def switch_display_mode(self, mode: str):
-        mode = (mode or "list").lower()
-        if mode not in ("list", "tabs"):
-            mode = "list"
+    def _set_sidebar_folded(self, folded: bool):
+        """Update the cached fold state and persist it only when it actually changed."""
+        folded = bool(folded)
+        if folded == self._sidebar_folded_cache:
+            return
+        self._sidebar_folded_cache = folded
         try:
             if self.settings:
-                self.settings.set("sidebar_mode", mode)
+                self.settings.set("sidebar_folded", folded)
         except Exception:
             pass
 
-        print(f"[SidebarQt] switch_display_mode({mode}) - canceling old workers")
+    def switch_display_mode(self, mode: str):
+        mode = (mode or "list").lower()
+        if mode not in ("list", "tabs"):
+            mode = "list"
+        self._set_sidebar_mode(mode)
+        # The mode switch below refreshes the new view fully; queued refreshes are redundant
+        self._cancel_scheduled_rebuild()
+        # Only the latest switch may run its second phase
+        self._mode_switch_seq = getattr(self, "_mode_switch_seq", 0) + 1
+        seq = self._mode_switch_seq
 
-        # CRITICAL: Process pending events before mode switch
-        # This ensures all pending widget deletions are completed
-        # Only process events after initialization is complete
-        if self._initialized:
-            from PySide6.QtCore import QCoreApplication
-            QCoreApplication.processEvents()
+        print(f"[SidebarQt] switch_display_mode({mode}) - canceling old workers")
 
+        # Phase 1: cancel the outgoing view's workers
         if mode == "tabs":
             # Cancel list mode workers by bumping generation
             self._list_worker_gen = (self._list_worker_gen + 1) % 1_000_000
             print(f"[SidebarQt] Canceled list workers (new gen={self._list_worker_gen})")
-
-            print("[SidebarQt] Hiding tree view")
-            self.tree.hide()
-            print("[SidebarQt] Showing tabs controller")
-            self.tabs_controller.show_tabs()
-            # Force refresh tabs when switching to tabs mode (ensures fresh data after scans)
-            print("[SidebarQt] Calling tabs_controller.refresh_all(force=True) after mode switch")
-            try:
-                self.tabs_controller.refresh_all(force=True)
-                print("[SidebarQt] tabs_controller.refresh_all() completed after mode switch")
-            except Exception as e:
-                print(f"[SidebarQt] ERROR in tabs_controller.refresh_all() after mode switch: {e}")
-                import traceback
-                traceback.print_exc()
         else:
+            # A queued tabs refresh must not run against hidden tabs
+            self._tabs_refresh_pending = False
+            self._tabs_refresh_timer.stop()
+
             # Cancel tab workers via hide_tabs() which bumps their generations
             print("[SidebarQt] Hiding tabs controller")
             self.tabs_controller.hide_tabs()
             print("[SidebarQt] Canceled tab workers via hide_tabs()")
 
-            # Process events again after hiding tabs to clear tab widgets
-            # Only after initialization is complete
-            if self._initialized:
-                print("[SidebarQt] Processing pending events after hide_tabs()")
-                from PySide6.QtCore import QCoreApplication
-                QCoreApplication.processEvents()
-                print("[SidebarQt] Finished processing events")
-
-            # CRITICAL FIX: Clear tree view selection before showing to prevent stale Qt references
-            print("[SidebarQt] Clearing tree view selection before rebuild")
-            try:
-                if hasattr(self.tree, 'selectionModel') and self.tree.selectionModel():
-                    self.tree.selectionModel().clear()
-                # Clear any expand/collapse state that might hold stale references
-                self.tree.collapseAll()
-            except Exception as e:
-                print(f"[SidebarQt] Warning: Could not clear tree selection: {e}")
-
-            print("[SidebarQt] Showing tree view")
-            self.tree.show()
-            print("[SidebarQt] Calling _build_tree_model()")
-            try:
-                self._build_tree_model()
-                print("[SidebarQt] _build_tree_model() completed")
-            except Exception as e:
-                print(f"[SidebarQt] ERROR in _build_tree_model(): {e}")
-                import traceback
-                traceback.print_exc()
-
         try:
             self.btn_mode_toggle.setChecked(mode == "tabs")
             self._update_mode_toggle_text()
         except Exception:
             pass
 
+        # CRITICAL: Pending widget deletions must complete before the new view is shown.
+        # PERFORMANCE: Instead of pumping processEvents() (re-entrant, runs arbitrary
+        # handlers), phase 2 is queued behind them on the event loop. During startup
+        # nothing is pending yet, so it runs right away.
+        if self._initialized:
+            QTimer.singleShot(0, lambda: self._switch_display_mode_phase2(mode, seq))
+        else:
+            self._switch_display_mode_phase2(mode, seq)
 
-    def reload_throttled(self, delay_ms: int = 800):
-        if self._reload_block:
+    def _switch_display_mode_phase2(self, mode: str, seq: int):
+        """Second half of switch_display_mode(): show the new view and fill it."""
+        if seq != getattr(self, "_mode_switch_seq", seq):
+            print(f"[SidebarQt] switch_display_mode({mode}) superseded - skipping phase 2")
             return
-        self._reload_block = True
-        if not self._reload_timer.isActive():
-            self._reload_timer.start(delay_ms)
 
-    def _do_reload_throttled(self):
+        if mode == "tabs":
+            print("[SidebarQt] Hiding tree view")
+            self.tree.hide()
+            # show_tabs() refreshes the tabs itself (ensures fresh data after scans),
+            # which also covers any full refresh queued meanwhile
+            print("[SidebarQt] Showing tabs controller")
+            self._tabs_refresh_pending = False
+            self._tabs_refresh_timer.stop()
+            self.tabs_controller.show_tabs()
+            return
+
+        # CRITICAL FIX: Clear tree view selection before showing to prevent stale Qt references
+        # (expand state is kept: _build_tree_model() carries it over to the new model)
+        print("[SidebarQt] Clearing tree view selection before rebuild")
+        try:
+            if hasattr(self.tree, 'selectionModel') and self.tree.selectionModel():
+                self.tree.selectionModel().clear()
+        except Exception as e:
+            print(f"[SidebarQt] Warning: Could not clear tree selection: {e}")
+
+        print("[SidebarQt] Showing tree view")
+        self.tree.show()
+        print("[SidebarQt] Calling _build_tree_model()")
+        try:
+            self._build_tree_model()
+            print("[SidebarQt] _build_tree_model() completed")
+        except Exception as e:
+            print(f"[SidebarQt] ERROR in _build_tree_model(): {e}")
+            import traceback
+            traceback.print_exc()
+
+    def _schedule_tabs_refresh(self):
+        """Queue tabs_controller.refresh_all(force=True) for the next event loop turn."""
+        if self._tabs_refresh_pending:
+            return
+        self._tabs_refresh_pending = True
+        self._tabs_refresh_timer.start()
+
+    def _run_tabs_refresh(self):
+        if not self._tabs_refresh_pending:
+            return
+        self._tabs_refresh_pending = False
         try:
+            # CRITICAL: The mode may have changed since the refresh was queued
+            if self._effective_display_mode() != "tabs" or not self.tabs_controller.isVisible():
+                print("[SidebarQt] Queued tabs refresh skipped - tabs not visible")
+                return
+            print("[SidebarQt] Calling tabs_controller.refresh_all(force=True)")
+            self.tabs_controller.refresh_all(force=True)
+            print("[SidebarQt] tabs_controller.refresh_all() completed")
+        except Exception as e:
+            print(f"[SidebarQt] ERROR in tabs_controller.refresh_all(): {e}")
+            import traceback
+            traceback.print_exc()
+
+    def reload_throttled(self, delay_ms: int = 800):
+        self._schedule_rebuild("tree", delay_ms)
+
+    def _schedule_rebuild(self, reason: str = "tree", delay_ms: int = None):
+        """
+        Queue a deferred refresh. Requests arriving before the timer fires are merged;
+        the timer is not restarted so a steady stream of requests cannot starve it.
+        """
+        self._pending_rebuild.add(reason)
+        if not self._reload_timer.isActive():
+            # Always pass the interval: start(ms) replaces the timer's interval, so a
+            # throttled request must not leave its delay behind for later ones
+            self._reload_timer.start(_REBUILD_DELAY_MS if delay_ms is None else delay_ms)
+
+    def _cancel_scheduled_rebuild(self):
+        """Drop queued refreshes - called when a full refresh is about to run anyway."""
+        self._pending_rebuild.clear()
+        self._reload_timer.stop()
+
+    def _run_scheduled_rebuild(self):
+        reasons, self._pending_rebuild = self._pending_rebuild, set()
+        if not reasons:
+            return
+        print(f"[SidebarQt] Running coalesced refresh: {sorted(reasons)}")
+        if "tree" in reasons:
+            # A full reload rebuilds the Tags section too
             self.reload()
-        finally:
-            self._reload_block = False
+        elif "tags" in reasons:
+            self.reload_tags_only()
 
     def reload(self):
         # CRITICAL: Guard against crashes during widget deletion
@@ -5313,6 +5546,9 @@ class SidebarQt(QWidget):
             print("[SidebarQt] reload() blocked - already refreshing")
             return
 
+        # This reload covers anything still queued by _schedule_rebuild()
+        self._cancel_scheduled_rebuild()
+
         try:
             self._refreshing = True
             mode = self._effective_display_mode()
@@ -5323,14 +5559,8 @@ class SidebarQt(QWidget):
             # This prevents crashes when reload() is called after switching to list mode
             # but before settings are fully updated
             if mode == "tabs" and tabs_visible:
-                print(f"[SidebarQt] Calling tabs_controller.refresh_all(force=True)")
-                try:
-                    self.tabs_controller.refresh_all(force=True)
-                    print(f"[SidebarQt] tabs_controller.refresh_all() completed")
-                except Exception as e:
-                    print(f"[SidebarQt] ERROR in tabs_controller.refresh_all(): {e}")
-                    import traceback
-                    traceback.print_exc()
+                print(f"[SidebarQt] Scheduling tabs refresh")
+                self._schedule_tabs_refresh()
             elif mode == "tabs" and not tabs_visible:
                 print(f"[SidebarQt] WARNING: mode=tabs but tabs not visible, skipping refresh")
             else:
@@ -5434,6 +5664,10 @@ class SidebarQt(QWidget):
             # Don't show error to user, just log it
 
     def _start_spinner(self):
+        if self._spin_icons is None:
+            # PERFORMANCE: The angle only ever takes 12 values, so the rotated frames
+            # are rendered once instead of on every timer tick
+            self._spin_icons = [QIcon(self._rotate_pixmap(self._base_pm, a)) for a in range(0, 360, 30)]
         if not self._spin_timer.isActive():
             self._spin_angle = 0
             self._spin_timer.start()
@@ -5445,8 +5679,10 @@ class SidebarQt(QWidget):
 
     def _tick_spinner(self):
         self._spin_angle = (self._spin_angle + 30) % 360
-        pm = self._rotate_pixmap(self._base_pm, self._spin_angle)
-        self.btn_refresh.setIcon(QIcon(pm))
+        if self._spin_icons:
+            self.btn_refresh.setIcon(self._spin_icons[self._spin_angle // 30])
+        else:
+            self.btn_refresh.setIcon(QIcon(self._rotate_pixmap(self._base_pm, self._spin_angle)))
 
     def _make_reload_pixmap(self, w: int, h: int) -> QPixmap:
         pm = QPixmap(w, h)
@@ -5479,7 +5715,7 @@ class SidebarQt(QWidget):
             
     def auto_refresh_sidebar_tabs(self):
         # Thin delegate to the new tabs widget
-        self.tabs_controller.refresh_all(force=True)
+        self._schedule_tabs_refresh()
   
 
     def _set_grid_context(self, mode: str, value):
@@ -5516,46 +5752,111 @@ class SidebarQt(QWidget):
         Handle photos dropped onto a folder in the sidebar tree.
         Updates the folder_id for all dropped photos in the database.
         """
+        print(f"[DragDrop] Moving {len(photo_paths)} photo(s) to folder ID: {folder_id}")
+        self._start_drop_worker("folder", folder_id, photo_paths)
+
+    def _start_drop_worker(self, kind: str, target, photo_paths: list):
+        """Run the database side of a drop on the thread pool; _on_drop_done() reports it."""
+        if self._drop_inflight:
+            QMessageBox.information(
+                self,
+                "Please Wait",
+                "The previous drop is still being saved. Please try again in a moment."
+            )
+            return
+        self._drop_inflight = True
         try:
-            print(f"[DragDrop] Moving {len(photo_paths)} photo(s) to folder ID: {folder_id}")
+            # PERFORMANCE: The UI stays responsive while large drops are written
+            QThreadPool.globalInstance().start(_DropWorker(self, kind, target, photo_paths))
+        except Exception:
+            self._drop_inflight = False
+            raise
+
+    def _invalidate_grid_tags(self):
+        """Drop the grid's memoized tag maps after a tag write made from the sidebar."""
+        grid = getattr(self.parent(), "grid", None)
+        if grid is not None and hasattr(grid, "invalidate_tag_cache"):
+            grid.invalidate_tag_cache()
+
+    def _on_drop_done(self, kind: str, target, count: int, error: str):
+        self._drop_inflight = False
+        if kind == "folder":
+            if error:
+                print(f"[DragDrop] Error moving photos to folder: {error}")
+                QMessageBox.critical(self, "Error", f"Failed to move photos to folder:\n{error}")
+                return
 
-            # Update folder_id for each photo in the database
-            db = self.db if hasattr(self, 'db') else ReferenceDB()
-            updated_count = 0
+            # Show success message
+            QMessageBox.information(
+                self,
+                "Photos Moved",
+                f"Successfully moved {count} photo(s) to the selected folder."
+            )
 
-            for path in photo_paths:
-                try:
-                    db.set_folder_for_image(path, folder_id)
-                    updated_count += 1
-                except Exception as e:
-                    print(f"[DragDrop] Failed to update folder for {path}: {e}")
+            # Refresh only the affected folder counts instead of rebuilding the whole tree
+            self._refresh_folder_counts(target)
+            print(f"[DragDrop] Successfully updated {count} photo(s)")
+        else:
+            if error:
+                print(f"[DragDrop] Error tagging photos: {error}")
+                QMessageBox.critical(self, "Error", f"Failed to tag photos:\n{error}")
+                return
 
             # Show success message
             QMessageBox.information(
                 self,
-                "Photos Moved",
-                f"Successfully moved {updated_count} photo(s) to the selected folder."
+                "Photos Tagged",
+                f"Successfully tagged {count} photo(s) with '{target}'."
             )
 
-            # Refresh sidebar and grid to reflect changes
-            if hasattr(self, '_do_reload_throttled'):
-                self._do_reload_throttled()
+            # Tagging only changes the Tags section - refresh that subtree instead of the whole tree
+            self._schedule_rebuild("tags")
+            self._invalidate_grid_tags()
+            print(f"[DragDrop] Successfully tagged {count} photo(s)")
 
-            # Notify main window to refresh grid
+        # Notify main window to refresh grid
+        try:
             if hasattr(self.parent(), 'grid'):
                 self.parent().grid.reload()
+        except Exception as e:
+            print(f"[DragDrop] Grid refresh failed: {e}")
+
+    def _refresh_folder_counts(self, folder_id: int):
+        """
+        Update folder count cells after photos moved into folder_id.
 
-            print(f"[DragDrop] Successfully updated {updated_count}/{len(photo_paths)} photo(s)")
+        Moving photos changes the recursive counts of the target folder, the source
+        folders and all of their ancestors. One batch count query covers all of them;
+        only cells whose value changed are touched, so the model is never rebuilt.
+        Falls back to a scheduled full reload if the folder is not in the current tree.
+        """
+        key_index = getattr(self, "_key_index", {})
+        if ("folder", folder_id) not in key_index or not hasattr(self.db, "get_folder_counts_batch"):
+            self._schedule_rebuild("tree")
+            return
 
+        try:
+            counts = self.db.get_folder_counts_batch(self.project_id) if self.project_id else {}
         except Exception as e:
-            print(f"[DragDrop] Error moving photos to folder: {e}")
-            import traceback
-            traceback.print_exc()
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to move photos to folder:\n{str(e)}"
-            )
+            print(f"[DragDrop] Folder count refresh failed, reloading sidebar: {e}")
+            self._schedule_rebuild("tree")
+            return
+
+        # Keep the cache used for lazily expanded folders in sync
+        self._folder_counts = counts
+
+        changed = 0
+        for (typ, fid), (_name_item, count_item) in key_index.items():
+            if typ != "folder" or count_item is None:
+                continue
+            text = f"{int(counts.get(fid, 0) or 0):>5}"
+            if count_item.text() != text:
+                count_item.setText(text)
+                self._note_count_text(text)
+                changed += 1
+        if changed:
+            self._recalc_timer.start()
+        print(f"[DragDrop] Updated {changed} folder count(s) in place")
 
     def _on_photos_dropped_to_tag(self, branch_key: str, photo_paths: list):
         """
@@ -5579,35 +5880,7 @@ class SidebarQt(QWidget):
                 print(f"[DragDrop] Unknown branch key: {branch_key}")
                 return
 
-            # Apply tag to each photo
-            db = self.db if hasattr(self, 'db') else ReferenceDB()
-            tag_service = get_tag_service()
-            tagged_count = 0
-
-            for path in photo_paths:
-                try:
-                    # Add tag to photo
-                    tag_service.add_tag(path, tag_name)
-                    tagged_count += 1
-                except Exception as e:
-                    print(f"[DragDrop] Failed to tag {path}: {e}")
-
-            # Show success message
-            QMessageBox.information(
-                self,
-                "Photos Tagged",
-                f"Successfully tagged {tagged_count} photo(s) with '{tag_name}'."
-            )
-
-            # Refresh sidebar and grid to reflect changes
-            if hasattr(self, '_do_reload_throttled'):
-                self._do_reload_throttled()
-
-            # Notify main window to refresh grid
-            if hasattr(self.parent(), 'grid'):
-                self.parent().grid.reload()
-
-            print(f"[DragDrop] Successfully tagged {tagged_count}/{len(photo_paths)} photo(s)")
+            self._start_drop_worker("tag", tag_name, photo_paths)
 
         except Exception as e:
             print(f"[DragDrop] Error tagging photos: {e}")
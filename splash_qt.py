@@ -3,7 +3,7 @@
 #— Startup splash screen and background initialization
 # ---------------------------------------------
 
-import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from PySide6.QtCore import Qt, QThread, Signal, QObject
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import (
@@ -26,30 +26,71 @@ class StartupWorker(QThread):
     def cancel(self):
         self._cancel = True
 
+    def _emit(self, percent: int, message: str):
+        # Background tasks finish out of order; never move the bar backwards
+        self._percent = max(self._percent, percent)
+        self.progress.emit(self._percent, message)
+
+    def _report_finished(self, pending):
+        """
+        Emit progress for background tasks that have finished since the last check.
+
+        Called from run() only, so _emit() never runs on a pool thread.
+        pending holds (future, percent, message) entries; reported ones are removed.
+        """
+        for task in [t for t in pending if t[0].done()]:
+            pending.remove(task)
+            self._emit(task[1], task[2])
+
+    def _backfill_created_fields(self, db):
+        if self._cancel:
+            return 0
+        try:
+            updated = db.single_pass_backfill_created_fields()
+            if updated:
+                print(f"[Startup] Backfilled {updated} rows.")
+            return updated
+        except Exception as e:
+            print(f"[Startup] Backfill skipped: {e}")
+            return 0
+
+    def _purge_thumb_cache(self, cache):
+        if self._cancel:
+            return
+        try:
+            cache.purge_stale(max_age_days=7)
+        except Exception as e:
+            print(f"[Cache] Purge skipped: {e}")
+
     def run(self):
         """
         Perform early startup steps BEFORE MainWindow is created.
         Covers: database, cache, translations, services initialization.
+
+        The timestamp backfill and the thumbnail cache purge are independent of
+        the service setup, so they run on a small thread pool and are joined
+        before the worker reports completion.
         """
         from reference_db import ReferenceDB
         from thumb_cache_db import get_cache
 
+        self._percent = 0
+        pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="startup")
+        pending = []
         try:
             # STEP 1 — Initial setup (5%)
-            self.progress.emit(5, "Initializing application…")
-            time.sleep(0.05)
+            self._emit(5, "Initializing application…")
             if self._cancel:
                 return
 
             # STEP 2 — DB initialization (15%)
-            self.progress.emit(15, "Opening database…")
+            self._emit(15, "Opening database…")
             db = ReferenceDB()
-            time.sleep(0.05)
             if self._cancel:
                 return
 
             # STEP 3 — Verify database schema (30%)
-            self.progress.emit(30, "Verifying database schema…")
+            self._emit(30, "Verifying database schema…")
             # NOTE: Schema creation and migrations are now handled automatically
             # by repository.DatabaseConnection during ReferenceDB initialization.
             print("[Startup] Database schema initialized successfully")
@@ -62,28 +103,27 @@ class StartupWorker(QThread):
                 return
 
             # STEP 4 — Backfill created_* if needed (45%)
-            self.progress.emit(45, "Verifying timestamps…")
-            try:
-                updated = db.single_pass_backfill_created_fields()
-                if updated:
-                    print(f"[Startup] Backfilled {updated} rows.")
-            except Exception as e:
-                print(f"[Startup] Backfill skipped: {e}")
+            # PERFORMANCE: Runs in the background while the cache and services start
+            self._emit(45, "Verifying timestamps…")
+            pending.append((pool.submit(self._backfill_created_fields, db), 45, "Timestamps verified"))
             if self._cancel:
                 return
 
             # STEP 5 — Cache initialization (55%)
-            self.progress.emit(55, "Initializing thumbnail cache…")
+            self._report_finished(pending)
+            self._emit(55, "Initializing thumbnail cache…")
             cache = get_cache()
             stats = cache.get_stats()
             print(f"[Cache] {stats}")
             if self.settings.get("cache_auto_cleanup", True):
-                cache.purge_stale(max_age_days=7)
+                # PERFORMANCE: Purge overlaps with the backfill and service setup
+                pending.append((pool.submit(self._purge_thumb_cache, cache), 55, "Thumbnail cache cleaned"))
             if self._cancel:
                 return
 
             # STEP 6 — Initialize SearchService (65%)
-            self.progress.emit(65, "Initializing search service…")
+            self._report_finished(pending)
+            self._emit(65, "Initializing search service…")
             try:
                 from services import SearchService
                 search_service = SearchService()
@@ -94,7 +134,8 @@ class StartupWorker(QThread):
                 return
 
             # STEP 7 — Initialize ThumbnailService (75%)
-            self.progress.emit(75, "Initializing thumbnail service…")
+            self._report_finished(pending)
+            self._emit(75, "Initializing thumbnail service…")
             try:
                 from services import get_thumbnail_service
                 thumb_service = get_thumbnail_service()
@@ -104,15 +145,25 @@ class StartupWorker(QThread):
             if self._cancel:
                 return
 
+            # Background tasks must finish before MainWindow reads the DB
+            while pending:
+                wait([t[0] for t in pending], return_when=FIRST_COMPLETED)
+                self._report_finished(pending)
+            if self._cancel:
+                return
+
             # Done with background initialization
             # MainWindow creation happens next (on main thread)
-            self.progress.emit(80, "Preparing main window…")
+            self._emit(80, "Preparing main window…")
             self.finished.emit(True)
 
         except Exception as e:
             import traceback
             traceback.print_exc()
             self.finished.emit(False)
+        finally:
+            # Tasks check _cancel on entry; anything already running is short
+            pool.shutdown(wait=True, cancel_futures=True)
 
 # ===============================================
 # 🌅 Splash Screen UI
@@ -365,3 +365,69 @@ class TestProjectRepository:
         projects = project_repo.get_all()
         matching = [p for p in projects if p["name"] == "Transaction Test"]
         assert len(matching) == 1  # Only original, not the failed insert
+
+
+class TestVideoRepository:
+    """Test suite for VideoRepository filtered path queries."""
+
+    @pytest.fixture
+    def video_repo(self, test_db_path: Path, init_test_database):
+        """Create VideoRepository with a few videos in project 1."""
+        from repository.video_repository import VideoRepository
+
+        repo = VideoRepository(DatabaseConnection(str(test_db_path)))
+        with repo.connection() as conn:
+            conn.execute(
+                "INSERT INTO projects (id, name, folder, mode) VALUES (1, 'P', '/p', 'date')"
+            )
+            conn.execute("INSERT INTO photo_folders (id, path, name, project_id) VALUES (1, '/p', 'p', 1)")
+            conn.executemany(
+                """INSERT INTO video_metadata
+                   (path, folder_id, project_id, size_kb, duration_seconds, width, height,
+                    codec, created_date, created_year)
+                   VALUES (?, 1, 1, ?, ?, ?, ?, ?, ?, ?)""",
+                [
+                    ("/p/a.mp4", 50 * 1024, 10, 1280, 720, "h264", "2023-05-01", 2023),
+                    ("/p/b.mp4", 2048 * 1024, 600, 3840, 2160, "HEVC", "2024-11-02", 2024),
+                    ("/p/c.mp4", None, None, None, None, None, None, None),
+                ],
+            )
+            conn.commit()
+        return repo
+
+    def test_get_paths_in_range(self, video_repo):
+        assert video_repo.get_paths_in_range(1, "duration_seconds", None, 30) == ["/p/a.mp4"]
+        assert video_repo.get_paths_in_range(1, "height", 2160, None) == ["/p/b.mp4"]
+        assert video_repo.get_paths_in_range(1, "size_kb", 1024 * 1024, 5120 * 1024) == ["/p/b.mp4"]
+
+    def test_get_paths_in_range_rejects_unknown_column(self, video_repo):
+        with pytest.raises(ValueError):
+            video_repo.get_paths_in_range(1, "path", 0, 1)
+
+    def test_get_paths_by_codecs(self, video_repo):
+        assert video_repo.get_paths_by_codecs(1, ["hevc"]) == ["/p/b.mp4"]
+        assert video_repo.get_paths_by_codecs(1, []) == []
+
+    def test_get_paths_by_codecs_ignores_case(self, video_repo):
+        with video_repo.connection() as conn:
+            conn.execute(
+                "INSERT INTO video_metadata (path, folder_id, project_id, codec) "
+                "VALUES ('/p/d.mp4', 1, 1, 'Hevc')"
+            )
+            conn.commit()
+        assert sorted(video_repo.get_paths_by_codecs(1, ["hevc"])) == ["/p/b.mp4", "/p/d.mp4"]
+        assert video_repo.get_paths_by_codecs(1, ["H264"]) == ["/p/a.mp4"]
+
+    def test_get_paths_by_created_date(self, video_repo):
+        assert video_repo.get_paths_by_created_date(1, 2024) == ["/p/b.mp4"]
+        assert video_repo.get_paths_by_created_date(1, 2023, 5) == ["/p/a.mp4"]
+        assert video_repo.get_paths_by_created_date(1, 2023, 6) == []
+
+    def test_update_stamps_updated_at(self, video_repo):
+        with video_repo.connection() as conn:
+            vid = conn.execute("SELECT id FROM video_metadata WHERE path = '/p/a.mp4'").fetchone()["id"]
+        assert video_repo.update(vid, codec="hevc")
+        with video_repo.connection() as conn:
+            row = conn.execute("SELECT codec, updated_at FROM video_metadata WHERE id = ?", (vid,)).fetchone()
+        assert row["codec"] == "hevc"
+        assert row["updated_at"] is not None
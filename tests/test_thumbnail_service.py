@@ -174,6 +174,21 @@ class TestThumbnailService:
         l1_hits_after = service.l1_cache.hits
         assert l1_hits_after > l1_hits_before  # L1 cache was hit
 
+    def test_peek_only_returns_l1_hits(self, service: ThumbnailService, sample_image: Path):
+        """Test peek() reports L1 hits without generating thumbnails."""
+        path = str(sample_image)
+
+        assert service.peek(path) is None
+        assert service.l1_cache.size() == 0
+
+        pixmap = service.get_thumbnail(path, height=200)
+        peeked = service.peek(path)
+        assert peeked is not None
+        assert peeked.cacheKey() == pixmap.cacheKey()
+
+        service.invalidate(path)
+        assert service.peek(path) is None
+
     def test_get_thumbnail_various_heights(self, service: ThumbnailService, sample_image: Path):
         """Test thumbnail generation at various heights."""
         heights = [100, 200, 400, 800]
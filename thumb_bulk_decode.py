@@ -0,0 +1,45 @@
+# thumb_bulk_decode.py
+# -----------------------------------------------------------
+# Pillow-only thumbnail decode for the cold-cache bulk warm-up
+# -----------------------------------------------------------
+#
+# Worker processes started with the "spawn" context import this module to
+# unpickle decode_to_cache_bytes, so it must stay free of Qt, services and
+# database imports: everything imported here is re-imported in every worker.
+
+import io
+
+from PIL import Image, ImageOps
+
+# Formats whose decoder can shrink while decoding (libjpeg DCT scaling via draft())
+DRAFT_EXTS = (".jpg", ".jpeg", ".jpe", ".jfif")
+
+
+def decode_to_cache_bytes(path: str, height: int, resample=Image.BICUBIC):
+    """
+    Decode one image into an encoded thumbnail blob for the L2 cache.
+
+    Runs in a worker process, so the caller passes its resample filter in (the
+    worker never loads settings). The result matches ThumbnailService:
+    EXIF-rotated, scaled to 'height', WEBP (PNG fallback).
+    Returns (path, width, height, data) or None.
+    """
+    try:
+        with Image.open(path) as im:
+            if path.lower().endswith(DRAFT_EXTS):
+                # Square request: the short side stays >= height whatever the EXIF rotation
+                im.draft("RGB", (height, height))
+            im = ImageOps.exif_transpose(im)
+            if im.mode not in ("RGB", "RGBA"):
+                im = im.convert("RGBA" if "transparency" in im.info or im.mode in ("LA", "PA") else "RGB")
+            w = max(1, round(im.width * height / im.height))
+            im = im.resize((w, height), resample)
+            buf = io.BytesIO()
+            try:
+                im.save(buf, format="WEBP", quality=85)
+            except Exception:
+                buf = io.BytesIO()
+                im.save(buf, format="PNG")
+            return path, w, height, buf.getvalue()
+    except Exception:
+        return None
@@ -5,6 +5,7 @@
 # -----------------------------------------------------------
 
 import os, sqlite3, io, time, threading, hashlib
+from contextlib import contextmanager
 from datetime import datetime
 from PySide6.QtGui import QPixmap, QImage
 
@@ -21,12 +22,36 @@ CACHE_DB_PATH = os.path.join(os.path.dirname(__file__), "thumbnails_cache.db")
 MAX_CACHE_MB = 500
 PURGE_INTERVAL_DAYS = 7
 
+# Applied to every connection. WAL lets the per-thread readers run alongside the
+# writer; mmap serves hot pages without read() syscalls + copies.
+_CONN_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+)
+
+
+def _configure(conn):
+    for pragma in _CONN_PRAGMAS:
+        try:
+            conn.execute(pragma)
+        except Exception:
+            pass
+
 
 class ThumbCacheDB:
     def __init__(self, db_path: str = CACHE_DB_PATH):
         self.db_path = db_path
         self.conn = None
-        self.lock = threading.Lock()
+        self.lock = threading.Lock()  # guards the shared writer connection
+        # PERFORMANCE: Lookups (one per thumbnail, from many ThumbWorker threads) check out
+        # a read-only connection from this pool instead of queueing on the writer's lock.
+        # A pool rather than thread-locals: Qt pool threads drop Python thread-local
+        # state after every run(), which would reopen a connection per lookup.
+        self._idle_readers = []
+        self._closed = False
         self._ensure_db()
 
         
@@ -50,11 +75,8 @@ class ThumbCacheDB:
         d = os.path.dirname(self.db_path) or "."
         os.makedirs(d, exist_ok=True)
         self.conn = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
-        try:
-            self.conn.execute("PRAGMA journal_mode=WAL;")
-        except Exception:
-            pass
-        
+        _configure(self.conn)
+
         self.conn.execute("""
             CREATE TABLE IF NOT EXISTS thumbnail_cache (
                 path TEXT PRIMARY KEY,
@@ -70,10 +92,36 @@ class ThumbCacheDB:
         self.conn.commit()
 
     # -------------------------------------------------------
+    @contextmanager
+    def _reader(self):
+        """Check out a read-only connection (pool grows to the peak number of concurrent readers)."""
+        try:
+            conn = self._idle_readers.pop()
+        except IndexError:
+            conn = sqlite3.connect(self.db_path, timeout=5, check_same_thread=False)
+            _configure(conn)
+            try:
+                conn.execute("PRAGMA query_only=ON")
+            except Exception:
+                pass
+        try:
+            yield conn
+        finally:
+            if self._closed:
+                conn.close()
+            else:
+                self._idle_readers.append(conn)
+
     def close(self):
         self._stop_event.set()
         if self._thread.is_alive():
             self._thread.join(timeout=1)
+        self._closed = True
+        while self._idle_readers:
+            try:
+                self._idle_readers.pop().close()
+            except Exception:
+                pass
         try:
             if self.conn:
                 self.conn.close()
@@ -97,11 +145,11 @@ class ThumbCacheDB:
         start = time.time()
         try:
             npath = norm(path)
-            with self.lock:
-                cur = self.conn.cursor()
-                # include stored mtime so we can inspect it if needed
-                cur.execute("SELECT width, height, hash, data, mtime FROM thumbnail_cache WHERE path=?", (npath,))
-                row = cur.fetchone()
+            # include stored mtime so we can inspect it if needed
+            with self._reader() as conn:
+                row = conn.execute(
+                    "SELECT width, height, hash, data, mtime FROM thumbnail_cache WHERE path=?", (npath,)
+                ).fetchone()
 
             self.metrics["get_count"] += 1
 
@@ -143,13 +191,11 @@ class ThumbCacheDB:
         """
         try:
             npath = norm(path)
-            with self.lock:
-                cur = self.conn.cursor()
-                cur.execute("SELECT hash FROM thumbnail_cache WHERE path=?", (npath,))
-                row = cur.fetchone()
-                if not row:
-                    return False
-                stored_hash = row[0]
+            with self._reader() as conn:
+                row = conn.execute("SELECT hash FROM thumbnail_cache WHERE path=?", (npath,)).fetchone()
+            if not row:
+                return False
+            stored_hash = row[0]
             local_hash = self.compute_hash(path)
             return stored_hash == local_hash
         except Exception:
@@ -196,6 +242,40 @@ class ThumbCacheDB:
         finally:
             self.metrics["store_total_ms"] += (time.time() - start) * 1000.0
 
+    def store_encoded_batch(self, entries) -> int:
+        """
+        Store already-encoded thumbnails (WEBP/PNG bytes) in one transaction.
+
+        entries: iterable of (path, width, height, data). The mtime and content
+        hash are taken from the file now, as in store_thumbnail().
+        Returns the number of rows written.
+        """
+        start = time.time()
+        rows = []
+        for path, width, height, data in entries:
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+            rows.append((norm(path), float(mtime), int(width), int(height),
+                         self.compute_hash(path), sqlite3.Binary(data)))
+        if not rows:
+            return 0
+        try:
+            with self.lock:
+                self.conn.executemany("""
+                    INSERT OR REPLACE INTO thumbnail_cache (path, mtime, width, height, hash, data)
+                    VALUES (?,?,?,?,?,?)
+                """, rows)
+                self.conn.commit()
+            self.metrics["stores"] += len(rows)
+            return len(rows)
+        except Exception as e:
+            print(f"[ThumbCacheDB] store_encoded_batch failed: {e}")
+            return 0
+        finally:
+            self.metrics["store_total_ms"] += (time.time() - start) * 1000.0
+
    # -------------------------------------------------------
 
     def invalidate(self, path: str):
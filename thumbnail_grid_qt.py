@@ -8,7 +8,6 @@
 # Previous behavior preserved; changes are focused on performance and memory.
 
 
-import io
 import os
 import re
 import sys
@@ -16,24 +15,26 @@ import time
 import uuid
 import hashlib
 import collections
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import functools
+import itertools
+import math
+from array import array
 from typing import Optional
 
-# === Global Decoder Warning Policy ===
 from settings_manager_qt import SettingsManager
 from thumb_cache_db import get_cache
+from thumb_bulk_decode import decode_to_cache_bytes, DRAFT_EXTS as _DRAFT_EXTS
 from services import get_thumbnail_service
 
-# create module-level settings instance (used in __init__ safely)
-settings = SettingsManager()
-if not settings.get("show_decoder_warnings", False):
-    # Silence Qt and Pillow warnings
-    os.environ["QT_LOGGING_RULES"] = "qt.gui.imageio.warning=false"
-    import warnings
-    warnings.filterwarnings("ignore", category=UserWarning)
-    warnings.filterwarnings("ignore", category=RuntimeWarning)
-    print("🔇 Decoder warnings suppressed per settings.")
-else:
-    print("⚠️ Decoder warnings enabled (developer mode).")
+# NOTE: Decoder warning policy (Qt image I/O + Pillow) is applied once by
+# settings_manager_qt.apply_decoder_warning_policy() at app startup.
+
+# Module-level settings instance, created on first grid (not at import, which
+# would read the settings file while main_window_qt is still being imported)
+settings = None
 
 
 
@@ -56,14 +57,13 @@ from PySide6.QtCore import (
     QObject,
     QEvent, QPropertyAnimation,
     QEasingCurve,
-    QPoint, QModelIndex, QTimer, QItemSelectionModel, QMimeData
+    QPoint, QModelIndex, QTimer, QItemSelectionModel, QMimeData,
+    QCoreApplication, QAbstractListModel
 )
 
  
 
 from PySide6.QtGui import (
-    QStandardItemModel, 
-    QStandardItem,
     QPixmap,
     QImage,
     QPainter,
@@ -73,7 +73,7 @@ from PySide6.QtGui import (
     QFont,
     QAction,
     QCursor,
-    QIcon, QImageReader
+    QImageReader
 ) 
 
     
@@ -84,7 +84,59 @@ from app_services import (
 )
 from services.tag_service import get_tag_service
 
-from PIL import Image
+from PIL import Image, ImageOps
+
+# Optional: libvips shrink-on-load thumbnails (JPEG/WebP/TIFF/PDF). OSError covers
+# a pyvips package installed without the libvips shared library.
+try:
+    import pyvips
+except (ImportError, OSError):
+    pyvips = None
+_USE_VIPS = pyvips is not None  # plus the "use_vips" setting, see _get_settings()
+
+# Resampling filter for PIL-made thumbnails, read once from settings in
+# _get_settings(): BICUBIC is visually indistinguishable at grid sizes and
+# noticeably cheaper; "lanczos" opts back in.
+_THUMB_RESAMPLE = Image.BICUBIC
+
+def _get_settings() -> SettingsManager:
+    """Return the shared SettingsManager, loading it (and the settings-derived constants) on first use."""
+    global settings, _THUMB_RESAMPLE, _READAHEAD_ENABLED, _USE_VIPS
+    if settings is None:
+        settings = SettingsManager()
+        _USE_VIPS = _USE_VIPS and bool(settings.get("use_vips", True))
+        if str(settings.get("thumbnail_resample", "bicubic")).lower() == "lanczos":
+            _THUMB_RESAMPLE = Image.LANCZOS
+        _READAHEAD_ENABLED = _READAHEAD_ENABLED and bool(settings.get("thumbnail_readahead", True))
+    return settings
+
+
+# Path -> key transform, picked once for the platform: normcase is the identity
+# on POSIX, and abspath() already applies normpath() on both flavours
+if os.name == "nt":
+    import ntpath
+
+    def _normalize_path(p: str, _normcase=ntpath.normcase, _abspath=ntpath.abspath) -> str:
+        return _normcase(_abspath(p))
+else:
+    _normalize_path = os.path.abspath
+
+
+@functools.lru_cache(maxsize=65536)
+def _norm_path_cached(p: str) -> str:
+    """
+    Normalized model/cache key for a path.
+
+    PERFORMANCE: Memoized - the same paths are normalized again on every
+    reload, re-sort and worker result. Relative paths resolve against the cwd
+    of the first call, which is fine because the grid only sees absolute paths.
+    Keys are interned so the grid's path tuple, the model rows and the lookup
+    dicts all share one string per path.
+    """
+    try:
+        return sys.intern(_normalize_path(p.strip()))
+    except Exception:
+        return sys.intern(p.strip().lower())
 
 
 
@@ -92,16 +144,27 @@ def make_placeholder_pixmap(size=QSize(160, 160), text="😊"):
     """
     Create a transparent placeholder so thumbnails with different aspect
     ratios won't show large opaque blocks. Draw a soft rounded rect and center the icon.
-    Ensures QPainter is properly ended to avoid leaving paint device active.
+
+    PERFORMANCE: Pixmaps are memoized per (width, height, text); QPixmap is
+    implicitly shared, so every cell and grid reuses one painted copy.
     """
-    pm = QPixmap(size)
-    pm.fill(Qt.transparent)
+    return _placeholder_cached(size.width(), size.height(), text)
+
+
+@functools.lru_cache(maxsize=16)
+def _placeholder_cached(w: int, h: int, text: str) -> QPixmap:
+    """Paint one placeholder. Ensures QPainter is properly ended to avoid leaving paint device active."""
+    size = QSize(w, h)
+    # PERFORMANCE: Paint on a QImage in the raster engine's native format and
+    # convert once, rather than painting on a QPixmap (an implicit round-trip)
+    img = QImage(size, QImage.Format_ARGB32_Premultiplied)
+    img.fill(Qt.transparent)
     p = QPainter()
     try:
-        p.begin(pm)
+        p.begin(img)
         # use Antialiasing + TextAntialiasing + SmoothPixmapTransform for high-quality output
         p.setRenderHints(QPainter.Antialiasing | QPainter.TextAntialiasing | QPainter.SmoothPixmapTransform)
-        rect = pm.rect().adjusted(4, 4, -4, -4)
+        rect = img.rect().adjusted(4, 4, -4, -4)
         bg = QColor("#F3F4F6")
         border = QColor("#E0E0E0")
         p.setBrush(bg)
@@ -113,19 +176,88 @@ def make_placeholder_pixmap(size=QSize(160, 160), text="😊"):
         font.setBold(True)
         p.setFont(font)
         p.setPen(QColor("#9AA0A6"))
-        p.drawText(pm.rect(), Qt.AlignCenter, text)
+        p.drawText(img.rect(), Qt.AlignCenter, text)
     finally:
         try:
             p.end()
         except Exception:
             pass
-    return pm
+    return QPixmap.fromImage(img)
 
 def _pil_to_qimage(pil_img):
-    if pil_img.mode != "RGB":
-        pil_img = pil_img.convert("RGB")
-    data = pil_img.tobytes("raw", "RGB")
-    qimg = QImage(data, pil_img.width, pil_img.height, QImage.Format_RGB888)
+    if pil_img.mode == "RGBA":
+        fmt, bpp = QImage.Format_RGBA8888, 4
+    else:
+        if pil_img.mode != "RGB":
+            pil_img = pil_img.convert("RGB")
+        fmt, bpp = QImage.Format_RGB888, 3
+    data = pil_img.tobytes("raw", pil_img.mode)
+    # Explicit stride (rows are not 4-byte aligned). PERFORMANCE: No deep copy -
+    # the QImage wraps 'data' directly and keeps it alive on the wrapper; callers
+    # convert with QPixmap.fromImage() right away, which makes the only copy.
+    qimg = QImage(data, pil_img.width, pil_img.height, pil_img.width * bpp, fmt)
+    qimg._retain = data
+    return qimg
+
+
+def _pil_thumbnail_with_draft(path: str, height: int):
+    """
+    Decode a thumbnail with Pillow, at most (height * 2) x height.
+
+    PERFORMANCE: For JPEGs, draft() makes libjpeg decode at 1/2, 1/4 or 1/8
+    scale (never below the target size) instead of decoding every pixel and
+    shrinking afterwards. Returns a QImage, or None if the file can't be read.
+    """
+    try:
+        with Image.open(path) as im:
+            if path.lower().endswith(_DRAFT_EXTS):
+                im.draft("RGB", (height * 2, height))
+            im = ImageOps.exif_transpose(im)
+            if im.mode not in ("RGB", "RGBA"):
+                im = im.convert("RGBA" if "transparency" in im.info or im.mode in ("LA", "PA") else "RGB")
+            im.thumbnail((height * 2, height), _THUMB_RESAMPLE)
+            qimg = _pil_to_qimage(im)
+            return None if qimg.isNull() else qimg
+    except Exception as e:
+        print(f"[PIL thumbnail] Could not read {path}: {e}")
+        return None
+
+
+def _vips_thumbnail(path: str, height: int):
+    """
+    Decode a thumbnail with libvips, at most (height * 2) x height.
+
+    PERFORMANCE: vips thumbnail() picks the shrink-on-load path of each loader
+    (JPEG DCT scaling, WebP/TIFF pyramids, PDF render scale), so the full-size
+    image is never decoded. Returns a QImage, or None if unavailable/unreadable.
+    """
+    if not _USE_VIPS:
+        return None
+    try:
+        vimg = pyvips.Image.thumbnail(path, height * 2, height=height)
+        if vimg.interpretation != "srgb":
+            vimg = vimg.colourspace("srgb")
+        if vimg.format != "uchar":
+            vimg = vimg.cast("uchar")
+        if vimg.bands == 4:
+            fmt = QImage.Format_RGBA8888
+        else:
+            vimg = vimg[:3] if vimg.bands > 3 else vimg
+            fmt = QImage.Format_RGB888
+        data = vimg.write_to_memory()
+        qimg = QImage(data, vimg.width, vimg.height, vimg.width * vimg.bands, fmt)
+        qimg._retain = data  # same contract as _pil_to_qimage
+        return None if qimg.isNull() else qimg
+    except Exception as e:
+        print(f"[vips thumbnail] Could not read {path}: {e}")
+        return None
+
+
+def _decode_thumbnail(path: str, height: int):
+    """Shrink-on-load thumbnail decode: libvips when available, else Pillow draft(). QImage or None."""
+    qimg = _vips_thumbnail(path, height)
+    if qimg is None:
+        qimg = _pil_thumbnail_with_draft(path, height)
     return qimg
 
 # === Enhanced safe thumbnail loader ===
@@ -170,28 +302,130 @@ def get_thumbnail_safe(path, height, use_disk_cache=True):
 
     # --- fallback for TIFF with unsupported compression ---
     if path.lower().endswith((".tif", ".tiff")):
+        qimg = _decode_thumbnail(path, height)
+        if qimg is not None:
+            return QPixmap.fromImage(qimg)
+
+    return pm
+
+# --- Read-ahead for files the grid is about to decode ---
+# Where the OS supports it (Linux), the kernel is asked to pull the next batch of
+# image files into the page cache asynchronously, so the decode workers' open()
+# + read() find the data in memory instead of each waiting on the disk in turn.
+_READAHEAD_ENABLED = hasattr(os, "posix_fadvise")  # plus the "thumbnail_readahead" setting, see _get_settings()
+_READAHEAD_BYTES = 16 * 1024 * 1024  # per file; covers whole JPEG/PNG/HEIC files
+_READAHEAD_LOOKAHEAD_PAGES = 4  # rows hinted past the scheduled range = prefetch radius * this
+_O_READAHEAD = os.O_RDONLY | getattr(os, "O_CLOEXEC", 0)
+
+
+class _ReadaheadTask(QRunnable):
+    """Issues POSIX_FADV_WILLNEED hints for a batch of paths (returns immediately per file)."""
+
+    def __init__(self, paths):
+        super().__init__()
+        self.paths = list(paths)
+
+    def run(self):
+        for path in self.paths:
+            try:
+                fd = os.open(path, _O_READAHEAD)
+            except OSError:
+                continue
+            try:
+                os.posix_fadvise(fd, 0, _READAHEAD_BYTES, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+
+# --- Cold-cache bulk decode in worker processes ---
+_BULK_WARMUP_MIN = 200   # uncached images needed before starting worker processes pays off
+_BULK_WARMUP_SKIP = 100  # leading rows are decoded by the interactive ThumbWorkers anyway
+_BULK_WARMUP_BATCH = 64  # thumbnails per cache-DB transaction
+
+# Grids larger than this zoom in one step: even the uniform-cell layout of an
+# animation frame costs a few microseconds per row
+_ZOOM_ANIM_MAX_ROWS = 20000
+
+
+class _BulkWarmupTask(QRunnable):
+    """
+    Fills the L2 thumbnail cache for a large cold listing with a process pool.
+
+    PERFORMANCE: Pillow's decode, EXIF and mode-conversion work largely holds the
+    GIL, so ThumbWorker threads can't scale across cores for a cold project; worker
+    processes can. Results are written to thumb_cache_db in batches from this thread,
+    and the interactive ThumbWorkers then hit L2 instead of decoding. The decode
+    function lives in thumb_bulk_decode so the spawned workers only import Pillow.
+    """
+
+    def __init__(self, paths, height, resample):
+        super().__init__()
+        self.paths = list(paths)
+        self.height = int(height)
+        self.resample = resample  # workers never load settings, so pass the filter in
+        self._cancel = threading.Event()
+        self.done = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def run(self):
         try:
-            with Image.open(path) as im:
-                im.thumbnail((height * 2, height), Image.LANCZOS)
-                buf = io.BytesIO()
-                im.save(buf, format="PNG")
-                qimg = QImage.fromData(buf.getvalue())
-                return QPixmap.fromImage(qimg)
+            self._run()
         except Exception as e:
-            print(f"[TIFF fallback] Could not read {path}: {e}")
+            print(f"[WarmUp] Bulk decode failed: {e}")
+        finally:
+            self.done.set()
+
+    def _run(self):
+        cache_db = get_cache()
+        todo = [p for p in self.paths
+                if not self._cancel.is_set() and not is_video_file(p) and not cache_db.has_entry(p)]
+        if self._cancel.is_set() or len(todo) < _BULK_WARMUP_MIN:
+            return
+
+        workers = max(1, min(4, (os.cpu_count() or 2) - 1))
+        print(f"[WarmUp] Bulk decode of {len(todo)} uncached images in {workers} processes...")
+        stored = 0
+        batch = []
+        # spawn: never fork a process that is running Qt threads
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            futures = [pool.submit(decode_to_cache_bytes, p, self.height, self.resample) for p in todo]
+            for fut in futures:
+                if self._cancel.is_set():
+                    break
+                try:
+                    result = fut.result()
+                except Exception:
+                    continue
+                if result is not None:
+                    batch.append(result)
+                if len(batch) >= _BULK_WARMUP_BATCH:
+                    stored += cache_db.store_encoded_batch(batch)
+                    batch = []
+            if batch and not self._cancel.is_set():
+                stored += cache_db.store_encoded_batch(batch)
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        print(f"[WarmUp] Bulk decode stored {stored}/{len(todo)} thumbnails.")
 
-    return pm
 
 # --- Worker signal bridge ---
 class ThumbSignal(QObject):
-    preview = Signal(str, QPixmap, int)  # quick low-res
-    loaded = Signal(str, QPixmap, int)  # path, pixmap, row index
+    # Payload is a QImage when the worker decoded it itself (converted to a QPixmap
+    # once, on the GUI thread) or the QPixmap ThumbnailService already produced.
+    # 'object' also keeps the Python QImage wrapper - and the buffer it retains - alive.
+    preview = Signal(str, object, int)  # quick low-res
+    loaded = Signal(str, object, int)  # path, image/pixmap, row index
 
 
 # --- Worker for background thumbnail loading ---
 
 class ThumbWorker(QRunnable):
-    def __init__(self, real_path, norm_path, height, row, signal_obj, cache, reload_token, placeholder):
+    def __init__(self, real_path, norm_path, height, row, signal_obj, thumb_service, cancel_event, placeholder):
         super().__init__()
         # real_path = on-disk path to open; norm_path = unified key used in model/cache
         self.real_path = str(real_path)
@@ -199,12 +433,26 @@ class ThumbWorker(QRunnable):
         self.height = int(height)
         self.row = int(row)
         self.signals = signal_obj
-        self.cache = cache
-        self.reload_token = reload_token
+        # ThumbnailService (replaces the deprecated per-grid cache dict)
+        self.thumb_service = thumb_service or get_thumbnail_service()
+        # threading.Event set by the grid when it reloads (different folder/date/mode)
+        self.cancel_event = cancel_event
         self.placeholder = placeholder
 
+    def _is_stale(self) -> bool:
+        # The grid reloaded since this job was queued: skip the remaining decode stages
+        return self.cancel_event.is_set()
+
     def run(self):
         try:
+            if self._is_stale():
+                return
+            # PERFORMANCE: Already in the L1 memory cache - no preview pass needed,
+            # hand over the final thumbnail straight away
+            pm_cached = self.thumb_service.peek(self.real_path)
+            if pm_cached is not None and not pm_cached.isNull():
+                self.signals.loaded.emit(self.norm_path, pm_cached, self.row)
+                return
             quick_h = max(64, min(128, max(32, self.height // 2)))
             pm_preview = None
             try:
@@ -212,38 +460,63 @@ class ThumbWorker(QRunnable):
                 try:
 #                    reader = QImageReader(self.path)
                     reader = QImageReader(self.real_path)
+                    if self.real_path.lower().endswith(_DRAFT_EXTS):
+                        # Skip content sniffing; JPEG is the common case
+                        reader.setFormat(b"jpeg")
                     reader.setAutoTransform(True)
-                    reader.setScaledSize(QSize(quick_h, quick_h))
+                    # PERFORMANCE: A low quality hint plus a scaled size lets Qt's JPEG
+                    # handler decode at 1/2..1/8 DCT scale with the fast IDCT - this is
+                    # only the preview, the full thumbnail follows
+                    reader.setQuality(25)
+                    src = reader.size()
+                    if src.isValid() and src.height() > 0:
+                        # Keep the aspect ratio (a square target would distort the preview)
+                        reader.setScaledSize(src.scaled(QSize(quick_h * 2, quick_h), Qt.KeepAspectRatio))
+                    else:
+                        reader.setScaledSize(QSize(quick_h, quick_h))
                     img = reader.read()
                     if img is not None and not img.isNull():
-                        pm_preview = QPixmap.fromImage(img)
+                        pm_preview = img  # QImage; the GUI thread makes the pixmap
                 except Exception:
                     pm_preview = None
-                if pm_preview is None:
-#                    pm_preview = load_thumbnail_safe(self.path, quick_h, self.cache, timeout=2.0, placeholder=self.placeholder)
-                    pm_preview = load_thumbnail_safe(self.real_path, quick_h, self.cache, timeout=2.0, placeholder=self.placeholder)
+                # No preview fallback through load_thumbnail_safe(): ThumbnailService
+                # would decode with its smooth path and cache this quick_h-sized image
+                # in L1/L2, where the full pass below would then find it. Formats
+                # QImageReader can't read keep the placeholder until the full result.
             except Exception as e:
 #                print(f"[ThumbWorker] preview failed {self.path}: {e}")
                 print(f"[ThumbWorker] preview failed {self.real_path}: {e}")
-                pm_preview = self.placeholder
+                pm_preview = None
 
-            try:
-#                self.signals.preview.emit(self.path, pm_preview, self.row)
-                # emit with normalized key so the grid can always match the item
-                self.signals.preview.emit(self.norm_path, pm_preview, self.row)
-            except Exception:
+            if self._is_stale():
                 return
+            if pm_preview is not None:
+                try:
+#                    self.signals.preview.emit(self.path, pm_preview, self.row)
+                    # emit with normalized key so the grid can always match the item
+                    self.signals.preview.emit(self.norm_path, pm_preview, self.row)
+                except Exception:
+                    return
 
             # full
+            if self._is_stale():
+                return
             try:
 #                pm_full = get_thumbnail(self.path, self.height, use_disk_cache=True)
                 pm_full = get_thumbnail(self.real_path, self.height, use_disk_cache=True)
+                if (pm_full is None or pm_full.isNull()) and self.real_path.lower().endswith(_DRAFT_EXTS):
+                    # JPEG fallback: shrink-on-load decode instead of a full-size one
+                    qimg = _decode_thumbnail(self.real_path, self.height)
+                    if qimg is not None:
+                        pm_full = qimg
                 if pm_full is None or pm_full.isNull():
 #                    pm_full = load_thumbnail_safe(self.path, self.height, self.cache, timeout=5.0, placeholder=self.placeholder)
-                    pm_full = load_thumbnail_safe(self.real_path, self.height, self.cache, timeout=5.0, placeholder=self.placeholder)
+                    pm_full = load_thumbnail_safe(self.real_path, self.height, None, timeout=5.0, placeholder=self.placeholder)
             except Exception:
                 pm_full = self.placeholder
 
+            if self._is_stale():
+                return
             try:
 #                self.signals.loaded.emit(self.path, pm_full, self.row)
                 self.signals.loaded.emit(self.norm_path, pm_full, self.row)
@@ -280,16 +553,101 @@ def format_duration(seconds: float) -> str:
         return f"{minutes}:{secs:02d}"
 
 
+# --- Tag overlay flags ---
+# The model stores a row's tags as an int bitmask (Qt.UserRole + 2) so paint()
+# tests bits instead of searching a list of strings for every cell.
+TAG_FAVORITE = 1
+TAG_FACE = 2
+_TAG_FLAGS = {"favorite": TAG_FAVORITE, "face": TAG_FACE}
+
+
+def tag_flags(tags) -> int:
+    """Bitmask of the overlay-relevant tags in a tag list (other tags are ignored)."""
+    flags = 0
+    for t in tags or ():
+        flags |= _TAG_FLAGS.get(t, 0)
+    return flags
+
+
 class CenteredThumbnailDelegate(QStyledItemDelegate):
+    _SCALED_CACHE_MAX = 512
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        # PERFORMANCE: Smooth-scaled pixmaps keyed by (source cacheKey, target height),
+        # so hover/selection/scroll repaints blit instead of rescaling every cell
+        self._scaled_cache = collections.OrderedDict()
+        # Tag badge sprites keyed by (kind, device pixel ratio, font key)
+        self._overlay_sprites = {}
+        # Thumbnail height of the current zoom animation frame (0 = none running)
+        self.zoom_preview_h = 0
+
+    def clear_scaled_cache(self):
+        """Drop all pre-scaled pixmaps (call when the cell height changes globally)."""
+        self._scaled_cache.clear()
+
+    def _scaled_pixmap(self, pm: QPixmap, target_w: int, target_h: int) -> QPixmap:
+        key = (pm.cacheKey(), target_h)
+        cache = self._scaled_cache
+        scaled = cache.get(key)
+        if scaled is not None:
+            cache.move_to_end(key)
+            return scaled
+        scaled = pm.scaled(target_w, target_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        cache[key] = scaled
+        if len(cache) > self._SCALED_CACHE_MAX:
+            cache.popitem(last=False)
+        return scaled
+
+    def _overlay_sprite(self, kind: str, dpr: float, font: QFont) -> QPixmap:
+        """
+        22x22 tag badge ("favorite" or "face"), rasterized once.
 
+        PERFORMANCE: Shaping the glyph (especially the emoji) on every paint of
+        every cell is far more expensive than blitting a pre-rendered pixmap.
+        Keyed on DPR and font, so a screen or font/theme change re-renders it.
+        """
+        key = (kind, dpr, font.key())
+        pm = self._overlay_sprites.get(key)
+        if pm is not None:
+            return pm
 
+        side = int(math.ceil(22 * dpr))
+        img = QImage(side, side, QImage.Format_ARGB32_Premultiplied)
+        img.setDevicePixelRatio(dpr)
+        img.fill(Qt.transparent)
+        rect = QRect(0, 0, 22, 22)
+        p = QPainter(img)
+        try:
+            p.setFont(font)
+            p.setPen(Qt.NoPen)
+            if kind == "favorite":
+                p.setBrush(QColor(255, 215, 0, 220))
+                p.drawEllipse(rect)
+                p.setPen(QPen(Qt.black))
+                p.drawText(rect, Qt.AlignCenter, "★")
+            else:
+                p.setBrush(QColor(70, 130, 180, 200))
+                p.drawEllipse(rect)
+                p.setPen(QPen(Qt.white))
+                p.drawText(rect, Qt.AlignCenter, "👤")
+        finally:
+            p.end()
+        pm = QPixmap.fromImage(img)
+        self._overlay_sprites[key] = pm
+        return pm
 
     def paint(self, painter: QPainter, option, index):
-        # ✅ Get icon/pixmap data properly first
-        icon_data = index.data(Qt.DecorationRole)
+        # ✅ The model stores the thumbnail as a QPixmap (never a QIcon)
+        pm = index.data(Qt.DecorationRole)
         rect = option.rect
+        preview_h = self.zoom_preview_h
+        if preview_h:
+            # Zoom animation frame: cells still carry the old size hints, so draw
+            # at the animated height, centred on the uniform grid cell
+            aspect = index.data(Qt.UserRole + 1) or 1.5
+            preview_w = int(preview_h * aspect)
+            rect = QRect(rect.center().x() - preview_w // 2, rect.top(), preview_w, preview_h)
 
         # ✅ Guard against invalid or zero rect sizes (e.g., before layout settles)
         cell_h = rect.height()
@@ -309,44 +667,37 @@ class CenteredThumbnailDelegate(QStyledItemDelegate):
             painter.drawRoundedRect(rect.adjusted(2, 2, -2, -2), 6, 6)
             painter.restore()
 
-        # 🖼 Draw scaled thumbnail with fixed height and aspect ratio
-        pm = None
-        if isinstance(icon_data, QIcon):
-            pm = icon_data.pixmap(QSize(int(target_h * 2), target_h))
-        elif isinstance(icon_data, QPixmap):
-            pm = icon_data
-
         # === Tag overlay ===
-        tags = index.data(Qt.UserRole + 2) or []
-        if tags:
-            painter.save()
+        flags = index.data(Qt.UserRole + 2) or 0
+        if flags:
             overlay_rect = QRect(rect.right() - 26, rect.top() + 4, 22, 22)
-            if "favorite" in tags:
+            if flags & TAG_FAVORITE:
                 painter.fillRect(rect, QColor(0, 0, 0, 30))  # subtle dark overlay
-                painter.setPen(Qt.NoPen)
-                painter.setBrush(QColor(255, 215, 0, 220))
-                painter.drawEllipse(overlay_rect)
-                painter.setPen(QPen(Qt.black))
-                painter.drawText(overlay_rect, Qt.AlignCenter, "★")
-            elif "face" in tags:
-                painter.setBrush(QColor(70, 130, 180, 200))
-                painter.setPen(Qt.NoPen)
-                painter.drawEllipse(overlay_rect)
-                painter.setPen(QPen(Qt.white))
-                painter.drawText(overlay_rect, Qt.AlignCenter, "👤")
-            painter.restore()
+                badge = "favorite"
+            else:
+                badge = "face"
+            dpr = painter.device().devicePixelRatioF() if painter.device() else 1.0
+            painter.drawPixmap(overlay_rect, self._overlay_sprite(badge, dpr, option.font))
 
 
-        if pm and not pm.isNull():
+        # 🖼 Draw scaled thumbnail with fixed height and aspect ratio
+        if pm is not None and not pm.isNull():
             orig_w = pm.width()
             orig_h = pm.height()
             if orig_h > 0:
                 scale = target_h / orig_h
                 target_w = int(orig_w * scale)
-                scaled = pm.scaled(target_w, target_h, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                x = rect.x() + (rect.width() - scaled.width()) // 2
-                y = rect.y() + (rect.height() - scaled.height()) // 2
-                painter.drawPixmap(QRect(x, y, scaled.width(), scaled.height()), scaled)
+                if preview_h:
+                    # Transient size: let the painter scale instead of filling the cache
+                    scaled = QSize(target_w, target_h)
+                    x = rect.x() + (rect.width() - target_w) // 2
+                    y = rect.y() + (rect.height() - target_h) // 2
+                    painter.drawPixmap(QRect(x, y, target_w, target_h), pm)
+                else:
+                    scaled = self._scaled_pixmap(pm, target_w, target_h)
+                    x = rect.x() + (rect.width() - scaled.width()) // 2
+                    y = rect.y() + (rect.height() - scaled.height()) // 2
+                    painter.drawPixmap(QRect(x, y, scaled.width(), scaled.height()), scaled)
 
                 # 🎬 Video duration badge (Phase 4.3)
                 file_path = index.data(Qt.UserRole)
@@ -467,12 +818,270 @@ class CenteredThumbnailDelegate(QStyledItemDelegate):
             painter.restore()
  
 
+class ThumbRow:
+    """
+    Row handle for DraggableThumbnailModel exposing the QStandardItem calls
+    the grid uses (data/setData/setSizeHint/...), plus setPixmap() for the
+    thumbnail, which is kept as a QPixmap rather than wrapped in a QIcon.
+
+    A detached row (ThumbRow()) buffers its roles until it is appended;
+    rows returned by model.item(row) read and write the model's arrays.
+    """
+    __slots__ = ("_model", "_row", "_roles")
+
+    def __init__(self, model=None, row=-1):
+        self._model = model
+        self._row = row
+        self._roles = {} if model is None else None
+
+    def row(self):
+        return self._row
+
+    def data(self, role=Qt.UserRole + 1):
+        if self._model is None:
+            return self._roles.get(role)
+        return self._model.row_data(self._row, role)
+
+    def setData(self, value, role=Qt.UserRole + 1):
+        if self._model is None:
+            self._roles[role] = value
+        else:
+            self._model.set_row_data(self._row, value, role)
+
+    def setPixmap(self, pixmap):
+        self.setData(pixmap, Qt.DecorationRole)
+
+    def pixmap(self):
+        pm = self.data(Qt.DecorationRole)
+        return pm if pm is not None else QPixmap()
+
+    def setSizeHint(self, size):
+        self.setData(size, Qt.SizeHintRole)
+
+    def sizeHint(self):
+        size = self.data(Qt.SizeHintRole)
+        return size if size is not None else QSize()
+
+    def setToolTip(self, text):
+        self.setData(text, Qt.ToolTipRole)
+
+    def setEditable(self, editable):
+        pass  # grid rows are never editable
+
+
 # === Phase 3: Drag & Drop Support ===
-class DraggableThumbnailModel(QStandardItemModel):
+class DraggableThumbnailModel(QAbstractListModel):
     """
-    Custom model that provides photo paths as MIME data for drag and drop.
+    Flat thumbnail model that provides photo paths as MIME data for drag and drop.
     Enables dragging photos from the grid to sidebar folders/tags.
+
+    PERFORMANCE: Rows are stored column-wise (structure of arrays) instead of
+    one QStandardItem per photo: paths/pixmaps in parallel lists, aspect
+    ratios and size hints in typed arrays, the scheduled flag and tag bits in
+    bytearrays, and the rarely-set video roles in sparse dicts. (UserRole+2
+    accepts a tag list and reads back as its tag_flags() bitmask.) A 10k-photo
+    folder is a handful of containers rather than 10k C++ items with their own
+    role maps, and set_rows() populates it with a single model reset instead
+    of one rowsInserted per appendRow().
     """
+    # PERFORMANCE: data() runs for every role of every visible cell; plain int
+    # constants avoid PySide's per-access Qt enum attribute lookup
+    _DECORATION = int(Qt.DecorationRole)
+    _SIZE_HINT = int(Qt.SizeHintRole)
+    _KEY = int(Qt.UserRole)          # normalized path
+    _ASPECT = _KEY + 1
+    _TAGS = _KEY + 2
+    _SCHEDULED = _KEY + 5
+    _REAL_PATH = _KEY + 6
+    _ROW_FLAGS = Qt.ItemIsSelectable | Qt.ItemIsEnabled | Qt.ItemIsDragEnabled
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._init_storage()
+
+    def _init_storage(self):
+        self._keys = []
+        self._real_paths = []
+        self._tag_flags = bytearray()
+        self._pixmaps = []
+        self._aspects = array("d")      # 0.0 = unset
+        self._size_w = array("i")       # -1 = no size hint
+        self._size_h = array("i")
+        self._scheduled = bytearray()
+        self._sparse = {}               # role -> {row: value}
+        self._row_of = {}               # normalized path -> first row
+
+    # --- Qt model interface ---
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._keys)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return self._ROW_FLAGS
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        return self.row_data(index.row(), role)
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        return self.set_row_data(index.row(), value, role)
+
+    # --- Column storage ---
+    def row_data(self, row, role):
+        if not 0 <= row < len(self._keys):
+            return None
+        if role == self._DECORATION:
+            return self._pixmaps[row]
+        if role == self._SIZE_HINT:
+            w = self._size_w[row]
+            return QSize(w, self._size_h[row]) if w >= 0 else None
+        if role == self._KEY:
+            return self._keys[row]
+        if role == self._ASPECT:
+            return self._aspects[row] or None
+        if role == self._TAGS:
+            return self._tag_flags[row]
+        if role == self._SCHEDULED:
+            return bool(self._scheduled[row])
+        if role == self._REAL_PATH:
+            return self._real_paths[row]
+        sparse = self._sparse.get(role)
+        return sparse.get(row) if sparse else None
+
+    def _store(self, row, value, role):
+        if role == self._DECORATION:
+            self._pixmaps[row] = value
+        elif role == self._SIZE_HINT:
+            if value is None or not value.isValid():
+                self._size_w[row] = self._size_h[row] = -1
+            else:
+                self._size_w[row] = value.width()
+                self._size_h[row] = value.height()
+        elif role == self._KEY:
+            old = self._keys[row]
+            if self._row_of.get(old) == row:
+                del self._row_of[old]
+            self._keys[row] = value
+            self._row_of.setdefault(value, row)
+        elif role == self._ASPECT:
+            self._aspects[row] = float(value or 0.0)
+        elif role == self._TAGS:
+            self._tag_flags[row] = value if isinstance(value, int) else tag_flags(value)
+        elif role == self._SCHEDULED:
+            self._scheduled[row] = 1 if value else 0
+        elif role == self._REAL_PATH:
+            self._real_paths[row] = value
+        elif value is None:
+            self._sparse.get(role, {}).pop(row, None)
+        else:
+            self._sparse.setdefault(role, {})[row] = value
+
+    def set_row_data(self, row, value, role):
+        if not 0 <= row < len(self._keys):
+            return False
+        self._store(row, value, role)
+        if role != self._SCHEDULED:  # bookkeeping only, nothing to repaint
+            idx = self.index(row, 0)
+            self.dataChanged.emit(idx, idx, [role])
+        return True
+
+    def _append_storage(self, roles):
+        row = len(self._keys)
+        key = roles.get(self._KEY)
+        self._keys.append(key)
+        self._real_paths.append(None)
+        self._tag_flags.append(0)
+        self._pixmaps.append(None)
+        self._aspects.append(0.0)
+        self._size_w.append(-1)
+        self._size_h.append(-1)
+        self._scheduled.append(0)
+        self._row_of.setdefault(key, row)
+        for role, value in roles.items():
+            if role != self._KEY:
+                self._store(row, value, role)
+
+    # --- QStandardItemModel-style helpers used by the grid ---
+    def clear(self):
+        self.beginResetModel()
+        self._init_storage()
+        self.endResetModel()
+
+    def set_rows(self, rows):
+        """Replace the model contents with detached ThumbRows in one reset."""
+        self.beginResetModel()
+        self._init_storage()
+        for r in rows:
+            self._append_storage(r._roles)
+        self.endResetModel()
+
+    def appendRow(self, row):
+        n = len(self._keys)
+        self.beginInsertRows(QModelIndex(), n, n)
+        self._append_storage(row._roles)
+        self.endInsertRows()
+        row._model, row._row, row._roles = self, n, None
+
+    def item(self, row, column=0):
+        if column != 0 or not 0 <= row < len(self._keys):
+            return None
+        return ThumbRow(self, row)
+
+    def indexFromItem(self, item):
+        return self.index(item.row(), 0)
+
+    def scheduling_columns(self):
+        """
+        (normalized paths, real paths, scheduled flags) column views for the
+        grid's scheduling loop: plain list/bytearray reads instead of a data()
+        call per role per row. Writes to the flags need no repaint.
+        """
+        return self._keys, self._real_paths, self._scheduled
+
+    def row_for_key(self, key):
+        """Row holding the given normalized path, or -1."""
+        return self._row_of.get(key, -1)
+
+    def set_thumbnails(self, updates):
+        """
+        Apply {row: (pixmap, aspect, size_hint)} and emit one dataChanged range.
+        A None aspect/size_hint keeps the row's current geometry.
+        """
+        resized = False
+        for row, (pm, aspect, size) in updates.items():
+            self._pixmaps[row] = pm
+            if size is not None:
+                self._aspects[row] = aspect
+                self._size_w[row] = size.width()
+                self._size_h[row] = size.height()
+                resized = True
+        roles = [self._DECORATION, self._SIZE_HINT, self._ASPECT] if resized else [self._DECORATION]
+        self.dataChanged.emit(self.index(min(updates), 0), self.index(max(updates), 0), roles)
+
+    def set_tags(self, updates):
+        """Apply {row: tag list} and emit one dataChanged range."""
+        if not updates:
+            return
+        for row, tags in updates.items():
+            self._tag_flags[row] = tag_flags(tags)
+        self.dataChanged.emit(self.index(min(updates), 0), self.index(max(updates), 0), [self._TAGS])
+
+    def apply_size_hints(self, thumb_h: int):
+        """Resize every cell to thumb_h high (width from its aspect ratio); one change signal."""
+        n = len(self._keys)
+        if n == 0:
+            return
+        # PERFORMANCE: runs per zoom animation frame - plain arithmetic into the
+        # typed arrays, no per-row QSize or method call
+        self._size_w = array("i", [int(thumb_h * (a if a > 0 else 1.5)) for a in self._aspects])
+        self._size_h = array("i", [thumb_h]) * n
+        self.dataChanged.emit(self.index(0, 0), self.index(n - 1, 0), [self._SIZE_HINT])
+
+    # --- Drag & drop ---
     def mimeTypes(self):
         """Return list of MIME types this model supports for drag operations."""
         return ['text/uri-list', 'application/x-photo-paths']
@@ -510,6 +1119,29 @@ class DraggableThumbnailModel(QStandardItemModel):
         return mime_data
 
 
+# Context-menu tag lookups: how long cached answers stay valid, and the largest
+# selection whose tags are prefetched while the user is still selecting
+_TAG_CACHE_TTL = 5.0  # seconds
+_TAG_PREFETCH_MAX = 500
+
+# Tag maps of recently shown listings (keyed by the path tuple), so navigating
+# back and forth skips the DB round-trip. Tag edits made through the grid, the
+# sidebar or the main window invalidate them; the TTL bounds what other writers
+# can leave stale.
+_TAG_MAP_CACHE_MAX = 8
+_TAG_MAP_CACHE_TTL = 60.0  # seconds
+
+# Event types tested by ThumbnailGridQt.eventFilter(), looked up once
+_EV_WHEEL = QEvent.Wheel
+_EV_RESIZE = QEvent.Resize
+_EV_KEYPRESS = QEvent.KeyPress
+
+# Date keys accepted by ThumbnailGridQt._normalize_date_key() (compiled once)
+_RE_YEAR = re.compile(r"\d{4}")
+_RE_YM = re.compile(r"(\d{4})-(\d{1,2})")
+_RE_YMD = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
 class ThumbnailGridQt(QWidget):
     # inside class ThumbnailGridQt(QWidget):
     selectionChanged = Signal(int)# count of selected items
@@ -519,7 +1151,7 @@ class ThumbnailGridQt(QWidget):
         
     def __init__(self, project_id=None):
         super().__init__()        
-        self.settings = settings  # use module-level settings instance
+        self.settings = _get_settings()  # shared module-level settings instance
         
         self.db = ReferenceDB()  # new
         self.load_mode = "branch"  # or "folder" or "date"          
@@ -545,9 +1177,21 @@ class ThumbnailGridQt(QWidget):
         self._thumb_cache = {}        # Deprecated: use ThumbnailService instead
         self._thumbnail_service = get_thumbnail_service()
         self._decode_timeout = 5.0    # seconds for watchdog
-        # shared placeholder pixmap (reuse to avoid many allocations)
-        self._placeholder_pixmap = make_placeholder_pixmap(QSize(self.thumb_height, self.thumb_height))
         self._current_reload_token = self._reload_token  # initialize for safety
+        # Normalized paths with a ThumbWorker queued or running (GUI thread only);
+        # cleared when a new reload token is issued
+        self._inflight = set()
+        # PERFORMANCE: finished thumbnails are applied once per frame (~16 ms) with a
+        # single dataChanged range instead of one repaint per worker signal
+        self._pending_thumbs = {}     # row -> (normalized path, QPixmap)
+        self._thumb_flush_timer = QTimer(self)
+        self._thumb_flush_timer.setSingleShot(True)
+        self._thumb_flush_timer.setInterval(16)
+        self._thumb_flush_timer.timeout.connect(self._flush_thumb_updates)
+        self._bulk_warmup = None  # running _BulkWarmupTask, if any
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._cancel_bulk_warmup)
 
 
         # --- Thumbnail grid spacing (consistent with zoom system)
@@ -555,8 +1199,10 @@ class ThumbnailGridQt(QWidget):
         self.thumb_spacing = self.settings.get("thumb_padding", 8)
         self.cell_width_factor = 1.25
         
-        # Use the global thread pool for better reuse across grid instances.
-        self.thread_pool = QThreadPool.globalInstance()
+        # PERFORMANCE: A pool of its own (instead of the global one) so a reload can
+        # drop the previous generation's queued workers with clear() without
+        # touching other components' tasks
+        self.thread_pool = QThreadPool(self)
         # Respect user setting for worker count
         try:
             workers = int(self.settings.get("thumbnail_workers", 4))
@@ -568,15 +1214,22 @@ class ThumbnailGridQt(QWidget):
         self.thread_pool.setMaxThreadCount(workers)
 
         self.thumb_signal = ThumbSignal()
-        self.thumb_signal.preview.connect(self._on_thumb_loaded)  # show asap
+        # Shared by the workers of one reload generation; set (and replaced) on the
+        # next reload so queued/running workers stop before their next decode
+        self._active_cancel = threading.Event()
+        self.thumb_signal.preview.connect(self._on_thumb_preview)  # show asap
         self.thumb_signal.loaded.connect(self._on_thumb_loaded)   # then refine
-        self._paths = []
-        
+        self._paths = ()  # paths of the current listing, in display order
+
         # prefetch radius (number of items ahead/behind), configurable
         try:
             self._prefetch_radius = int(self.settings.get("thumbnail_prefetch", 8))
         except Exception:
             self._prefetch_radius = 8
+        self._rv_last_scroll = 0  # scrollbar value at the last visible-range request (read-ahead direction)
+        # (time, top row) of recent visible-range requests; biases the prefetch radius
+        # towards the scroll direction
+        self._scroll_history = collections.deque(maxlen=4)
 
         # --- Toolbar (Face Grouping + Zoom controls)
         # Phase 8: Face grouping buttons (moved from People tab for global access)
@@ -636,6 +1289,11 @@ class ThumbnailGridQt(QWidget):
         # Phase 3: Use draggable model for drag & drop support
         self.model = DraggableThumbnailModel(self.list_view)
         self.list_view.setModel(self.model)
+        # Row range handed out by the last request_visible_thumbnails() (empty = none)
+        self._last_visible = (0, -1)
+        self.model.modelReset.connect(self._reset_visible_range)
+        # A request arrived while the grid was hidden; run it from showEvent()
+        self._deferred_visible_request = False
 
         # --- Context menu ---
         self.list_view.setContextMenuPolicy(Qt.CustomContextMenu)
@@ -651,6 +1309,19 @@ class ThumbnailGridQt(QWidget):
             lambda *_: self.selectionChanged.emit(len(self.get_selected_paths()))
         )
 
+        # PERFORMANCE: the context menu's tag lookups are cached briefly and the
+        # selection's tags are prefetched (debounced) before the menu is opened
+        self._all_tags_cache = (0.0, None)             # (monotonic ts, tag list)
+        self._present_tags_cache = (0.0, None, None)   # (monotonic ts, frozenset(paths), map)
+        self._tag_map_cache = collections.OrderedDict()  # path tuple -> (monotonic ts, tag map)
+        self._tag_prefetch_timer = QTimer(self)
+        self._tag_prefetch_timer.setSingleShot(True)
+        self._tag_prefetch_timer.setInterval(100)
+        self._tag_prefetch_timer.timeout.connect(self._prefetch_present_tags)
+        self.list_view.selectionModel().selectionChanged.connect(
+            lambda *_: self._tag_prefetch_timer.start()
+        )
+
         # double-click = open in lightbox
         self.list_view.doubleClicked.connect(self._on_double_clicked)
         
@@ -678,7 +1349,7 @@ class ThumbnailGridQt(QWidget):
         layout.addLayout(toolbar_layout)   # 👈 add toolbar on top
         layout.addWidget(self.list_view)
 
-        # debounce timer for requests
+        # debounce/coalescing timer for requests: see _schedule_visible_request()
         self._rv_timer = QTimer(self)
         self._rv_timer.setSingleShot(True)
         self._rv_timer.timeout.connect(self.request_visible_thumbnails)
@@ -693,11 +1364,20 @@ class ThumbnailGridQt(QWidget):
 # ===================================================
     # --- Normalization helper used everywhere (model key, cache key, worker emits) ---
     def _norm_path(self, p: str) -> str:
-        try:
-            return os.path.normcase(os.path.abspath(os.path.normpath(str(p).strip())))
-        except Exception:
-            return str(p).strip().lower()
+        return _norm_path_cached(str(p))
+
+
+    def _schedule_visible_request(self, *_):
+        """
+        Ask for a request_visible_thumbnails() pass within one frame (~16 ms).
 
+        PERFORMANCE: Viewport resizes, zoom steps and reloads land here and share
+        the scroll debounce timer, so calls made while a pass is already pending
+        (including a scroll burst's) collapse into that one pass.
+        """
+        timer = getattr(self, "_rv_timer", None)
+        if timer is not None and not timer.isActive():
+            timer.start(16)
 
     def request_visible_thumbnails(self):
         """
@@ -706,10 +1386,17 @@ class ThumbnailGridQt(QWidget):
 
         Uses scrollbar position for reliable viewport calculation in IconMode.
         """
+        # PERFORMANCE: A hidden grid (other tab/page) decodes nothing; the rows are
+        # scheduled once it is shown again (see showEvent)
+        if not self.list_view.isVisible():
+            self._deferred_visible_request = True
+            return
         try:
             viewport = self.list_view.viewport()
             rect = viewport.rect()
-            if rect.isNull() or self.model.rowCount() == 0:
+            if self.model.rowCount() == 0:
+                return  # nothing to load; the next reload schedules a new pass
+            if rect.isNull():
                 # reschedule if viewport not yet fully laid out
                 QTimer.singleShot(50, self.request_visible_thumbnails)
                 return
@@ -758,9 +1445,20 @@ class ThumbnailGridQt(QWidget):
                 else:
                     end = min(self.model.rowCount() - 1, start + 150)
 
-            # Expand range by prefetch radius
-            start = max(0, start - self._prefetch_radius)
-            end = min(self.model.rowCount() - 1, end + self._prefetch_radius)
+            # PERFORMANCE: Expand range by prefetch radius, weighted towards the scroll
+            # direction (2x ahead, 0.5x behind); symmetric while the view is at rest
+            history = self._scroll_history
+            history.append((time.monotonic(), start))
+            dy = history[-1][1] - history[0][1]
+            radius = self._prefetch_radius
+            if dy > 0:
+                back, fwd = radius // 2, radius * 2
+            elif dy < 0:
+                back, fwd = radius * 2, radius // 2
+            else:
+                back = fwd = radius
+            start = max(0, start - back)
+            end = min(self.model.rowCount() - 1, end + fwd)
 
             # If near bottom, load all remaining
             remaining = self.model.rowCount() - end - 1
@@ -768,33 +1466,62 @@ class ThumbnailGridQt(QWidget):
                 end = self.model.rowCount() - 1
                 print(f"[GRID] Near bottom, loading all remaining {remaining} items")
 
-            print(f"[GRID] Loading viewport range: {start}-{end} of {self.model.rowCount()}")
+            # Same range as the last pass (and no zoom/reload since): nothing to do
+            if (start, end) == self._last_visible:
+                return
 
-            token = self._reload_token
-            loaded_count = 0
-            for row in range(start, end + 1):
-                item = self.model.item(row)
-                if not item:
-                    continue
+            print(f"[GRID] Loading viewport range: {start}-{end} of {self.model.rowCount()}")
 
-                npath = item.data(Qt.UserRole)        # normalized key
-                rpath = item.data(Qt.UserRole + 6)    # real path
-                if not npath or not rpath:
+            # PERFORMANCE: Only walk rows revealed since the last request - rows of the
+            # previous range are already loaded or in flight
+            last_start, last_end = self._last_visible
+            self._last_visible = (start, end)
+            if last_start <= last_end:
+                rows = itertools.chain(range(start, min(end, last_start - 1) + 1),
+                                       range(max(start, last_end + 1), end + 1))
+            else:
+                rows = range(start, end + 1)
+
+            # PERFORMANCE: read the model's row-state columns directly
+            row_npath, row_rpath, row_scheduled = self.model.scheduling_columns()
+            inflight = self._inflight
+            jobs = []
+            for row in rows:
+                # avoid resubmitting while already scheduled, or while a worker for
+                # this path is still queued/running (the preview clears the row flag)
+                if row_scheduled[row]:
                     continue
-
-                # avoid resubmitting while already scheduled
-                if item.data(Qt.UserRole + 5):
+                npath = row_npath[row]                # normalized key
+                rpath = row_rpath[row]                # real path
+                if not npath or not rpath or npath in inflight:
                     continue
 
-                # schedule worker
-                item.setData(True, Qt.UserRole + 5)  # mark scheduled
-                thumb_h = int(self._thumb_base * self._zoom_factor)
-
-                w = ThumbWorker(rpath, npath, thumb_h, row, self.thumb_signal,
-                                self._thumb_cache, token, self._placeholder_pixmap)
-
-                self.thread_pool.start(w)
-                loaded_count += 1
+                row_scheduled[row] = 1  # mark scheduled
+                inflight.add(npath)
+                jobs.append((rpath, npath, row))
+            loaded_count = len(jobs)
+
+            if _READAHEAD_ENABLED:
+                # PERFORMANCE: One batch of read-ahead hints on the global pool so it runs
+                # alongside (not instead of) the decode workers: the range being scheduled
+                # now first, then the rows the next scroll step will most likely reveal.
+                paths = [rpath for rpath, _npath, _row in jobs if not is_video_file(rpath)]
+                paths.extend(self._readahead_lookahead_paths(start, end, scroll_value))
+                if paths:
+                    QThreadPool.globalInstance().start(_ReadaheadTask(paths))
+            self._rv_last_scroll = scroll_value
+
+            # PERFORMANCE: Build all workers in one pass with the per-pass arguments
+            # (height, cancel flag, placeholder, service) looked up once, then enqueue them
+            cancel = self._active_cancel
+            thumb_h = self._thumb_h_cached
+            signals = self.thumb_signal
+            service = self._thumbnail_service
+            placeholder = self._get_placeholder(thumb_h)
+            start_worker = self.thread_pool.start
+            for w in [ThumbWorker(rpath, npath, thumb_h, row, signals, service, cancel, placeholder)
+                      for rpath, npath, row in jobs]:
+                start_worker(w)
 
             if loaded_count > 0:
                 print(f"[GRID] Queued {loaded_count} new thumbnail workers")
@@ -804,6 +1531,38 @@ class ThumbnailGridQt(QWidget):
             import traceback
             traceback.print_exc()
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._deferred_visible_request:
+            self._deferred_visible_request = False
+            self._schedule_visible_request()
+
+    def _get_placeholder(self, height: int = None) -> QPixmap:
+        """Shared square placeholder for the given (default: base) thumbnail height."""
+        h = max(1, int(height or self.thumb_height))
+        return make_placeholder_pixmap(QSize(h, h))
+
+    def _readahead_lookahead_paths(self, start: int, end: int, scroll_value: int) -> list:
+        """Real paths of the not-yet-scheduled rows just past [start, end] in the scroll direction."""
+        count = self._prefetch_radius * _READAHEAD_LOOKAHEAD_PAGES
+        if count <= 0:
+            return []
+        if scroll_value < self._rv_last_scroll:
+            rows = range(start - 1, max(-1, start - 1 - count), -1)
+        else:
+            rows = range(end + 1, min(self.model.rowCount(), end + 1 + count))
+
+        _npaths, row_rpath, row_scheduled = self.model.scheduling_columns()
+        paths = []
+        for row in rows:
+            # Scheduled rows already have (or are decoding) their thumbnail
+            if row_scheduled[row]:
+                continue
+            rpath = row_rpath[row]
+            if rpath and not is_video_file(rpath):
+                paths.append(rpath)
+        return paths
+
     def event(self, ev):
         if ev.type() == QEvent.Gesture:
             gesture = ev.gesture(Qt.PinchGesture)
@@ -830,11 +1589,11 @@ class ThumbnailGridQt(QWidget):
         s = (val or "").strip()
 
         # Year
-        if re.fullmatch(r"\d{4}", s):
+        if _RE_YEAR.fullmatch(s):
             return s
 
         # Year-Month (allow 1 or 2 digits for month)
-        m = re.match(r"^(\d{4})-(\d{1,2})$", s)
+        m = _RE_YM.fullmatch(s)
         if m:
             y, mo = m.groups()
             try:
@@ -846,7 +1605,7 @@ class ThumbnailGridQt(QWidget):
             return None
 
         # Day
-        if re.fullmatch(r"\d{4}-\d{2}-\d{2}", s):
+        if _RE_YMD.fullmatch(s):
             return s
 
         return None
@@ -860,7 +1619,6 @@ class ThumbnailGridQt(QWidget):
             paths: List of file paths to display
             content_type: "auto" (detect from paths), "photos", or "videos"
         """
-        import os
 
         # Auto-detect content type if not specified
         if content_type == "auto" and paths:
@@ -882,29 +1640,25 @@ class ThumbnailGridQt(QWidget):
         self.current_folder_id = None
         self.date_key = None
         
-        def norm(p):
-            return os.path.normcase(os.path.normpath(p.strip()))
-
-        self.model.clear()
+        self._new_reload_token()
 
         # ✅ normalize paths to match how they're stored in DB
-        self._paths = [norm(p) for p in (paths or [])]
+        self._paths = tuple(_norm_path_cached(p) for p in (paths or []))
 
         # tag map (for overlays) - only for photos
         tag_map = {}
         if content_type != "videos":
             try:
-                tag_map = self.db.get_tags_for_paths(self._paths)
+                tag_map = self._tags_for_listing()
             except Exception as e:
                 print(f"[GRID] Warning: Could not fetch tags: {e}")
 
-        # Use current reload token snapshot so workers can be tied to this load
-        token = self._reload_token
-
+        rows = []
         for i, p in enumerate(self._paths):
-            item = QStandardItem()
+            item = ThumbRow()
             item.setEditable(False)
             item.setData(p, Qt.UserRole)
+            item.setData(p, Qt.UserRole + 6)  # real path (already normalized)
             item.setData(tag_map.get(p, []), Qt.UserRole + 2)  # 🏷️ store tags for paint()
 
             # --- Set placeholder size based on default aspect ratio
@@ -912,13 +1666,12 @@ class ThumbnailGridQt(QWidget):
             item.setData(aspect_ratio, Qt.UserRole + 1)
             item.setSizeHint(self._thumb_size_for_aspect(aspect_ratio))
 
-            self.model.appendRow(item)
-            thumb_h = int(self._thumb_base * self._zoom_factor)
-            # ThumbWorker signature: real_path, norm_path, height, row, signal_obj, cache, reload_token, placeholder
-            worker = ThumbWorker(p, p, thumb_h, i, self.thumb_signal, self._thumb_cache, token, self._placeholder_pixmap)
+            rows.append(item)
 
-            self.thread_pool.start(worker)
+        self.model.set_rows(rows)
 
+        # ⚡ PERFORMANCE: workers only for the visible range (and only once the
+        # grid is actually on screen) instead of one per path up front
         self._apply_zoom_geometry()
         self.list_view.doItemsLayout()
         self.list_view.viewport().update()
@@ -945,29 +1698,81 @@ class ThumbnailGridQt(QWidget):
             return
         reverse = descending
         if field == "filename":
-            self._paths.sort(key=lambda p: str(p).lower(), reverse=reverse)
-        elif field == "date":
-            import os
-            self._paths.sort(key=lambda p: os.path.getmtime(p), reverse=reverse)
-        elif field == "size":
-            import os
-            self._paths.sort(key=lambda p: os.path.getsize(p), reverse=reverse)
-
-        # rebuild
-        self.model.clear()
-        token = self._reload_token
-        for i, p in enumerate(self._paths):
-            item = QStandardItem()
+            self._paths = tuple(sorted(self._paths, key=lambda p: str(p).lower(), reverse=reverse))
+        elif field in ("date", "size"):
+            # PERFORMANCE: one stat() per path up front (sort keys are evaluated once
+            # per element anyway); a missing/unreadable file sorts as 0 instead of
+            # aborting the sort
+            attr = "st_mtime" if field == "date" else "st_size"
+            keys = {}
+            for p in self._paths:
+                try:
+                    keys[p] = getattr(os.stat(p), attr)
+                except OSError:
+                    keys[p] = 0
+            self._paths = tuple(sorted(self._paths, key=keys.__getitem__, reverse=reverse))
+
+        # rebuild (placeholders only; visible rows get workers via the scheduler)
+        self._new_reload_token()
+        try:
+            tag_map = self._tags_for_listing()
+        except Exception as e:
+            print(f"[GRID] Warning: Could not fetch tags: {e}")
+            tag_map = {}
+        rows = []
+        for p in self._paths:
+            item = ThumbRow()
             item.setEditable(False)
-            item.setData(p, Qt.UserRole)
-            item.setSizeHint(QSize(self.thumb_height, self.thumb_height + self.thumb_spacing))
-            self.model.appendRow(item)
-            worker = ThumbWorker(p, self.thumb_height, i, self.thumb_signal, self._thumb_cache, token, self._placeholder_pixmap)
-            self.thread_pool.start(worker)
+            item.setData(self._norm_path(p), Qt.UserRole)
+            item.setData(p, Qt.UserRole + 6)
+            item.setData(tag_map.get(p, []), Qt.UserRole + 2)
+            item.setData(1.5, Qt.UserRole + 1)
+            item.setSizeHint(self._thumb_size_for_aspect(1.5))
+            rows.append(item)
+        self.model.set_rows(rows)
+        self._schedule_visible_request()
+
+
+    def _bulk_warm_cache(self, paths: list, height: int):
+        """Fill the L2 cache for a large listing in worker processes (one run at a time)."""
+        # A run for the previous listing is stale: stop it (its pool drops the queued decodes)
+        self._cancel_bulk_warmup()
+        if len(paths) < _BULK_WARMUP_MIN or not self.settings.get("thumbnail_bulk_warmup", True):
+            return
+        self._bulk_warmup = _BulkWarmupTask(paths, height, _THUMB_RESAMPLE)
+        QThreadPool.globalInstance().start(self._bulk_warmup)
 
+    def _cancel_bulk_warmup(self):
+        if self._bulk_warmup is not None:
+            self._bulk_warmup.cancel()
 
-    def _on_thumb_loaded(self, path: str, pixmap: QPixmap, row: int):
-        """Called asynchronously when a thumbnail has been loaded."""
+    def _reset_visible_range(self):
+        """Forget the last requested range so the next request covers the whole viewport."""
+        self._last_visible = (0, -1)
+
+    def _new_reload_token(self):
+        """Start a new reload generation: queued workers from older ones bail out."""
+        self._reload_token = uuid.uuid4()
+        self._current_reload_token = self._reload_token
+        # PERFORMANCE: abort the old generation's workers instead of letting them
+        # decode results that _on_thumb_loaded would only discard: queued ones are
+        # removed from the pool, running ones stop at their next stage check
+        self.thread_pool.clear()
+        self._active_cancel.set()
+        self._active_cancel = threading.Event()
+        self._cancel_bulk_warmup()
+        self._inflight.clear()
+        self._pending_thumbs.clear()
+        self._scroll_history.clear()
+        return self._reload_token
+
+    def _on_thumb_preview(self, path: str, pixmap, row: int):
+        self._on_thumb_loaded(path, pixmap, row, final=False)
+
+    def _on_thumb_loaded(self, path: str, pixmap, row: int, final: bool = True):
+        """Called asynchronously when a thumbnail has been loaded (pixmap: QPixmap or QImage)."""
+        if final:
+            self._inflight.discard(path)
         # --- Token safety check ---
         if getattr(self, "_current_reload_token", None) != self._reload_token:
             print(f"[GRID] Discarded stale thumbnail: {path}")
@@ -993,13 +1798,8 @@ class ThumbnailGridQt(QWidget):
         # path here is ALWAYS normalized; match by key
         item = self.model.item(row) if (0 <= row < self.model.rowCount()) else None
         if (not item) or (item.data(Qt.UserRole) != path):
-            item = None
-            for r in range(self.model.rowCount()):
-                it = self.model.item(r)
-                if it and it.data(Qt.UserRole) == path:
-                    item = it
-                    row = r
-                    break
+            row = self.model.row_for_key(path)
+            item = self.model.item(row)
         if not item:
             return
 
@@ -1007,42 +1807,58 @@ class ThumbnailGridQt(QWidget):
         if pixmap is None or pixmap.isNull():
 #            pm = load_thumbnail_safe(
 #                path, int(self._thumb_base * self._zoom_factor),
-#                self._thumb_cache, self._decode_timeout, self._placeholder_pixmap
+#                self._thumb_cache, self._decode_timeout, self._get_placeholder()
 #            )
 
             real_path = item.data(Qt.UserRole + 6) or path
             pm = load_thumbnail_safe(real_path,
-                                     int(self._thumb_base * self._zoom_factor),
-                                     self._thumb_cache, self._decode_timeout, self._placeholder_pixmap)
+                                     self._thumb_h_cached,
+                                     self._thumb_cache, self._decode_timeout, self._get_placeholder())
 
         else:
+            # QPixmap, or a worker-decoded QImage converted at flush time
             pm = pixmap
 
-        # 🧮 Update metadata and UI
-        aspect_ratio = pm.width() / pm.height() if pm and pm.height() > 0 else 1.5
-        item.setData(aspect_ratio, Qt.UserRole + 1)
-        item.setSizeHint(self._thumb_size_for_aspect(aspect_ratio))
-        item.setIcon(QIcon(pm))
-        
-        item.setData(False, Qt.UserRole + 5)   # allow future requeue   
-        
         # allow future rescheduling after zoom/scroll
         item.setData(False, Qt.UserRole + 5)
 
         # NOTE: ThumbnailService handles all cache updates internally
         # No need to manually update memory cache here
 
-        # ✅ Redraw the updated thumbnail cell
-        try:
-            rect = self.list_view.visualRect(self.model.indexFromItem(item))
-            self.list_view.viewport().update(rect)
-        except Exception:
-            self.list_view.viewport().update()
+        # 🧮 Queue metadata/icon update; a later result for the same row (final
+        # after preview) simply replaces the queued one - and a replaced preview
+        # image is never converted to a pixmap at all
+        self._pending_thumbs[row] = (path, pm)
+        if not self._thumb_flush_timer.isActive():
+            self._thumb_flush_timer.start()
+
+    def _flush_thumb_updates(self):
+        """Apply queued thumbnails and repaint them with one dataChanged range."""
+        pending, self._pending_thumbs = self._pending_thumbs, {}
+        updates = {}
+        for row, (path, pm) in pending.items():
+            # the model may have been cleared/rebuilt since the result was queued
+            if self.model.row_data(row, Qt.UserRole) != path:
+                continue
+            if isinstance(pm, QImage):
+                # Worker-decoded image: the one raster->pixmap conversion, on the GUI thread
+                pm = QPixmap.fromImage(pm)
+            aspect_ratio = pm.width() / pm.height() if pm and pm.height() > 0 else 1.5
+            # PERFORMANCE: keep the cell size when the aspect ratio is within 1% of
+            # the stored one (final after preview, placeholder guess was right) so
+            # the view repaints the cell without relayouting the grid
+            old_ar = self.model.row_data(row, Qt.UserRole + 1) or 1.5
+            if abs(aspect_ratio - old_ar) <= 0.01 * old_ar:
+                updates[row] = (pm, None, None)
+            else:
+                updates[row] = (pm, aspect_ratio, self._thumb_size_for_aspect(aspect_ratio))
+        if updates:
+            self.model.set_thumbnails(updates)
 
 
     def clear(self):
         self.model.clear()
-        self._paths.clear()
+        self._paths = ()
         self.branch_key = None
 
 
@@ -1059,22 +1875,13 @@ class ThumbnailGridQt(QWidget):
         if not paths and idx.isValid():
             paths = [idx.data(Qt.UserRole)]
 
-        db = self.db
-
         # Build dynamic tag info
-        all_tags = []
-        try:
-            if hasattr(db, "get_all_tags"):
-                all_tags = db.get_all_tags()
-        except Exception:
-            pass
+        all_tags = self._cached_all_tags()
 
         # tags present across selection (use TagService for consistency)
         present_map = {}
         try:
-            from services.tag_service import get_tag_service
-            tag_service = get_tag_service()
-            present_map = tag_service.get_tags_for_paths(paths, self.project_id)
+            present_map = self._cached_present_tags(paths)
             print(f"[ContextMenu] Got tags for {len(paths)} path(s): {present_map}")
         except Exception as e:
             print(f"[ContextMenu] Error getting tags: {e}")
@@ -1135,6 +1942,8 @@ class ThumbnailGridQt(QWidget):
         chosen = m.exec(self.list_view.viewport().mapToGlobal(pos))
         if not chosen:
             return
+        # any action below may change tags
+        self._invalidate_tag_caches()
 
         # Actions
         if chosen is act_open:
@@ -1370,6 +2179,66 @@ class ThumbnailGridQt(QWidget):
                 self.reload()
 
 
+    def _cached_all_tags(self) -> list:
+        """db.get_all_tags(), reused for _TAG_CACHE_TTL seconds."""
+        ts, tags = self._all_tags_cache
+        if tags is not None and time.monotonic() - ts < _TAG_CACHE_TTL:
+            return tags
+        tags = []
+        try:
+            if hasattr(self.db, "get_all_tags"):
+                tags = self.db.get_all_tags()
+        except Exception:
+            pass
+        self._all_tags_cache = (time.monotonic(), tags)
+        return tags
+
+    def _cached_present_tags(self, paths: list) -> dict:
+        """TagService.get_tags_for_paths() for this exact selection, reused for _TAG_CACHE_TTL seconds."""
+        key = frozenset(paths)
+        ts, cached_key, present_map = self._present_tags_cache
+        if cached_key == key and time.monotonic() - ts < _TAG_CACHE_TTL:
+            return present_map
+        present_map = get_tag_service().get_tags_for_paths(paths, self.project_id)
+        self._present_tags_cache = (time.monotonic(), key, present_map)
+        return present_map
+
+    def _prefetch_present_tags(self):
+        """Look up the current selection's tags ahead of a context menu."""
+        paths = self.get_selected_paths()
+        if not paths or len(paths) > _TAG_PREFETCH_MAX:
+            return
+        try:
+            self._cached_all_tags()
+            self._cached_present_tags(paths)
+        except Exception as e:
+            print(f"[ContextMenu] Tag prefetch failed: {e}")
+
+    def _invalidate_tag_caches(self):
+        self._all_tags_cache = (0.0, None)
+        self._present_tags_cache = (0.0, None, None)
+        self._tag_map_cache.clear()
+
+    def invalidate_tag_cache(self):
+        """Forget cached tag lookups; call after writing tags outside the grid."""
+        self._invalidate_tag_caches()
+
+    def _tags_for_listing(self) -> dict:
+        """db.get_tags_for_paths(self._paths), memoized per listing (LRU, see _TAG_MAP_CACHE_MAX)."""
+        key = self._paths
+        cache = self._tag_map_cache
+        hit = cache.get(key)
+        now = time.monotonic()
+        if hit is not None and now - hit[0] < _TAG_MAP_CACHE_TTL:
+            cache.move_to_end(key)
+            return hit[1]
+        tag_map = self.db.get_tags_for_paths(self._paths)
+        cache[key] = (now, tag_map)
+        cache.move_to_end(key)
+        while len(cache) > _TAG_MAP_CACHE_MAX:
+            cache.popitem(last=False)
+        return tag_map
+
     def _refresh_tags_for_paths(self, paths: list[str]):
         """
         Refresh tag overlay (Qt.UserRole+2) for given paths only.
@@ -1377,6 +2246,7 @@ class ThumbnailGridQt(QWidget):
 
         ARCHITECTURE: UI Layer → TagService → TagRepository → Database
         """
+        self._invalidate_tag_caches()
         if not paths:
             return
         try:
@@ -1388,17 +2258,18 @@ class ThumbnailGridQt(QWidget):
             print(f"[TagCache] ❌ Failed to fetch tags: {e}")
             return
 
-        # normalize to the same format used in load()
-        updated_count = 0
-        for row in range(self.model.rowCount()):
-            item = self.model.item(row)
-            if not item:
-                continue
-            p = item.data(Qt.UserRole)
-            if p in tags_map:
-                new_tags = tags_map.get(p, [])
-                item.setData(new_tags, Qt.UserRole + 2)
-                updated_count += 1
+        # PERFORMANCE: look the refreshed paths up in the model's path -> row index
+        # instead of reading every row's key, and repaint them with one dataChanged
+        updates = {}
+        for p, new_tags in tags_map.items():
+            row = self.model.row_for_key(p)
+            if row < 0:
+                # _load_paths() keys rows by the normalized path (case-folded on Windows)
+                row = self.model.row_for_key(self._norm_path(p))
+            if row >= 0:
+                updates[row] = new_tags
+        self.model.set_tags(updates)
+        updated_count = len(updates)
 
         if updated_count > 0:
             print(f"[TagCache] Updated {updated_count} items, repaint complete")
@@ -1413,11 +2284,11 @@ class ThumbnailGridQt(QWidget):
         """Initialize zoom state and event handling."""
         self._thumb_base = 120
         self._zoom_factor = 1.0
+        self._thumb_h_cached = int(self._thumb_base * self._zoom_factor)  # kept in step by _set_zoom_factor()
         self._min_zoom = 0.5
         self._max_zoom = 3.0
 
-        from settings_manager_qt import SettingsManager
-        self.settings = SettingsManager()
+        self.settings = _get_settings()
         self._cell_padding = self.settings.get("thumb_padding", 8)
 
         self.list_view.setViewMode(QListView.IconMode)
@@ -1440,16 +2311,16 @@ class ThumbnailGridQt(QWidget):
         Compute size for a given aspect ratio based on current zoom factor.
         Height is fixed, width varies.
         """
-        thumb_h = int(self._thumb_base * self._zoom_factor)
-        if aspect_ratio <= 0:
-            aspect_ratio = 1.5  # fallback default
-        thumb_w = int(thumb_h * aspect_ratio)
-        return QSize(thumb_w, thumb_h)
+        thumb_h = self._thumb_h_cached
+        return QSize(int(thumb_h * (aspect_ratio if aspect_ratio > 0 else 1.5)), thumb_h)
 
     def _set_zoom_factor(self, factor: float):
         """Clamp and apply zoom factor, update all items."""
         factor = max(self._min_zoom, min(self._max_zoom, factor))
         self._zoom_factor = factor
+        self._thumb_h_cached = int(self._thumb_base * factor)
+        self.delegate.clear_scaled_cache()
+        self._reset_visible_range()  # new thumbnail height: every visible row is due again
         self._apply_zoom_geometry()
 
     def _apply_zoom_geometry(self):
@@ -1457,16 +2328,44 @@ class ThumbnailGridQt(QWidget):
         Recalculate grid sizes for all items based on current zoom and
         their stored aspect ratios.
         """
-        for i in range(self.model.rowCount()):
-            idx = self.model.index(i, 0)
-            aspect_ratio = idx.data(Qt.UserRole + 1) or 1.5
-            size = self._thumb_size_for_aspect(aspect_ratio)
-            self.model.setData(idx, size, Qt.SizeHintRole)
+        if self.delegate.zoom_preview_h:
+            # Leave the zoom animation's uniform-cell layout
+            self.delegate.zoom_preview_h = 0
+            self.list_view.setGridSize(QSize())
+            self.list_view.setUniformItemSizes(False)
+        self.model.apply_size_hints(self._thumb_h_cached)
 
         self.list_view.setSpacing(self._cell_padding)
         self.list_view.updateGeometry()
         self.list_view.repaint()
+        self._schedule_visible_request()
+
+
+    def _apply_zoom_preview(self, thumb_h: int):
+        """
+        Show one zoom animation frame at thumb_h.
 
+        PERFORMANCE: The view lays out uniform grid cells, which asks the model
+        for a single size hint instead of one per row, and the delegate draws
+        every thumbnail at thumb_h. Per-row size hints are applied once the
+        animation ends (_finalize_zoom -> _apply_zoom_geometry).
+        """
+        lv = self.list_view
+        if not self.delegate.zoom_preview_h:
+            lv.setUniformItemSizes(True)
+        self.delegate.zoom_preview_h = thumb_h
+        pad = self._cell_padding
+        lv.setGridSize(QSize(int(thumb_h * 1.5) + pad, thumb_h + pad))
+        lv.viewport().update()
+
+    def _sync_zoom_slider(self, factor: float):
+        """Move the zoom slider to factor (inverse mapping) without re-triggering a zoom."""
+        if not hasattr(self, "zoom_slider"):
+            return
+        norm = (factor - self._min_zoom) / (self._max_zoom - self._min_zoom)
+        self.zoom_slider.blockSignals(True)
+        self.zoom_slider.setValue(int(norm * 100))
+        self.zoom_slider.blockSignals(False)
 
     def _animate_zoom_to(self, target_factor: float, duration: int = 200):
         """Smoothly animate zoom factor between current and target value."""
@@ -1476,6 +2375,13 @@ class ThumbnailGridQt(QWidget):
         if hasattr(self, "_zoom_anim") and self._zoom_anim is not None:
             self._zoom_anim.stop()
 
+        if self.model.rowCount() > _ZOOM_ANIM_MAX_ROWS:
+            # Very large grid: every animation frame would relayout all rows
+            self._set_zoom_factor(target_factor)
+            self._sync_zoom_slider(target_factor)
+            self.gridReloaded.emit()
+            return
+
         # PropertyAnimation on a dynamic property
         self.setProperty("_zoom_factor_prop", self._zoom_factor)
         self._zoom_anim = QPropertyAnimation(self, b"_zoom_factor_prop", self)
@@ -1488,19 +2394,24 @@ class ThumbnailGridQt(QWidget):
 #        self._zoom_anim.start()
 
         def _on_zoom_anim_val(val):
-            self._set_zoom_factor(float(val))
-            # sync slider position (inverse mapping)
-            norm = (float(val) - self._min_zoom) / (self._max_zoom - self._min_zoom)
-            self.zoom_slider.blockSignals(True)
-            self.zoom_slider.setValue(int(norm * 100))
-            self.zoom_slider.blockSignals(False)
+            # PERFORMANCE: intermediate frames show a cheap uniform-cell preview;
+            # per-row geometry, cache resets and rescheduling run once in _finalize_zoom
+            self._zoom_factor = max(self._min_zoom, min(self._max_zoom, float(val)))
+            self._thumb_h_cached = int(self._thumb_base * self._zoom_factor)
+            self._apply_zoom_preview(self._thumb_h_cached)
+            self._sync_zoom_slider(float(val))
 
         self._zoom_anim.valueChanged.connect(_on_zoom_anim_val)
+        self._zoom_anim.finished.connect(self._finalize_zoom)
         # Phase 2.3: Emit gridReloaded when zoom animation finishes (for status bar update)
         self._zoom_anim.finished.connect(lambda: self.gridReloaded.emit())
         self._zoom_anim.start()
 
 
+    def _finalize_zoom(self):
+        """Apply the animated zoom factor to the grid (sizes, caches, visible rows)."""
+        self._set_zoom_factor(self._zoom_factor)
+
     def zoom_in(self):
         self._animate_zoom_to(self._zoom_factor * 1.1)
 
@@ -1553,8 +2464,12 @@ class ThumbnailGridQt(QWidget):
         - Space/Enter: Open lightbox
         - Delete: Delete selected
         """
+        # PERFORMANCE: this sees every viewport event (paints, mouse moves), so
+        # read the type once and compare against pre-fetched enum values
+        etype = event.type()
+
         # Ctrl+Wheel zoom (merged from previous eventFilter)
-        if event.type() == QEvent.Wheel and (event.modifiers() & Qt.ControlModifier):
+        if etype == _EV_WHEEL and (event.modifiers() & Qt.ControlModifier):
             delta = event.angleDelta().y()
             if delta > 0:
                 self.zoom_in()
@@ -1562,42 +2477,64 @@ class ThumbnailGridQt(QWidget):
                 self.zoom_out()
             return True
 
-        # Keyboard shortcuts
-        if obj is self.list_view and event.type() == QEvent.KeyPress:
-            key = event.key()
-            mods = event.modifiers()
+        # Viewport resized: a different set of rows may be visible now
+        if etype == _EV_RESIZE and obj is self.list_view.viewport():
+            self._schedule_visible_request()
 
-            # Ctrl+A -> select all
-            if key == Qt.Key_A and (mods & Qt.ControlModifier):
-                self.list_view.selectAll()
-                return True
+        # Keyboard shortcuts: one dict lookup instead of a chain of key tests
+        if etype == _EV_KEYPRESS and obj is self.list_view:
+            key = event.key()
+            handler = self._KEY_HANDLERS.get(key)
+            if handler is not None:
+                handled = getattr(self, handler)(key, event.modifiers())
+                if handled:
+                    return True
 
-            # Esc -> clear selection
-            if key == Qt.Key_Escape:
-                self.list_view.clearSelection()
-                return True
+        return super().eventFilter(obj, event)
 
-            # Delete -> request deletion of selected paths
-            if key in (Qt.Key_Delete, Qt.Key_Backspace):
-                paths = self.get_selected_paths()
-                if paths:
-                    self.deleteRequested.emit(paths)
-                return True
+    # key -> handler(key, mods) for eventFilter(); a handler returns True when it
+    # consumed the key
+    _KEY_HANDLERS = {
+        int(Qt.Key_A): "_key_select_all",
+        int(Qt.Key_Escape): "_key_clear_selection",
+        int(Qt.Key_Delete): "_key_delete",
+        int(Qt.Key_Backspace): "_key_delete",
+        int(Qt.Key_Space): "_key_open",
+        int(Qt.Key_Return): "_key_open",
+        int(Qt.Key_Enter): "_key_open",
+        int(Qt.Key_Up): "_handle_arrow_navigation",
+        int(Qt.Key_Down): "_handle_arrow_navigation",
+        int(Qt.Key_Left): "_handle_arrow_navigation",
+        int(Qt.Key_Right): "_handle_arrow_navigation",
+    }
+
+    def _key_select_all(self, key, mods):
+        # Ctrl+A -> select all
+        if mods & Qt.ControlModifier:
+            self.list_view.selectAll()
+            return True
+        return False
 
-            # Space or Enter -> open lightbox for current/selected item
-            if key in (Qt.Key_Space, Qt.Key_Return, Qt.Key_Enter):
-                current = self.list_view.currentIndex()
-                if current.isValid():
-                    path = current.data(Qt.UserRole)
-                    if path:
-                        self.openRequested.emit(path)
-                return True
+    def _key_clear_selection(self, key, mods):
+        # Esc -> clear selection
+        self.list_view.clearSelection()
+        return True
 
-            # Arrow key navigation (Up/Down/Left/Right)
-            if key in (Qt.Key_Up, Qt.Key_Down, Qt.Key_Left, Qt.Key_Right):
-                return self._handle_arrow_navigation(key, mods)
+    def _key_delete(self, key, mods):
+        # Delete -> request deletion of selected paths
+        paths = self.get_selected_paths()
+        if paths:
+            self.deleteRequested.emit(paths)
+        return True
 
-        return super().eventFilter(obj, event)
+    def _key_open(self, key, mods):
+        # Space or Enter -> open lightbox for current/selected item
+        current = self.list_view.currentIndex()
+        if current.isValid():
+            path = current.data(Qt.UserRole)
+            if path:
+                self.openRequested.emit(path)
+        return True
 
     def _handle_arrow_navigation(self, key, mods):
         """
@@ -1661,6 +2598,7 @@ class ThumbnailGridQt(QWidget):
 
     def set_project(self, project_id: int):
         self.project_id = project_id
+        self._cancel_bulk_warmup()
         self.clear()
 
 
@@ -1728,26 +2666,23 @@ class ThumbnailGridQt(QWidget):
         self.load_mode = "custom"
 
         # Store paths and reload
-        self._paths = list(paths)
+        self._paths = tuple(paths)
         print(f"[GRID] Loading {len(self._paths)} custom paths (e.g., search results)")
 
-        # Clear and reload grid
-        self.model.clear()
-        self._reload_token = uuid.uuid4()  # Generate new UUID token
-        self._current_reload_token = self._reload_token
-        token = self._reload_token
+        token = self._new_reload_token()
 
         # Get tags for all paths
         tag_map = {}
         try:
             if hasattr(self.db, 'get_tags_for_paths'):
-                tag_map = self.db.get_tags_for_paths(self._paths)
+                tag_map = self._tags_for_listing()
         except Exception as e:
             print(f"[GRID] Warning: Could not fetch tags: {e}")
 
         # Load thumbnails
+        rows = []
         for i, p in enumerate(self._paths):
-            item = QStandardItem()
+            item = ThumbRow()
             item.setData(p, Qt.UserRole)  # normalized path
             item.setData(p, Qt.UserRole + 6)  # real path
             item.setData(tag_map.get(p, []), Qt.UserRole + 2)  # tags
@@ -1757,7 +2692,10 @@ class ThumbnailGridQt(QWidget):
             item.setData(aspect_ratio, Qt.UserRole + 1)
             item.setSizeHint(self._thumb_size_for_aspect(aspect_ratio))
 
-            self.model.appendRow(item)
+            rows.append(item)
+
+        # Clear and reload grid in a single model reset
+        self.model.set_rows(rows)
 
         # Trigger thumbnail loading
         self._apply_zoom_geometry()
@@ -1765,8 +2703,7 @@ class ThumbnailGridQt(QWidget):
         self.list_view.viewport().update()
 
         # Request visible thumbnails
-        if hasattr(self, 'request_visible_thumbnails'):
-            QTimer.singleShot(100, self.request_visible_thumbnails)
+        self._schedule_visible_request()
 
         print(f"[GRID] Loaded {len(self._paths)} thumbnails in custom mode")
 
@@ -1781,7 +2718,7 @@ class ThumbnailGridQt(QWidget):
 #        # --- Prevent duplicate reloads ---
         
         self.model.clear()
-        self._paths.clear()
+        self._paths = ()
 
         # ✅ Handle tag overlay mode explicitly
         if getattr(self, "load_mode", None) == "tag":
@@ -1838,35 +2775,36 @@ class ThumbnailGridQt(QWidget):
         else:
             return
 
-        # Normalize to list[str]
-        self._paths = [
+        # Normalize to tuple[str]
+        self._paths = tuple(
             r[0] if isinstance(r, (tuple, list)) else
             r.get("path") if isinstance(r, dict) and "path" in r else
             str(r)
             for r in paths
-        ]
+        )
 
-        tag_map = self.db.get_tags_for_paths(self._paths)
+        tag_map = self._tags_for_listing()
 
-        # --- Build items
-        token = self._reload_token
-        for i, p in enumerate(self._paths):
-            item = QStandardItem()
+        # --- Build items (one model reset; workers only for the visible range)
+        self._new_reload_token()
+        rows = []
+        for p in self._paths:
+            item = ThumbRow()
             item.setEditable(False)
             item.setData(p, Qt.UserRole)
+            item.setData(p, Qt.UserRole + 6)  # real path
             item.setData(tag_map.get(p, []), Qt.UserRole + 2)  # store tags list
             
             # initial placeholder size
             item.setSizeHint(QSize(self.thumb_height * 2, self.thumb_height))
-            self.model.appendRow(item)
-
-            worker = ThumbWorker(p, self.thumb_height, i, self.thumb_signal, self._thumb_cache, token, self._placeholder_pixmap)
-            self.thread_pool.start(worker)
+            rows.append(item)
+        self.model.set_rows(rows)
 
         # --- Trigger UI update
         self._apply_zoom_layout()
         self.list_view.doItemsLayout()
         self.list_view.viewport().update()
+        self._schedule_visible_request()
         print(f"[GRID] Reloaded {len(self._paths)} thumbnails in {self.load_mode}-mode.")
  
     # ============================================================
@@ -1911,9 +2849,7 @@ class ThumbnailGridQt(QWidget):
         try:
             self._reloading = True
 
-            import os
             from PySide6.QtCore import QSize
-            from PySide6.QtGui import QStandardItem
 
             db = self.db
             ctx = getattr(self, "context", {"mode": None, "key": None, "tag_filter": None})
@@ -2040,32 +2976,24 @@ class ThumbnailGridQt(QWidget):
         Build and render thumbnail items from the given path list.
         """
         from PySide6.QtCore import QSize, Qt
-        from PySide6.QtGui import QStandardItem, QPixmap, QIcon
 
 
-        self._reload_token = uuid.uuid4()
-        self._current_reload_token = self._reload_token
+        self._new_reload_token()
 
-        self.model.clear()
-        self._paths = [str(p) for p in paths]
-        tag_map = self.db.get_tags_for_paths(self._paths)
+        self._paths = tuple(str(p) for p in paths)
+        tag_map = self._tags_for_listing()
 
         # 📏 Default aspect ratio for placeholders
         default_aspect = 1.5
         placeholder_size = self._thumb_size_for_aspect(default_aspect)
 
-        # optional placeholder pixmap (scale shared placeholder if needed)
-        placeholder_pix = self._placeholder_pixmap
-        if placeholder_pix.size() != placeholder_size:
-            try:
-                placeholder_pix = self._placeholder_pixmap.scaled(placeholder_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            except Exception:
-                placeholder_pix = QPixmap(placeholder_size)
-                placeholder_pix.fill(Qt.transparent)
+        # shared placeholder pixmap, painted once per size (square, like the scaled one was)
+        placeholder_pix = self._get_placeholder(min(placeholder_size.width(), placeholder_size.height()))
         
         token = self._reload_token
+        rows = []
         for i, p in enumerate(self._paths):
-            item = QStandardItem()
+            item = ThumbRow()
             item.setEditable(False)
 
             # normalize once and keep both
@@ -2169,9 +3097,9 @@ class ThumbnailGridQt(QWidget):
 
             # 🖼 initial placeholder size & icon
             item.setSizeHint(placeholder_size)
-            item.setIcon(QIcon(placeholder_pix))
+            item.setPixmap(placeholder_pix)
 
-            self.model.appendRow(item)
+            rows.append(item)
 
             # ⚡ PERFORMANCE FIX: Don't start workers for all photos upfront!
             # Let request_visible_thumbnails() handle viewport-based loading
@@ -2181,9 +3109,11 @@ class ThumbnailGridQt(QWidget):
             # thumb_h = int(self._thumb_base * self._zoom_factor)
             # np = self._norm_path(p)
             # self.thread_pool.start(
-            #     ThumbWorker(p, np, thumb_h, i, self.thumb_signal, self._thumb_cache, token, placeholder_pix)
+            #     ThumbWorker(p, np, thumb_h, i, self.thumb_signal, self._thumbnail_service, token, placeholder_pix)
             # )
 
+        # PERFORMANCE: one model reset for the whole listing (no per-row rowsInserted)
+        self.model.set_rows(rows)
 
         # 🧭 Apply current zoom layout to placeholder sizes
         self._apply_zoom_geometry()
@@ -2192,7 +3122,10 @@ class ThumbnailGridQt(QWidget):
         print(f"[GRID] Loaded {len(self._paths)} thumbnails.")
 
         # kick the incremental scheduler
-        QTimer.singleShot(0, self.request_visible_thumbnails)
+        self._schedule_visible_request()
+
+        # Cold project/folder: decode the rest in worker processes meanwhile
+        self._bulk_warm_cache(self._paths[_BULK_WARMUP_SKIP:], self._thumb_h_cached)
 
         # === 🔥 Optional next-folder/date prefetch ===
         try:
@@ -2262,7 +3195,7 @@ class ThumbnailGridQt(QWidget):
 
         worker = WarmupWorker(
             next_paths, self._thumb_base, self._zoom_factor,
-            self._thumb_cache, self._decode_timeout, self._placeholder_pixmap
+            self._thumb_cache, self._decode_timeout, self._get_placeholder()
         )
         self.thread_pool.start(worker)
 
@@ -2273,84 +3206,83 @@ class ThumbnailGridQt(QWidget):
         and dynamic placeholder sizing (fixed height, variable width).
         """
         from PySide6.QtCore import QSize, Qt
-        from PySide6.QtGui import QStandardItem, QPixmap, QIcon, QPainter, QColor, QFont
-        import os
+        from PySide6.QtGui import QPixmap, QPainter, QColor, QFont
 
-        self.model.clear()
-        self._paths = [str(p) for p in paths]
-        tag_map = self.db.get_tags_for_paths(self._paths)
+        self._paths = tuple(str(p) for p in paths)
+        tag_map = self._tags_for_listing()
 
         default_aspect = 1.5
         placeholder_size = self._thumb_size_for_aspect(default_aspect)
-        placeholder_pix = self._placeholder_pixmap
-        if placeholder_pix.size() != placeholder_size:
-            try:
-                placeholder_pix = self._placeholder_pixmap.scaled(placeholder_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-            except Exception:
-                placeholder_pix = QPixmap(placeholder_size)
-                placeholder_pix.fill(Qt.transparent)
+        placeholder_pix = self._get_placeholder(min(placeholder_size.width(), placeholder_size.height()))
 
         active_tag = self.context.get("tag_filter") if isinstance(self.context, dict) else None
 
+        # --- Tag badge overlay on placeholder
+        # PERFORMANCE: The badge only depends on the active tag, so paint it once
+        # (on a raster-native QImage) and share the icon across all items
+        badge_img = placeholder_pix.toImage().convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        if active_tag:
+            painter = QPainter(badge_img)
+            painter.setRenderHint(QPainter.Antialiasing)
+            badge_color = QColor(255, 215, 0, 180)
+            badge_icon = "⭐"
+
+            if "face" in active_tag.lower():
+                badge_color = QColor(70, 130, 180, 180)
+                badge_icon = "🧍"
+            elif "fav" in active_tag.lower():
+                badge_color = QColor(255, 215, 0, 180)
+                badge_icon = "⭐"
+            else:
+                badge_color = QColor(144, 238, 144, 180)
+                badge_icon = "🏷"
+
+            r = 22
+            painter.setBrush(badge_color)
+            painter.setPen(Qt.NoPen)
+            painter.drawEllipse(
+                placeholder_pix.width() - r - 6,
+                placeholder_pix.height() - r - 6,
+                r, r
+            )
+
+            font = QFont("Segoe UI Emoji", 14, QFont.Bold)
+            painter.setFont(font)
+            painter.setPen(Qt.white)
+            painter.drawText(
+                QRect(placeholder_pix.width() - r - 6, placeholder_pix.height() - r - 6, r, r),
+                Qt.AlignCenter, badge_icon
+            )
+            painter.end()
+
+        placeholder_badge = QPixmap.fromImage(badge_img)
+
         token = self._reload_token
+        rows = []
         for i, p in enumerate(self._paths):
-            item = QStandardItem()
+            item = ThumbRow()
             item.setEditable(False)
             item.setData(p, Qt.UserRole)
             item.setData(tag_map.get(p, []), Qt.UserRole + 2)
             item.setData(default_aspect, Qt.UserRole + 1)
 
-            # --- Tag badge overlay on placeholder
-            pix_with_badge = QPixmap(placeholder_pix)
-            if active_tag:
-                painter = QPainter(pix_with_badge)
-                painter.setRenderHint(QPainter.Antialiasing)
-                badge_color = QColor(255, 215, 0, 180)
-                badge_icon = "⭐"
-
-                if "face" in active_tag.lower():
-                    badge_color = QColor(70, 130, 180, 180)
-                    badge_icon = "🧍"
-                elif "fav" in active_tag.lower():
-                    badge_color = QColor(255, 215, 0, 180)
-                    badge_icon = "⭐"
-                else:
-                    badge_color = QColor(144, 238, 144, 180)
-                    badge_icon = "🏷"
-
-                r = 22
-                painter.setBrush(badge_color)
-                painter.setPen(Qt.NoPen)
-                painter.drawEllipse(
-                    placeholder_pix.width() - r - 6,
-                    placeholder_pix.height() - r - 6,
-                    r, r
-                )
-
-                font = QFont("Segoe UI Emoji", 14, QFont.Bold)
-                painter.setFont(font)
-                painter.setPen(Qt.white)
-                painter.drawText(
-                    QRect(placeholder_pix.width() - r - 6, placeholder_pix.height() - r - 6, r, r),
-                    Qt.AlignCenter, badge_icon
-                )
-                painter.end()
-
-            item.setIcon(QIcon(pix_with_badge))
+            item.setPixmap(placeholder_badge)
             item.setSizeHint(placeholder_size)
-            self.model.appendRow(item)
+            rows.append(item)
 
             # ⚡ PERFORMANCE FIX: Don't start workers for all photos upfront!
             # Let request_visible_thumbnails() handle viewport-based loading
             # (Same fix as in _load_paths method)
 
+        self.model.set_rows(rows)
+
         self._apply_zoom_geometry()
         self.list_view.doItemsLayout()
         self.list_view.viewport().update()
         print(f"[GRID] Loaded {len(self._paths)} thumbnails with tag badges.")
 
         # Trigger viewport-based loading
-        QTimer.singleShot(0, self.request_visible_thumbnails)
+        self._schedule_visible_request()
 
     # --- ADD inside class ThumbnailGridQt (near other public helpers) ---
 
@@ -2359,14 +3291,9 @@ class ThumbnailGridQt(QWidget):
         Return the paths that are currently in the view/model, in order.
         This reflects any sorting and filtering that has been applied.
         """
-        out = []
-        for row in range(self.model.rowCount()):
-            item = self.model.item(row)
-            if item:
-                p = item.data(Qt.UserRole)
-                if p:
-                    out.append(p)
-        return out
+        # PERFORMANCE: read the model's key column instead of wrapping every row
+        row_npath, _rpaths, _scheduled = self.model.scheduling_columns()
+        return [p for p in row_npath if p]
 
     def get_all_paths(self) -> list[str]:
         """